@@ -25,9 +25,20 @@ WORD_SEED = ("S", "E", "E", "D")
 WORD_QUIT = ("Q", "U", "I", "T")
 WORD_LOADING = ("L", "O", "A", "D", "I", "N", "G")
 WORD_TIME = ("T", "I", "M", "E")
+PIECE_HINT_TEXT = ("SS", "BS", "SB", "B", "LB", "L", "T", "Z", "A") #Indexed by pieceID
 
 FPS = 60
 
+#Seconds the solver may run for before giving up, so a hard grid never freezes the window, within the 3 second loading screen minimum
+LOADING_SCREEN_SOLVE_TIME = 2.9
+#Seconds of every frame the loading screen solver may use, so rendering carries on at FPS while it enumerates every solution
+LOADING_SCREEN_SOLVE_TIME_PER_FRAME = 0.006
+#Nodes expanded between checks of the frame's solve time, roughly 1 ms of search
+LOADING_SCREEN_NODES_PER_STEP = 500
+HINT_SOLVE_TIME = 1.0
+#Hints kept by board, so returning to an earlier board answers H without a search
+HINT_CACHE_SIZE = 256
+
 #COLOURS
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -45,11 +56,13 @@ ORANGE = (255, 95, 31)
 NAVY_BLUE = (0, 0, 128)
 BRIGHT_BLUE = (0, 150, 255)
 VIOLET = (183, 92, 255)
+MAGENTA = (255, 0, 255)
 
 HOVERED = GREEN_LIME
 DEFAULT = GREEN
 ACTIVE = DARK_GREEN
 ERROR = ORANGE_RED
+DEAD_REGION = MAGENTA #No piece uses it, so a dead gap never looks like a placed piece
 
 """ 
 Default values for the look up table for each default pieces coordinates
@@ -692,14 +705,7 @@ def isSeedValid(seed: str) -> bool:
     Returns:
         BOOL
     """
-    if (seed is None or not isinstance(seed, str) or not ggs.re.match(r'^([A-F][1-6]){7}$', seed)):
-        return False
-
-    for i in range(0, 14, 2):
-        if seed[i] + seed[i + 1] not in ggs.ALL_DICE[i // 2]:
-            return False 
-    
-    return True
+    return ggs.getSeedNumber(seed) is not None
 
 def drawDieFaces(surface: pygame.Surface, allSquares: list[list[tuple[int, int]]], seed: str, validDieFaces: list[tuple[bool, int]]) -> None: 
     """ 
@@ -1074,12 +1080,34 @@ def drawPieceHover(piece: dict, pieceCoordinates: dict[int, tuple[int, int]], gr
     copyGrid = deepcopy(grid)
     copyPieceCoordinates = deepcopy(pieceCoordinates)
     copyPiece = deepcopy(piece)
+    hoverSnapshot = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates).withMove(piece["ID"], piece["hoverConfig"], x, y) #Moved off its old squares if already placed
     copyGrid, copyPieceCoordinates = ggs.placePieceOnGrid(copyGrid, copyPieceCoordinates, copyPiece["ID"], x, y, copyPiece["hoverConfig"])
     copyPiece["isPlaced"] = True
     copyPiece["isHovered"] = True
     copyPiece["isSelected"] = False
+    drawDeadRegions(screen, allSquares, hoverSnapshot) #Regions the hovered placement would leave unfillable
     drawPiece(copyPiece, copyPieceCoordinates)
 
+def drawDeadRegions(surface: pygame.Surface, allSquares: list[list[tuple[int, int]]], snapshot: ggs.BoardSnapshot) -> None: 
+    """ 
+    Marks the empty squares of the player grid in regions the unused pieces cannot fill with a cross, cheap enough to run every frame
+
+    Parameters:
+        pygame.Surface surface
+        LIST<LIST<TUPLE<INT, INT>>> allSquares
+        ggs.BoardSnapshot snapshot : Board to check, i.e. with a hovered piece placed
+        
+    Returns:
+        None
+    """
+    deadRegionMask = ggs.getDeadRegionMask(snapshot.board, snapshot.unusedPiecesMask)
+    while deadRegionMask:
+        squareIndex = (deadRegionMask & -deadRegionMask).bit_length() - 1
+        deadRegionMask &= deadRegionMask - 1
+        x = squareIndex % ggs.GRID_SIZE
+        y = squareIndex // ggs.GRID_SIZE
+        renderTextInSquare(surface, "X", font, DEAD_REGION, allSquares[x + 1][1][0], allSquares[0][y + 2][1], SQUARE_SIZE)
+
 def drawPieceAI(piece: dict, pieceCoordinates: dict[int, tuple[int, int]]) -> None: 
     """ 
     Draws a piece for the AIs grid
@@ -1180,8 +1208,10 @@ def handlePieceInteraction(grid: list[list[int, int]], pieceCoordinates: dict[in
             
             copyGrid = deepcopy(grid)
             copyGrid = ggs.removePieceFromGrid(copyGrid, pieceCoordinates, piece["ID"])  
+            copyPieceCoordinates = deepcopy(pieceCoordinates)
+            copyPieceCoordinates[piece["ID"]] = None #Hover from a board without the piece, so it is not counted twice
             if ggs.isMoveValid(copyGrid, piece["ID"], xPlayerGrid, yPlayerGrid, piece["hoverConfig"]): #Hover Piece when already placed
-                drawPieceHover(piece, pieceCoordinates, grid, xPlayerGrid, yPlayerGrid)            
+                drawPieceHover(piece, copyPieceCoordinates, copyGrid, xPlayerGrid, yPlayerGrid)            
             
             if stateLeftClick and ggs.isMoveValid(copyGrid, piece["ID"], xPlayerGrid, yPlayerGrid, piece["hoverConfig"]):
                 #Place piece when already placed          
@@ -1226,93 +1256,226 @@ def convertSeedIntoString(seed: list[tuple[int, int]]) -> str:
     Returns:
         STRING convertedSeed    
     """
-    convertedSeed = ""
-    for i in range(0, 7):
-        match seed[i][1]:
-            case 0:
-                convertedSeed += "A"
-            case 1:
-                convertedSeed += "B"
-            case 2:
-                convertedSeed += "C"
-            case 3:
-                convertedSeed += "D"
-            case 4:
-                convertedSeed += "E"
-            case 5: 
-                convertedSeed += "F"
-        convertedSeed += str(seed[i][0] + 1)
-    
-    return convertedSeed
+    return "".join(ggs.DIE_FACES_BY_COORDINATES[tuple(coordinates)] for coordinates in seed[0:7])
 
-def tryFindSolution(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int]) -> int:
+def tryFindSolution(snapshot: ggs.BoardSnapshot, deadline: float = None, cache: ggs.LRUCache = None, cancelEvent: ggs.threading.Event = None) -> tuple[int]:
     """ 
-    Current:
-    Tries to remove one piece from the board to find a solution, tries all pieces present on the board
-    
-    Not implemented:
-    Should try all pieces present on the board, one at a time. Then if nothing is returned it should try remove all pieces,
-    one at a time, and recursively find a way that leads to a solution. Returning a piece that would have to be removed
-    to approach that solution.
+    Finds the fewest pieces to remove from the board to find a solution, trying every single piece, then every pair and so on.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT TUPLE<INT, INT>> pieceCoordinates
-        LIST<INT> unusedPiecesID
+        ggs.BoardSnapshot snapshot : Not modified, each attempt derives its own snapshot
+        [OPTIONAL] FLOAT deadline : ggs.time.monotonic() value shared by every search
+        [OPTIONAL] ggs.LRUCache cache : Solvability cache of ggs.isCompletable()
+        [OPTIONAL] ggs.threading.Event cancelEvent : Stops every search once set
         
     Returns:
-        INT pieceID     
+        TUPLE<INT> piecesID : None if no set of pieces can be removed, -1 if the deadline passed or the search was cancelled first
     """
-    #Works for one piece removal
-    #Due to time restraints it will not reattempt piece removal
-    hintGrid = deepcopy(grid)
-    hintPieceCoordinates = deepcopy(pieceCoordinates)
-    hintUnusedPieces = deepcopy(unusedPiecesID)   
-    for pieceID in filter(lambda x: x not in unusedPiecesID, ggs.ALL_PIECE_IDS): #Placed pieces
-        hintGrid = ggs.removePieceFromGrid(hintGrid, hintPieceCoordinates, pieceID)
-        hintPieceCoordinates[pieceID] = None
-        hintUnusedPieces.append(pieceID)
-        hintSolution = ggs.findSolution(hintGrid, hintPieceCoordinates, hintUnusedPieces) 
-        
-        if hintSolution:
-            return pieceID
-        else:
-            hintGrid = deepcopy(grid)
-            hintPieceCoordinates = deepcopy(pieceCoordinates)
-            hintUnusedPieces = deepcopy(unusedPiecesID)  
-        
-    return None
+    removedPiecesID = ggs.getMinimumRemovalSet(snapshot, cache, deadline, cancelEvent)
+    if removedPiecesID is None:
+        return -1
+    elif not removedPiecesID: #Blockers alone are unsolvable or nothing needs removing
+        return None
+    return removedPiecesID
             
-def getHint(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int]) -> tuple[int, int]: 
+def getHint(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int], knownSolution: tuple[tuple[int, int, int, int]] = (), cache: ggs.LRUCache = None, solutionIndex: ggs.SolutionIndex = None, cancelEvent: ggs.threading.Event = None) -> tuple[int, int]: 
     """ 
     Gets one of three possible hints based on the current grid configuration.
     There is no solution -> Attempt piece removal
-    There is a solution -> Nothing removed
+    There is a solution -> Next piece to place
+    No search is needed when the placed pieces match a solution from the solution index built by the loading screen,
+    or the known solution from the solution database.
 
     Parameters:
         LIST<LIST<INT, INT>> grid
         DICT<INT TUPLE<INT, INT>> pieceCoordinates
         LIST<INT> unusedPiecesID
+        [OPTIONAL] TUPLE<TUPLE<INT, INT, INT, INT>> knownSolution
+        [OPTIONAL] ggs.LRUCache cache : Kept between hints so repeated presses reuse earlier searches
+        [OPTIONAL] ggs.SolutionIndex solutionIndex : Solutions of the grid, when complete no hint needs to check for a solution
+        [OPTIONAL] ggs.threading.Event cancelEvent : Stops every search once set, see HintWorker
         
     Returns:
         TUPLE<INT, INT> (-1, None): No hint found
-        TUPLE<INT, INT> (0, hint): Piece to remove
-        TUPLE<INT, BOOL> (1, hintSolution): No piece requires removal to acquire solution
+        TUPLE<INT, TUPLE<INT>> (0, hint): Fewest pieces to remove
+        TUPLE<INT, TUPLE<INT, INT, INT, INT>> (1, hint): Next piece, config, x and y to place, empty if every piece is placed
+        TUPLE<INT, INT> (2, None): Gave up after HINT_SOLVE_TIME seconds or cancelled
     """
-    hintGrid = deepcopy(grid)
-    hintPieceCoordinates = deepcopy(pieceCoordinates)
-    hintUnusedPieces = deepcopy(unusedPiecesID)   
-    
-    hintSolution = ggs.findSolution(hintGrid, hintPieceCoordinates, hintUnusedPieces) 
+    snapshot = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates)
+    if solutionIndex is not None:
+        hint = solutionIndex.getNextMove(snapshot)
+        if hint is not None:
+            return (1, hint)
+    if ggs.isPartOfSolution(pieceCoordinates, unusedPiecesID, knownSolution):
+        return (1, next((move for move in knownSolution if move[0] in unusedPiecesID), ()))
+
+    deadline = ggs.time.monotonic() + HINT_SOLVE_TIME
+    if solutionIndex is not None and solutionIndex.isComplete: #Every solution was checked above
+        hintSolution = False
+    else:
+        hintSolution = ggs.isCompletable(snapshot.board, snapshot.unusedPiecesMask, cache, deadline, cancelEvent) 
     
-    if not hintSolution: #Bad Grid, try remove piece
-        hint = tryFindSolution(hintGrid, hintPieceCoordinates, hintUnusedPieces)
+    if hintSolution is None:
+        return (2, None)
+    elif not hintSolution: #Bad Grid, try remove piece
+        hint = tryFindSolution(snapshot, deadline, cache, cancelEvent)
         if hint is None:
             return (-1, None)
+        elif hint == -1:
+            return (2, None)
         else:
             return (0, hint)
-    else: #Pick a piece or square to highlight #TODO Not finished
-        return (1, hintSolution)
+    else: #Solution not indexed, take the next piece from a new one
+        solvedSnapshot = ggs.findSolutionSnapshot(snapshot, deadline=deadline, cancelEvent=cancelEvent)
+        if not solvedSnapshot:
+            return (2, None)
+        unusedPiecesMask = snapshot.unusedPiecesMask
+        if unusedPiecesMask == 0:
+            return (1, ())
+        pieceID = (unusedPiecesMask & -unusedPiecesMask).bit_length() - 1
+        return (1, (pieceID, *solvedSnapshot.placements[pieceID]))
+
+class HintWorker:
+    """ 
+    Computes hints with getHint() on a daemon thread, so pressing H never stalls a frame.
+    Latest request wins: a new request cancels the search in progress and replaces any request not yet started,
+    the result of a superseded request is never returned.
+    Speculative requests are made after every placement, their hints are kept by board so pressing H usually finds the answer ready.
+    Only the worker thread calls getHint(), hence the hint cache is never shared between threads.
+
+    Examples:
+        hintWorker.request(grid, pieceCoordinates, knownSolution, cache, solutionIndex, isSpeculative=True) -> After a placement
+        hintWorker.request(grid, pieceCoordinates, knownSolution, cache, solutionIndex) -> H pressed
+        Every frame: hint = hintWorker.poll() -> None until the hint of the latest non speculative request is ready
+    """
+
+    def __init__(self) -> None:
+        self.condition = ggs.threading.Condition()
+        self.pendingRequest = None #(requestNumber, snapshot, arguments) not yet started by the worker
+        self.runningRequest = None #(requestNumber, snapshot) the worker is running
+        self.requestNumber = 0
+        self.wantedNumber = 0 #Request whose hint poll() returns, 0 if none is wanted
+        self.result = None
+        self.hints = ggs.LRUCache(HINT_CACHE_SIZE) #Finished hints by BoardSnapshot
+        self.cancelEvent = ggs.threading.Event() #Cancels the request the worker is running
+        self.thread = ggs.threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def request(self, grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], knownSolution: tuple[tuple[int, int, int, int]] = (), cache: ggs.LRUCache = None, solutionIndex: ggs.SolutionIndex = None, isSpeculative: bool = False) -> None:
+        """ 
+        Requests a hint for the current grid, superseding every earlier request unless it is for the same board.
+        The grid and pieceCoordinates are copied, so the main loop may keep changing them. The unused pieces are taken from the grid.
+
+        Parameters:
+            LIST<LIST<INT, INT>> grid
+            DICT<INT TUPLE<INT, INT>> pieceCoordinates
+            [OPTIONAL] TUPLE<TUPLE<INT, INT, INT, INT>> knownSolution
+            [OPTIONAL] ggs.LRUCache cache
+            [OPTIONAL] ggs.SolutionIndex solutionIndex
+            [OPTIONAL] BOOL isSpeculative : The hint is only cached, poll() does not return it
+            
+        Returns:
+            None
+        """
+        snapshot = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates)
+        with self.condition:
+            hint = self.hints.get(snapshot)
+            if hint is not None: #Already computed
+                if not isSpeculative:
+                    self.result = hint
+                    self.wantedNumber = 0
+                return
+
+            runningRequest = self.runningRequest if not self.cancelEvent.is_set() else None #A cancelled run stores no hint, queue a new one
+            for request in (self.pendingRequest, runningRequest):
+                if request is not None and request[1] == snapshot: #Already being computed, keep it running
+                    self.wantedNumber = 0 if isSpeculative else request[0]
+                    return
+
+            self.requestNumber += 1
+            arguments = (snapshot.getGrid(), snapshot.getPieceCoordinates(), ggs.getPiecesID(snapshot.unusedPiecesMask), knownSolution, cache, solutionIndex)
+            self.pendingRequest = (self.requestNumber, snapshot, arguments)
+            self.wantedNumber = 0 if isSpeculative else self.requestNumber
+            self.cancelEvent.set()
+            self.condition.notify()
+
+    def cancel(self) -> None:
+        """ 
+        Drops every request and cached hint, i.e. when a new game starts.
+
+        Parameters:
+            None
+            
+        Returns:
+            None
+        """
+        with self.condition:
+            self.requestNumber += 1
+            self.wantedNumber = 0
+            self.pendingRequest = None
+            self.runningRequest = None #Never attach a request to a run of the previous game
+            self.result = None
+            self.hints = ggs.LRUCache(HINT_CACHE_SIZE)
+            self.cancelEvent.set()
+
+    def isPending(self) -> bool:
+        """ 
+        Returns whether the latest non speculative request has no result yet.
+
+        Parameters:
+            None
+            
+        Returns:
+            BOOL
+        """
+        with self.condition:
+            return self.wantedNumber != 0
+
+    def poll(self) -> tuple[int, int]:
+        """ 
+        Returns the hint of the latest non speculative request once, when it is ready.
+
+        Parameters:
+            None
+            
+        Returns:
+            TUPLE<INT, INT> hint : Format of getHint(), None if there is no new hint
+        """
+        with self.condition:
+            hint = self.result
+            self.result = None
+            return hint
+
+    def run(self) -> None:
+        """ 
+        Worker thread loop, runs the latest request until the program exits.
+
+        Parameters:
+            None
+            
+        Returns:
+            None
+        """
+        while True:
+            with self.condition:
+                while self.pendingRequest is None:
+                    self.condition.wait()
+                requestNumber, snapshot, arguments = self.pendingRequest
+                self.pendingRequest = None
+                self.runningRequest = (requestNumber, snapshot)
+                self.cancelEvent = ggs.threading.Event()
+                cancelEvent = self.cancelEvent
+                hints = self.hints
+
+            hint = getHint(*arguments, cancelEvent=cancelEvent)
+
+            with self.condition:
+                self.runningRequest = None
+                if not cancelEvent.is_set() and hint[0] != 2: #Gave up hints may succeed with a new deadline
+                    hints.put(snapshot, hint)
+                if requestNumber == self.wantedNumber:
+                    self.result = hint
+                    self.wantedNumber = 0
 
 if __name__ == "__main__":
     pygame.init()
@@ -1358,6 +1521,14 @@ if __name__ == "__main__":
 
     currentHint = None 
 
+    solutionDatabase = ggs.openSolutionDatabase() #None until built with: python GeniusSquareSolver.py build-database
+    knownSolution = ()
+    aiSolver = None
+    solutionIndex = None #Every solution of the current grid, filled in by the loading screen
+    completableCache = ggs.LRUCache(ggs.DEFAULT_COMPLETABLE_CACHE_SIZE) #Shared by every hint, boards include their blockers so games never clash
+    hintWorker = HintWorker()
+    hintSnapshot = None #Board of the last hint request, speculative or not
+
     """ 
     State machine for the different scenes.
     Note three was not implemented
@@ -1463,6 +1634,14 @@ if __name__ == "__main__":
                             timer = 90
                         case 2:
                             timer = 45 
+
+                    executionStart = pygame.time.get_ticks()
+                    knownSolution = solutionDatabase.getSolution(seed) if solutionDatabase is not None else ()
+                    aiSolver = ggs.IterativeSolver(grid) #Stepped by the loading screen every frame
+                    solutionIndex = ggs.SolutionIndex(ggs.getGridMask(grid))
+                    hintWorker.cancel()
+                    hintSnapshot = None
+                    currentHint = None
                         
             case 1:
                 allSquares = getSquareCoordinates()            
@@ -1472,37 +1651,34 @@ if __name__ == "__main__":
                 drawGameBoardGridLoadingScreen(screen, allSquares)
                 drawGameBoardGridLabelsLoadingScreen(screen, allSquares)
                 drawLoadingScreenBlockers(screen, allSquares, validDieFaces)
-                pygame.display.flip() #Force pygame to update screen 
                 
-                executionStart = pygame.time.get_ticks()
-                aiGrid = deepcopy(grid)
-                aiPieceCoordinates = deepcopy(pieceCoordinates)
-                aiUnusedPiecesID =  deepcopy(unusedPiecesID)
-                solution = ggs.findSolution(aiGrid, aiPieceCoordinates, aiUnusedPiecesID)
-                aiTimeIntervals = [0, 0, 0, 0, 0, 0, 0, 0, timer]
-                aiPiecesPlaced = 0
-                aiUnusedPiecesID = deepcopy(ggs.ALL_PIECE_IDS) #Reset post solution
-                aiAllPieces = deepcopy(allPieces)
-                tempGrid = deepcopy(grid)
-                reversedAiGrid = [row[::-1] for row in tempGrid] #Mirror grid
-                aiGrid = deepcopy(reversedAiGrid)
-
-                reversedAiPieceCoordinates = {}
-                for key, value in aiPieceCoordinates.items():
-                    reversedAiPieceCoordinates[key] = [(len(tempGrid[0]) - 1 - x, y) for x, y in value]
-
-                aiPieceCoordinates = deepcopy(reversedAiPieceCoordinates) #Mirror grid coordinates
-                
-                interval = timer // 9
-                for i in range(0, 8):
-                    aiTimeIntervals[i] = (i * interval) + ggs.random.randint(0, interval - 1)
-
-                executionTime = pygame.time.get_ticks() - executionStart #3 second Loading Screen minimum
-                if executionTime < 3000:
-                    pygame.time.wait(3000 - executionTime)
-
-                currentState = 2
-                startTicks = pygame.time.get_ticks()
+                executionTime = pygame.time.get_ticks() - executionStart
+                isSolverSearching = not solutionIndex.isComplete and executionTime < LOADING_SCREEN_SOLVE_TIME * 1000
+                if isSolverSearching:
+                    frameDeadline = ggs.time.monotonic() + LOADING_SCREEN_SOLVE_TIME_PER_FRAME
+                    while ggs.time.monotonic() < frameDeadline and solutionIndex.addSolutions(aiSolver, LOADING_SCREEN_NODES_PER_STEP) == ggs.ITERATIVE_SOLVER_SEARCHING:
+                        pass
+                elif executionTime >= 3000: #3 second Loading Screen minimum
+                    if not knownSolution and len(solutionIndex) > 0:
+                        knownSolution = solutionIndex.solutions[0]
+                    solution = bool(knownSolution) #False if the solver gave up or the grid has no solution
+                    aiSnapshot = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates).withSolution(knownSolution)
+                    aiTimeIntervals = [0, 0, 0, 0, 0, 0, 0, 0, timer]
+                    aiPiecesPlaced = 0
+                    aiUnusedPiecesID = list(ggs.ALL_PIECE_IDS) if solution else [] #Reset post solution, the AI places nothing if the solver gave up
+                    aiAllPieces = deepcopy(allPieces)
+                    aiGrid = [row[::-1] for row in grid] #Mirror grid
+
+                    aiPieceCoordinates = {}
+                    for key, value in aiSnapshot.getPieceCoordinates().items():
+                        aiPieceCoordinates[key] = [(ggs.GRID_SIZE - 1 - x, y) for x, y in value] if value is not None else None #Mirror grid coordinates
+
+                    interval = timer // 9
+                    for i in range(0, 8):
+                        aiTimeIntervals[i] = (i * interval) + ggs.random.randint(0, interval - 1)
+
+                    currentState = 2
+                    startTicks = pygame.time.get_ticks()
                 
             case 2:
                 allSquares = getSquareCoordinates()
@@ -1515,6 +1691,7 @@ if __name__ == "__main__":
                 elapsedTime = pygame.time.get_ticks() - startTicks
                 remainingTime = max(0, timer - elapsedTime // 1000)  #Convert milliseconds to seconds
                 drawTimer(screen, allSquares, remainingTime)
+                drawDeadRegions(screen, allSquares, ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates))
                 
                 for piece in allPieces.keys():
                     grid, pieceCoordinates, allPieces[piece] = handlePieceInteraction(grid, pieceCoordinates, allPieces[piece], isRotatingPiece, isReflectingPiece, isRemovingPiece, width, height)
@@ -1522,39 +1699,40 @@ if __name__ == "__main__":
                 isRotatingPiece = False 
                 isReflectingPiece = False  
                 
+                boardSnapshot = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates)
+                if boardSnapshot != hintSnapshot: #Pieces moved, precompute the next hint, or redo a pending one for the new board
+                    hintSnapshot = boardSnapshot
+                    hintWorker.request(grid, pieceCoordinates, knownSolution, completableCache, solutionIndex, not hintWorker.isPending())
                 if isRequestingHint:
                     isRequestingHint = False
-                    currentHint = getHint(grid, pieceCoordinates, unusedPiecesID)
+                    hintWorker.request(grid, pieceCoordinates, knownSolution, completableCache, solutionIndex)
+                hint = hintWorker.poll()
+                if hint is not None:
+                    currentHint = hint
                     
-                if currentHint is not None:
+                if hintWorker.isPending(): #Hint still being searched for
+                    drawFilledSquareWithBorder(screen, GREY, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE, SQUARE_SIZE, BORDER_WIDTH) 
+                    renderTextInSquare(screen, "...", font, WHITE, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE)
+                elif currentHint is not None:
                     if currentHint[0] == -1: #No hint
                         drawFilledSquareWithBorder(screen, VIOLET, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE, SQUARE_SIZE, BORDER_WIDTH) 
                         renderTextInSquare(screen, "X", font, WHITE, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE)
                     elif currentHint[0] == 0: #Piece to remove
                         drawFilledSquareWithBorder(screen, GREEN_LIME, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE, SQUARE_SIZE, BORDER_WIDTH)
-                        match currentHint[1]:
-                            case 0:
-                                hintText = "SS"
-                            case 1:
-                                hintText = "BS"
-                            case 2:
-                                hintText = "SB"
-                            case 3:
-                                hintText = "B"
-                            case 4:
-                                hintText = "LB"
-                            case 5:
-                                hintText = "L"
-                            case 6:
-                                hintText = "T"
-                            case 7:
-                                hintText = "Z"
-                            case 8:
-                                hintText = "A"
+                        hintText = PIECE_HINT_TEXT[currentHint[1][0]]
+                        if len(currentHint[1]) > 1: #More pieces to remove
+                            hintText += "+" + str(len(currentHint[1]) - 1)
                         renderTextInSquare(screen, hintText, font, WHITE, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE)
-                    else: #1 TODO Not implemented
+                    elif currentHint[0] == 2: #Solver gave up
                         drawFilledSquareWithBorder(screen, VIOLET, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE, SQUARE_SIZE, BORDER_WIDTH) 
-                        renderTextInSquare(screen, "X", font, WHITE, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE)
+                        renderTextInSquare(screen, "?", font, WHITE, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE)
+                    else: #Next piece to place, marked on the player's grid
+                        drawFilledSquareWithBorder(screen, CYAN, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE, SQUARE_SIZE, BORDER_WIDTH) 
+                        if currentHint[1]:
+                            pieceID, config, x, y = currentHint[1]
+                            renderTextInSquare(screen, PIECE_HINT_TEXT[pieceID], font, WHITE, allSquares[7][8][0], allSquares[7][8][1], SQUARE_SIZE)
+                            for xOffset, yOffset in ggs.PIECE_CONFIGURATION_OFFSETS[pieceID][config]:
+                                renderTextInSquare(screen, "+", font, CYAN, allSquares[x + xOffset + 1][1][0], allSquares[0][y + yOffset + 2][1], SQUARE_SIZE)
                 
                 placedPieces = 0
                 unusedPiecesID = deepcopy(ggs.ALL_PIECE_IDS)
@@ -1591,5 +1769,7 @@ if __name__ == "__main__":
         pygame.display.flip() 
         clock.tick(FPS)
 
+    if solutionDatabase is not None:
+        solutionDatabase.close()
     pygame.quit()
     sys.exit()
\ No newline at end of file
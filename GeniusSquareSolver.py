@@ -4,15 +4,55 @@ This includes functions to:
 -Print a grid
 -Intialize a grid with blockers
 -Generate blockers from a seed
+-Convert seeds to and from seed numbers
 -Validate a move
 -Place a piece
 -Remove a piece
+-Snapshot a grid into an immutable, hashable board state
+-Hold a grid as a compact Board object
 -Solve a grid
+-Generate every solution of a grid
+-Solve a grid a bounded number of nodes at a time, with checkpoints
+-Count the solutions of a grid
+-Check whether a partially filled grid can be completed, with a cache shared between checks
+-Find the empty regions of a grid the unused pieces cannot fill
+-Find the fewest placed pieces to remove so a grid can be completed
+-Index every solution of a grid by piece placement to answer next move hints
+-Build and read the solution database of every seed
+-Rate the difficulty of every seed and pick seeds by difficulty band
+-Solve batches of seeds across processes
+-Check placements against batches of boards with NumPy (optional)
+
+Run as a script to build the solution database or to solve a list of seeds:
+    python GeniusSquareSolver.py build-database
+    python GeniusSquareSolver.py build-difficulty-index
+    python GeniusSquareSolver.py batch seeds.txt > results.jsonl
 """
 
+import argparse
+import json
+import math
+import mmap
+import multiprocessing
+import os
 import random
 import re #match vs match in 3.10+ Python, hence full import
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import nullcontext
 from copy import deepcopy 
+from functools import partial
+from itertools import combinations, islice
+from typing import NamedTuple
+
+try: #Optional, only needed for the batch legality functions
+    import numpy
+except ImportError:
+    numpy = None
 
 """ 
 Grid element IDs
@@ -42,22 +82,120 @@ DICE_SIX   = ("E4", "F4", "E5", "F5", "D5", "E6")
 DICE_SEVEN = ("F1", "F1", "F1", "A6", "A6", "A6")
 ALL_DICE =  [DICE_ONE, DICE_TWO, DICE_THREE, DICE_FOUR, DICE_FIVE, DICE_SIX, DICE_SEVEN]
 
+"""
+Base polyomino shape of each piece as (X, Y) offsets, every configuration of a piece is generated from its shape.
+dict[int, tuple[tuple[int, int]]]
+PIECE_ID: SHAPE
+"""
+PIECE_SHAPES = {
+    SMALL_SQUARE_PIECE_ID: ((0, 0),),                         # x
+    BIG_SQUARE_PIECE_ID: ((0, 0), (1, 0), (0, 1), (1, 1)),    # x x / x x
+    SHORT_BAR_PIECE_ID: ((0, 0), (1, 0)),                     # x x
+    BAR_PIECE_ID: ((0, 0), (1, 0), (2, 0)),                   # x x x
+    LONG_BAR_PIECE_ID: ((0, 0), (1, 0), (2, 0), (3, 0)),      # x x x x
+    L_PIECE_ID: ((1, 0), (1, 1), (1, 2), (0, 2)),             #   x /   x / x x
+    T_PIECE_ID: ((1, 0), (0, 1), (1, 1), (2, 1)),             #   x / x x x
+    Z_PIECE_ID: ((1, 0), (1, 1), (0, 1), (0, 2)),             #   x / x x / x
+    ARROW_PIECE_ID: ((0, 0), (0, 1), (1, 1))                  # x / x x
+}
+
+"""
+Look up table describing every configuration of each piece as (TRANSFORM, ORIGIN).
+TRANSFORM: [0, 3] rotates the shape 90 degrees clockwise TRANSFORM times, [4, 7] reflects the shape in the y axis first.
+ORIGIN: Index of the square of the shape the piece is placed by.
+The numbering of the configurations is relied upon by the GUI for rotating and reflecting pieces.
+dict[int, tuple[tuple[int, int]]]
+PIECE_ID: CONFIG -> (TRANSFORM, ORIGIN)
+"""
+PIECE_ORIENTATIONS = {
+    SMALL_SQUARE_PIECE_ID: ((0, 0),),
+    BIG_SQUARE_PIECE_ID: ((0, 0), (0, 1), (0, 3), (0, 2)),
+    SHORT_BAR_PIECE_ID: ((0, 0), (1, 0), (0, 1), (1, 1)),
+    BAR_PIECE_ID: ((0, 0), (1, 0), (0, 2), (1, 2), (0, 1), (1, 1)),
+    LONG_BAR_PIECE_ID: ((0, 0), (1, 0), (0, 3), (1, 3), (0, 1), (0, 2), (1, 1), (1, 2)),
+    L_PIECE_ID: (
+        (0, 0), (0, 1), (0, 2), (0, 3),
+        (1, 3), (1, 2), (1, 1), (1, 0),
+        (2, 3), (2, 2), (2, 1), (2, 0),
+        (3, 0), (3, 1), (3, 2), (3, 3),
+        (4, 0), (4, 1), (4, 2), (4, 3),
+        (7, 0), (7, 1), (7, 2), (7, 3),
+        (6, 3), (6, 2), (6, 1), (6, 0),
+        (5, 3), (5, 2), (5, 1), (5, 0)
+    ),
+    T_PIECE_ID: (
+        (0, 0), (0, 1), (0, 2), (0, 3),
+        (1, 1), (1, 2), (1, 3), (1, 0),
+        (2, 3), (2, 2), (2, 1), (2, 0),
+        (3, 3), (3, 0), (3, 2), (3, 1)
+    ),
+    Z_PIECE_ID: (
+        (0, 0), (0, 1), (0, 2), (0, 3),
+        (4, 0), (4, 1), (4, 2), (4, 3),
+        (1, 3), (1, 2), (1, 1), (1, 0),
+        (5, 0), (5, 1), (5, 2), (5, 3)
+    ),
+    ARROW_PIECE_ID: (
+        (0, 0), (0, 1), (0, 2),
+        (1, 2), (1, 1), (1, 0),
+        (2, 2), (2, 1), (2, 0),
+        (3, 0), (3, 1), (3, 2)
+    )
+}
+
+def getTransformedOffset(offset: tuple[int, int], transform: int) -> tuple[int, int]:
+    """
+    Returns an offset after applying a transform, see PIECE_ORIENTATIONS.
+    Note the y axis points down the grid, hence (x, y) -> (-y, x) is a clockwise rotation.
+
+    Parameters:
+        TUPLE<INT, INT> offset
+        INT transform : [0, 7]
+        
+    Returns:
+        TUPLE<INT, INT> offset
+    """
+    x, y = offset
+    if transform >= 4:
+        x = -x
+    for _ in range(0, transform % 4):
+        x, y = -y, x
+    return (x, y)
+
+def getPieceConfigurationOffsets() -> dict[int, list[tuple[tuple[int, int]]]]:
+    """
+    Builds the look up table of the offsets of every square of each configuration from its origin square.
+    The origin square is always the first offset.
+
+    Parameters:
+        None
+        
+    Returns:
+        DICT<INT, LIST<TUPLE<TUPLE<INT, INT>>>> offsets
+    """
+    offsets = {}
+    for pieceID, shape in PIECE_SHAPES.items():
+        offsets[pieceID] = []
+        for transform, origin in PIECE_ORIENTATIONS[pieceID]:
+            squares = [getTransformedOffset(square, transform) for square in shape]
+            xOrigin, yOrigin = squares[origin]
+            squares.insert(0, squares.pop(origin))
+            offsets[pieceID].append(tuple((x - xOrigin, y - yOrigin) for x, y in squares))
+    return offsets
+
+"""
+Look up table for the offsets of every configuration for each piece.
+dict[int, list[tuple[tuple[int, int]]]]
+PIECE_ID: CONFIG -> OFFSETS
+"""
+PIECE_CONFIGURATION_OFFSETS = getPieceConfigurationOffsets()
+
 """
 Look up table for every configuration for each piece.
-dict[int, int]
+dict[int, list[int]]
 PIECE_ID: CONFIG
 """
-PIECE_CONFIGURATIONS = {
-    SMALL_SQUARE_PIECE_ID: [0],
-    BIG_SQUARE_PIECE_ID: [0, 1, 2, 3],
-    SHORT_BAR_PIECE_ID: [0, 1, 2, 3],
-    BAR_PIECE_ID: [0, 1, 2, 3, 4, 5],
-    LONG_BAR_PIECE_ID: [0, 1, 2, 3, 4, 5, 6, 7],
-    L_PIECE_ID: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31],
-    T_PIECE_ID: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
-    Z_PIECE_ID: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
-    ARROW_PIECE_ID: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
-}
+PIECE_CONFIGURATIONS = {pieceID: list(range(0, len(offsets))) for pieceID, offsets in PIECE_CONFIGURATION_OFFSETS.items()}
 
 EMPTY_GRID = [
         [EMPTY_ID, EMPTY_ID, EMPTY_ID, EMPTY_ID, EMPTY_ID, EMPTY_ID],
@@ -70,6 +208,14 @@ EMPTY_GRID = [
 
 ALL_PIECE_IDS = [SMALL_SQUARE_PIECE_ID, BIG_SQUARE_PIECE_ID, SHORT_BAR_PIECE_ID, BAR_PIECE_ID, LONG_BAR_PIECE_ID, L_PIECE_ID, T_PIECE_ID, Z_PIECE_ID, ARROW_PIECE_ID]
 
+"""
+Set of pieces as a mask, bit pieceID is set for every piece in the set.
+PIECE_MASK_ORDER[piecesMask] lists the pieces in the set in ascending order, the order the solvers try them in.
+list[tuple[int]]
+"""
+ALL_PIECES_MASK = (1 << len(ALL_PIECE_IDS)) - 1
+PIECE_MASK_ORDER = [tuple(pieceID for pieceID in ALL_PIECE_IDS if piecesMask >> pieceID & 1) for piecesMask in range(0, ALL_PIECES_MASK + 1)]
+
 """ 
 Default values for the look up table for each pieces coordinates
 dict[int, tuple[int]]
@@ -86,6 +232,123 @@ DEFAULT_PIECE_COORDINATES = {
         ARROW_PIECE_ID: None
 } 
 
+"""
+Solver engines selectable within findSolution()
+GRID_ENGINE: Backtracking over the 2D list representing the grid
+BITBOARD_ENGINE: Backtracking over a 36-bit integer representing the grid, using precomputed placement masks
+DANCING_LINKS_ENGINE: Knuth's Algorithm X over the exact cover matrix of the grid, using dancing links
+"""
+GRID_ENGINE = 0
+BITBOARD_ENGINE = 1
+DANCING_LINKS_ENGINE = 2
+
+"""
+Branching strategies of the bitboard engine
+FIRST_EMPTY_SQUARE_BRANCHING: Fill the first empty square in row-major order
+MOST_CONSTRAINED_SQUARE_BRANCHING: Fill the empty square with the fewest legal placements covering it
+"""
+FIRST_EMPTY_SQUARE_BRANCHING = 0
+MOST_CONSTRAINED_SQUARE_BRANCHING = 1
+
+"""
+Modes for solveDancingLinks()
+DANCING_LINKS_FIRST_SOLUTION: Stop at the first solution
+DANCING_LINKS_COUNT_SOLUTIONS: Count every solution without storing them
+DANCING_LINKS_ALL_SOLUTIONS: Store every solution
+"""
+DANCING_LINKS_FIRST_SOLUTION = 0
+DANCING_LINKS_COUNT_SOLUTIONS = 1
+DANCING_LINKS_ALL_SOLUTIONS = 2
+
+""" 
+Bitboard representation of the grid - bit (y * GRID_SIZE) + x is set when grid[y][x] is not EMPTY_ID
+"""
+GRID_SIZE = 6
+FULL_GRID_MASK = (1 << (GRID_SIZE * GRID_SIZE)) - 1
+FIRST_COLUMN_MASK = sum(1 << (y * GRID_SIZE) for y in range(0, GRID_SIZE))
+LAST_COLUMN_MASK = FIRST_COLUMN_MASK << (GRID_SIZE - 1)
+
+"""
+Status of an IterativeSolver after a call to step()
+ITERATIVE_SOLVER_SEARCHING: The node budget ran out, call step() again to continue
+ITERATIVE_SOLVER_SOLUTION: A solution was found, call step() again to search for the next one
+ITERATIVE_SOLVER_EXHAUSTED: Every solution has been found
+"""
+ITERATIVE_SOLVER_SEARCHING = 0
+ITERATIVE_SOLVER_SOLUTION = 1
+ITERATIVE_SOLVER_EXHAUSTED = 2
+
+"""
+Number of nodes a search expands between checks of its SearchBudget
+"""
+SEARCH_BUDGET_CHECK_INTERVAL = 128
+
+"""
+Command line names of the engines and branching strategies
+"""
+BATCH_ENGINES = {"grid": GRID_ENGINE, "bitboard": BITBOARD_ENGINE, "dancing-links": DANCING_LINKS_ENGINE}
+BATCH_BRANCHINGS = {"first-empty": FIRST_EMPTY_SQUARE_BRANCHING, "most-constrained": MOST_CONSTRAINED_SQUARE_BRANCHING}
+
+"""
+Chunks per worker process read from the input at a time by solveSeeds(), one batch is solved while the next is queued
+"""
+BATCH_CHUNKS_PER_PROCESS = 4
+
+"""
+Default number of (board, unused pieces) states remembered by countSolutions()
+"""
+DEFAULT_SOLUTION_COUNT_CACHE_SIZE = 1 << 16
+
+"""
+Default number of (board, unused pieces) states remembered by isCompletable(), roughly 100 bytes each
+"""
+DEFAULT_COMPLETABLE_CACHE_SIZE = 1 << 16
+
+"""
+Distinct faces of each die in ALL_DICE, every combination of them is a seed numbered in mixed radix with DICE_ONE most significant.
+Seed numbers are split into a high part (dice before SEED_SPLIT_DIE) and a low part (the remaining dice) so every conversion
+is two look ups in tables of at most a few hundred entries.
+"""
+DISTINCT_DICE_FACES = [tuple(dict.fromkeys(die)) for die in ALL_DICE]
+SEED_SPLIT_DIE = 3
+NUMBER_OF_SEEDS = 1
+LOW_SEED_RADIX = 1
+for dieIndex, dieFaces in enumerate(DISTINCT_DICE_FACES):
+    NUMBER_OF_SEEDS *= len(dieFaces)
+    if dieIndex >= SEED_SPLIT_DIE:
+        LOW_SEED_RADIX *= len(dieFaces)
+
+"""
+Solution database - a header followed by one record per seed number.
+Header: magic, version, record size, number of records.
+Record: first solution as config * 36 + square index of every piece in ALL_PIECE_IDS order, solution count, search nodes, average branching.
+The first solution is the one findSolution() finds, search nodes and average branching are counted by BITBOARD_ENGINE with FIRST_EMPTY_SQUARE_BRANCHING.
+"""
+SOLUTION_DATABASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "GeniusSquareSolutions.bin")
+SOLUTION_DATABASE_MAGIC = b"GSDB"
+SOLUTION_DATABASE_VERSION = 2
+SOLUTION_DATABASE_HEADER = struct.Struct("<4sHHI")
+SOLUTION_DATABASE_RECORD = struct.Struct("<9HIIf")
+SOLUTION_DATABASE_NO_PLACEMENT = 0xFFFF
+
+"""
+Difficulty index - a header, the start of every band, the seed numbers sorted by difficulty, then the band and score of every seed number.
+Header: magic, version, number of bands, number of seeds.
+Bands hold equal numbers of seeds, band 0 is the easiest. Scores are computed by getDifficultyScore() from the solution database.
+"""
+DIFFICULTY_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "GeniusSquareDifficulty.bin")
+DIFFICULTY_INDEX_MAGIC = b"GSDI"
+DIFFICULTY_INDEX_VERSION = 1
+DIFFICULTY_INDEX_HEADER = struct.Struct("<4sHHI")
+DEFAULT_DIFFICULTY_BANDS = 5
+
+"""
+Weights of the terms of getDifficultyScore(), each term is the log2 of a count
+"""
+DIFFICULTY_NODE_WEIGHT = 1.0
+DIFFICULTY_BRANCHING_WEIGHT = 0.5
+DIFFICULTY_SOLUTION_WEIGHT = 1.0
+
 def getDieFaceCoordinates(dieFace: str) -> tuple[int, int]:
     """
     Returns the x and y coordinates converted from a given die face.
@@ -126,6 +389,10 @@ def getDiceRolls(seed: str = None) -> list[tuple[int, int]]:
         getDiceRolls() -> Random list of 7 tuples
         getDiceRolls("A1A2C3E1A4E4F1") -> [(0, 0), (1, 0), (2, 2), (0, 4), (3, 0), (3, 4), (0, 5)]
     """   
+    seedNumber = getSeedNumber(seed)
+    if seedNumber is not None:
+        return getBlockersFromSeedNumber(seedNumber)
+
     rolls = []
 
     if seed is None or not isinstance(seed, str) or not re.match(r'^([A-F][1-6]){7}$', seed):
@@ -139,2419 +406,2891 @@ def getDiceRolls(seed: str = None) -> list[tuple[int, int]]:
         rolls.append(roll)
     return rolls
     
-def initaliseBlockers(grid: list[list[int, int]], blockers: list[tuple[int, int]]) -> list[list[int, int]]:
-    """ 
-    Updates the grid with the provided blockers.
-    Note the 2D list representing the grid is accessed via Y followed by X, hence grid[Y][X].
-    getDiceRolls() passes validated blockers as parameter.
+def getSeedTables(dice: list[tuple[str]]) -> tuple[list[str], list[tuple[tuple[int, int]]], list[int], dict[str, int], dict[tuple[tuple[int, int]], int]]:
+    """
+    Builds the conversion tables of every combination of the faces of the given dice, numbered in mixed radix.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        LIST<TUPLE<INT, INT>> blockers
+        LIST<TUPLE<STRING>> dice : Distinct faces of each die
         
     Returns:
-        LIST<LIST<INT, INT>> grid
-    """ 
-    for blocker in blockers:
-        grid[blocker[1]][blocker[0]] = BLOCKER_ID
-    return grid 
+        TUPLE<LIST<STRING> seeds, LIST<TUPLE<TUPLE<INT, INT>>> blockers, LIST<INT> blockerMasks, DICT<STRING, INT> numbersBySeed, DICT<TUPLE<TUPLE<INT, INT>>, INT> numbersByBlockers>
+    """
+    seeds = [""]
+    blockers = [()]
+    for dieFaces in dice:
+        seeds = [seed + dieFace for seed in seeds for dieFace in dieFaces]
+        blockers = [coordinates + (getDieFaceCoordinates(dieFace),) for coordinates in blockers for dieFace in dieFaces]
+    blockerMasks = [sum(1 << (y * GRID_SIZE + x) for x, y in coordinates) for coordinates in blockers]
+    numbersBySeed = {seed: number for number, seed in enumerate(seeds)}
+    numbersByBlockers = {coordinates: number for number, coordinates in enumerate(blockers)}
+    return seeds, blockers, blockerMasks, numbersBySeed, numbersByBlockers
+
+HIGH_SEEDS, HIGH_SEED_BLOCKERS, HIGH_SEED_BLOCKER_MASKS, HIGH_SEED_NUMBERS_BY_SEED, HIGH_SEED_NUMBERS_BY_BLOCKERS = getSeedTables(DISTINCT_DICE_FACES[:SEED_SPLIT_DIE])
+LOW_SEEDS, LOW_SEED_BLOCKERS, LOW_SEED_BLOCKER_MASKS, LOW_SEED_NUMBERS_BY_SEED, LOW_SEED_NUMBERS_BY_BLOCKERS = getSeedTables(DISTINCT_DICE_FACES[SEED_SPLIT_DIE:])
 
-def isMoveValidSmallSquare(grid: list[list[int, int]], x: int, y: int) -> bool: 
-    """ 
-    Validates whether a small square can be placed onto a given grid at the given coordinates
+"""
+Die face of every square of the grid, each square is on exactly one die
+"""
+DIE_FACES_BY_COORDINATES = {getDieFaceCoordinates(dieFace): dieFace for dieFaces in DISTINCT_DICE_FACES for dieFace in dieFaces}
+
+def getSeedNumber(seed: str) -> int:
+    """
+    Returns the number of a given seed, the index of its die faces within DISTINCT_DICE_FACES in mixed radix.
+    Seed numbers fit in 18 bits.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
+        STRING seed : 14 characters in the format XYXY..XY where X->A..F and Y->[1, 6]
+        
     Returns:
-        BOOL
-    """ 
-    """ 
-    0: x
-    """
-    #Check shape within grid
-    if x < 0 or x > 5 or  y < 0 or y > 5:
-        return False 
-    
-    #Check if destination occupied on grid
-    if grid[y][x] != EMPTY_ID:
-        return False
+        INT seedNumber : None if the seed is invalid
     
-    return True    
-
-def placeSmallSquareOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places a small square onto a given grid at the given coordinates
+    Examples:
+        getSeedNumber("A1C3C3E1A4E4F1") -> None
+        getSeedNumber("A1A2C3E1A4E4F1") -> 0
+        getSeedNumber("F3B3D4A5F6E6A6") -> 62207
+    """
+    if not isinstance(seed, str):
+        return None
+    highNumber = HIGH_SEED_NUMBERS_BY_SEED.get(seed[:2 * SEED_SPLIT_DIE])
+    lowNumber = LOW_SEED_NUMBERS_BY_SEED.get(seed[2 * SEED_SPLIT_DIE:])
+    if highNumber is None or lowNumber is None:
+        return None
+    return highNumber * LOW_SEED_RADIX + lowNumber
+
+def getSeedFromNumber(seedNumber: int) -> str:
+    """
+    Returns the seed of a given seed number, inverse of getSeedNumber().
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
+        INT seedNumber : [0, NUMBER_OF_SEEDS)
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
-    """
-    """ 
-    0: x
+        STRING seed : None if the seed number is out of range
     """
-    grid[y][x] = SMALL_SQUARE_PIECE_ID 
-    pieceCoordinates[SMALL_SQUARE_PIECE_ID] = [(x, y)]    
-    return grid, pieceCoordinates
+    if not 0 <= seedNumber < NUMBER_OF_SEEDS:
+        return None
+    highNumber, lowNumber = divmod(seedNumber, LOW_SEED_RADIX)
+    return HIGH_SEEDS[highNumber] + LOW_SEEDS[lowNumber]
 
-def isMoveValidBigSquare(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether a big square can be placed onto a given grid at the given coordinates
+def getSeedNumberFromBlockers(blockers: list[tuple[int, int]]) -> int:
+    """
+    Returns the seed number of a given list of blockers, one per die in ALL_DICE order as returned by getDiceRolls().
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
-    Returns:
-        BOOL
-    """ 
-    """ 
-    0:  x o
-        o o
-    
-    1:  o x
-        o o
+        LIST<TUPLE<INT, INT>> blockers
         
-    2:  o o
-        o x
-
-    3:  o o
-        x o
-    """
-    #Check shape within grid
-    match config:
-        case 0:
-            if x < 0 or x > 4 or y < 0 or y > 4:
-                return False 
-        case 1:
-            if x < 1 or x > 5 or y < 0 or y > 4:
-                return False 
-        case 2:
-            if x < 1 or x > 5 or y < 1 or y > 5:
-                return False 
-        case 3:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False  
+    Returns:
+        INT seedNumber : None if the blockers are not a roll of the dice
+    """
+    blockers = tuple(blockers)
+    highNumber = HIGH_SEED_NUMBERS_BY_BLOCKERS.get(blockers[:SEED_SPLIT_DIE])
+    lowNumber = LOW_SEED_NUMBERS_BY_BLOCKERS.get(blockers[SEED_SPLIT_DIE:])
+    if highNumber is None or lowNumber is None:
+        return None
+    return highNumber * LOW_SEED_RADIX + lowNumber
+
+def getBlockersFromSeedNumber(seedNumber: int) -> list[tuple[int, int]]:
+    """
+    Returns the blockers of a given seed number, the same list getDiceRolls() returns for its seed.
 
-            
-    #Check if destination occupied on grid
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID:
-                return False                    
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-            
-    return True
+    Parameters:
+        INT seedNumber : [0, NUMBER_OF_SEEDS)
+        
+    Returns:
+        LIST<TUPLE<INT, INT>> blockers : None if the seed number is out of range
+    """
+    if not 0 <= seedNumber < NUMBER_OF_SEEDS:
+        return None
+    highNumber, lowNumber = divmod(seedNumber, LOW_SEED_RADIX)
+    return list(HIGH_SEED_BLOCKERS[highNumber] + LOW_SEED_BLOCKERS[lowNumber])
 
-def placeBigSquareOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places a big square onto a given grid at the given coordinates
+def getBlockerMaskFromSeedNumber(seedNumber: int) -> int:
+    """
+    Returns the blockers of a given seed number as a bitboard, see getGridMask().
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+        INT seedNumber : [0, NUMBER_OF_SEEDS)
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        INT blockerMask : None if the seed number is out of range
     """
-    """ 
-    0:  x o
-        o o
-    
-    1:  o x
-        o o
-        
-    2:  o o
-        o x
-
-    3:  o o
-        x o
-    """            
-    match config:
-        case 0:
-            grid[y][x] = BIG_SQUARE_PIECE_ID 
-            grid[y+1][x] = BIG_SQUARE_PIECE_ID 
-            grid[y][x+1] = BIG_SQUARE_PIECE_ID 
-            grid[y+1][x+1] = BIG_SQUARE_PIECE_ID
-            pieceCoordinates[BIG_SQUARE_PIECE_ID] = [(x, y), (x, y+1), (x+1, y), (x+1, y+1)]
-        case 1:
-            grid[y][x] = BIG_SQUARE_PIECE_ID 
-            grid[y][x-1] = BIG_SQUARE_PIECE_ID 
-            grid[y+1][x-1] = BIG_SQUARE_PIECE_ID 
-            grid[y+1][x] = BIG_SQUARE_PIECE_ID
-            pieceCoordinates[BIG_SQUARE_PIECE_ID] = [(x, y), (x-1, y), (x-1, y+1), (x, y+1)]
-        case 2:
-            grid[y][x] = BIG_SQUARE_PIECE_ID 
-            grid[y-1][x] = BIG_SQUARE_PIECE_ID 
-            grid[y][x-1] = BIG_SQUARE_PIECE_ID 
-            grid[y-1][x-1] = BIG_SQUARE_PIECE_ID
-            pieceCoordinates[BIG_SQUARE_PIECE_ID] = [(x, y), (x, y-1), (x-1, y), (x-1, y-1)]
-        case 3:
-            grid[y][x] = BIG_SQUARE_PIECE_ID 
-            grid[y][x-1] = BIG_SQUARE_PIECE_ID 
-            grid[y-1][x] = BIG_SQUARE_PIECE_ID 
-            grid[y-1][x-1] = BIG_SQUARE_PIECE_ID
-            pieceCoordinates[BIG_SQUARE_PIECE_ID] = [(x, y), (x-1, y), (x, y-1), (x-1, y-1)]
-    
-    return grid, pieceCoordinates
- 
-def isMoveValidShortBar(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether a short bar can be placed onto a given grid at the given coordinates
+    if not 0 <= seedNumber < NUMBER_OF_SEEDS:
+        return None
+    highNumber, lowNumber = divmod(seedNumber, LOW_SEED_RADIX)
+    return HIGH_SEED_BLOCKER_MASKS[highNumber] | LOW_SEED_BLOCKER_MASKS[lowNumber]
+
+def getSeedNumbers(seeds: list[str]) -> array:
+    """
+    Bulk version of getSeedNumber().
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
+        ITERABLE<STRING> seeds
+        
     Returns:
-        BOOL
+        ARRAY<INT> seedNumbers : typecode "l", -1 for every invalid seed
     """
-    """ 
-    0:  x o
-    
-    1:  x
-        o
+    highNumbersBySeed = HIGH_SEED_NUMBERS_BY_SEED
+    lowNumbersBySeed = LOW_SEED_NUMBERS_BY_SEED
+    splitIndex = 2 * SEED_SPLIT_DIE
+    seedNumbers = array("l")
+    for seed in seeds:
+        highNumber = highNumbersBySeed.get(seed[:splitIndex], -NUMBER_OF_SEEDS)
+        lowNumber = lowNumbersBySeed.get(seed[splitIndex:], -NUMBER_OF_SEEDS)
+        seedNumbers.append(highNumber * LOW_SEED_RADIX + lowNumber if highNumber >= 0 and lowNumber >= 0 else -1)
+    return seedNumbers
+
+def getSeedsFromNumbers(seedNumbers: array) -> list[str]:
+    """
+    Bulk version of getSeedFromNumber().
+    Raises IndexError if a seed number is out of range.
+
+    Parameters:
+        SEQUENCE<INT> seedNumbers
         
-    2:  o x
-    
-    3:  o
-        x
+    Returns:
+        LIST<STRING> seeds
     """
-    
-    #Check shape within grid
-    match config:
-        case 0:
-            if x < 0 or x > 4 or y < 0 or y > 5:
-                return False
-        case 1:
-            if x < 0 or x > 5 or y < 0 or y > 4:
-                return False
-        case 2:
-            if x < 1 or x > 5 or y < 0 or y > 5:
-                return False
-        case 3:
-            if x < 0 or x > 5 or y < 1 or y > 5:
-                return False
-    
-    #Check if destination occupied on grid
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID:
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID:
-                return False
-            
-    return True
+    if len(seedNumbers) > 0 and (min(seedNumbers) < 0 or max(seedNumbers) >= NUMBER_OF_SEEDS):
+        raise IndexError("Seed number out of range")
+    highSeeds = HIGH_SEEDS
+    lowSeeds = LOW_SEEDS
+    return [highSeeds[seedNumber // LOW_SEED_RADIX] + lowSeeds[seedNumber % LOW_SEED_RADIX] for seedNumber in seedNumbers]
 
-def placeShortBarOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places a short bar onto a given grid at the given coordinates
+def getBlockerMasksFromSeedNumbers(seedNumbers: array) -> array:
+    """
+    Bulk version of getBlockerMaskFromSeedNumber().
+    Raises IndexError if a seed number is out of range.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+        ITERABLE<INT> seedNumbers
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        ARRAY<INT> blockerMasks : typecode "Q"
     """
-    """ 
-    0:  x o
-    
-    1:  x
-        o
-        
-    2:  o x
-    
-    3:  o
-        x
-    """       
-    match config:
-        case 0:
-            grid[y][x] = SHORT_BAR_PIECE_ID
-            grid[y][x+1] = SHORT_BAR_PIECE_ID
-            pieceCoordinates[SHORT_BAR_PIECE_ID] = [(x, y), (x+1, y)]
-        case 1:
-            grid[y][x] = SHORT_BAR_PIECE_ID
-            grid[y+1][x] = SHORT_BAR_PIECE_ID
-            pieceCoordinates[SHORT_BAR_PIECE_ID] = [(x, y), (x, y+1)]
-        case 2:
-            grid[y][x] = SHORT_BAR_PIECE_ID
-            grid[y][x-1] = SHORT_BAR_PIECE_ID
-            pieceCoordinates[SHORT_BAR_PIECE_ID] = [(x, y), (x-1, y)]
-        case 3:
-            grid[y][x] = SHORT_BAR_PIECE_ID
-            grid[y-1][x] = SHORT_BAR_PIECE_ID
-            pieceCoordinates[SHORT_BAR_PIECE_ID] = [(x, y), (x, y-1)]    
-    
-    return grid, pieceCoordinates
+    highMasks = HIGH_SEED_BLOCKER_MASKS
+    lowMasks = LOW_SEED_BLOCKER_MASKS
+    blockerMasks = array("Q")
+    for seedNumber in seedNumbers:
+        if not 0 <= seedNumber < NUMBER_OF_SEEDS:
+            raise IndexError(f"Seed number {seedNumber} out of range")
+        highNumber, lowNumber = divmod(seedNumber, LOW_SEED_RADIX)
+        blockerMasks.append(highMasks[highNumber] | lowMasks[lowNumber])
+    return blockerMasks
 
-def isMoveValidBar(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
+def initaliseBlockers(grid: list[list[int, int]], blockers: list[tuple[int, int]]) -> list[list[int, int]]:
     """ 
-    Validates whether a bar can be placed onto a given grid at the given coordinates
+    Updates the grid with the provided blockers.
+    Note the 2D list representing the grid is accessed via Y followed by X, hence grid[Y][X].
+    getDiceRolls() passes validated blockers as parameter.
 
     Parameters:
         LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
+        LIST<TUPLE<INT, INT>> blockers
+        
     Returns:
-        BOOL
+        LIST<LIST<INT, INT>> grid
     """ 
+    for blocker in blockers:
+        grid[blocker[1]][blocker[0]] = BLOCKER_ID
+    return grid 
+
+def isMoveValid(grid: list[list[int, int]], pieceID: int, x: int, y: int, config: int) -> bool:
     """ 
-    0:  x o o
-        
-    1:  x
-        o
-        o
-    
-    2: o o x
-    
-    3:  o
-        o
-        x
-        
-    4: o x o
+    Returns whether a given pieceID with a given config is able to be placed at a given coordinate on a given grid.
     
-    5: o
-       x
-       o
-    """
-    #Check shape within grid            
-    match config:
-        case 0:
-            if x < 0 or x > 3 or y < 0 or y > 5:
-                return False
-        case 1:
-            if x < 0 or x > 5 or y < 0 or y > 3:
-                return False
-        case 2:
-            if x < 2 or x > 5 or y < 0 or y > 5:
-                return False
-        case 3:
-            if x < 0 or x > 5 or y < 0 or y > 5:
-                return False
-        case 4:
-            if x < 1 or x > 4 or y < 0 or y > 5:
-                return False 
-        case 5:
-            if x < 0 or x > 5 or y < 1 or y > 4:
-                return False
+    Parameters:
+    LIST<LIST<INT, INT>> grid
+    INT pieceID : [0, 8]
+    INT x : [0, 5]
+    INT y : [0, 5]
+    INT config
     
-    #Check if destination occupied on grid
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID:
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID:
-                return False
-        case 4:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x+1] != EMPTY_ID:
-                return False           
-        case 5:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID:
-                return False     
-                 
+    Returns:
+        BOOL
+    """
+    for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]:
+        #Check shape within grid
+        if x + xOffset < 0 or x + xOffset > 5 or y + yOffset < 0 or y + yOffset > 5:
+            return False
+        #Check if destination occupied on grid
+        if grid[y + yOffset][x + xOffset] != EMPTY_ID:
+            return False
     return True
 
-def placeBarOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
+def placePieceOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], pieceID: int, x: int, y: int, config: int) -> list[list[list[int]], dict[int, tuple[int, int]]]: 
     """ 
-    Places a bar onto a given grid at the given coordinates
-
+    Updates the grid by setting the given piece onto the grid..
+    Parameters are validated within functions calling placePieceOnGrid()
+    
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+    LIST<LIST<INT, INT>> grid
+    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+    INT pieceID : [0, 8]
+    INT x : [0, 5]
+    INT y : [0, 5]
+    INT config
+    
     Returns:
         TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
-    """
-    """ 
-    0:  x o o
-        
-    1:  x
-        o
-        o
-    
-    2: o o x
-    
-    3:  o
-        o
-        x
-        
-    4: o x o
-    
-    5: o
-       x
-       o
-    """      
-    match config:
-        case 0:
-            grid[y][x] = BAR_PIECE_ID
-            grid[y][x+1] = BAR_PIECE_ID
-            grid[y][x+2] = BAR_PIECE_ID
-            pieceCoordinates[BAR_PIECE_ID] = [(x, y), (x+1, y), (x+2, y)]
-        case 1:
-            grid[y][x] = BAR_PIECE_ID
-            grid[y+1][x] = BAR_PIECE_ID
-            grid[y+2][x] = BAR_PIECE_ID
-            pieceCoordinates[BAR_PIECE_ID] = [(x, y), (x, y+1), (x, y+2)]
-        case 2:
-            grid[y][x] = BAR_PIECE_ID
-            grid[y][x-1] = BAR_PIECE_ID
-            grid[y][x-2] = BAR_PIECE_ID
-            pieceCoordinates[BAR_PIECE_ID] = [(x, y), (x-1, y), (x-2, y)]
-        case 3:
-            grid[y][x] = BAR_PIECE_ID
-            grid[y-1][x] = BAR_PIECE_ID
-            grid[y-2][x] = BAR_PIECE_ID
-            pieceCoordinates[BAR_PIECE_ID] = [(x, y), (x, y-1), (x, y-2)]
-        case 4:
-            grid[y][x] = BAR_PIECE_ID
-            grid[y][x-1] = BAR_PIECE_ID 
-            grid[y][x+1] = BAR_PIECE_ID
-            pieceCoordinates[BAR_PIECE_ID] = [(x, y), (x-1, y), (x+1, y)]
-        case 5:
-            grid[y][x] = BAR_PIECE_ID
-            grid[y-1][x] = BAR_PIECE_ID 
-            grid[y+1][x] = BAR_PIECE_ID
-            pieceCoordinates[BAR_PIECE_ID] = [(x, y), (x, y-1), (x, y+1)]
-
+    """    
+    coordinates = [(x + xOffset, y + yOffset) for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]]
+    for xSquare, ySquare in coordinates:
+        grid[ySquare][xSquare] = pieceID
+    pieceCoordinates[pieceID] = coordinates
     return grid, pieceCoordinates
- 
-def isMoveValidLongBar(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether a long bar can be placed onto a given grid at the given coordinates
 
+def removePieceFromGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], pieceID: int) -> list[list[int]]:
+    """ 
+    Updates the grid by removing the given piece from the grid.
+    piece is validated within function calling removePieceFromGrid().
+    
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
-    Returns:
-        BOOL
+    LIST<LIST<INT, INT>> grid
+    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+    INT pieceID : [0, 8]
+    
+    Returns:
+        LIST<LIST<INT, INT>> grid
     """
-    """       
-    0:  x o o o
-                
-    1:  x
-        o
-        o
-        o
-        
-    2:  o o o x
-                
-    3:  o
-        o
-        o
-        x
+    for coordinates in pieceCoordinates[pieceID]:
+        grid[coordinates[1]][coordinates[0]] = EMPTY_ID
+    return grid
+                   
+def getPiecePlacement(pieceID: int, coordinates: list[tuple[int, int]]) -> tuple[int, int, int]:
+    """
+    Returns the config and origin a piece was placed with, inverse of placePieceOnGrid().
+
+    Parameters:
+        INT pieceID : [0, 8]
+        LIST<TUPLE<INT, INT>> coordinates : pieceCoordinates[pieceID] of a placed piece
     
-    4: o x o o
+    Returns:
+        TUPLE<INT config, INT x, INT y> : None if the coordinates are not a placement of the piece
+    """
+    if not coordinates:
+        return None
+    x, y = coordinates[0]
+    for config, offsets in enumerate(PIECE_CONFIGURATION_OFFSETS[pieceID]):
+        if len(offsets) == len(coordinates) and all(coordinates[i] == (x + offsetX, y + offsetY) for i, (offsetX, offsetY) in enumerate(offsets)):
+            return config, x, y
+    return None
+
+def printGrid(grid: list[list[int, int]]) -> None:
+    """
+    Prints the terminal representation of the 2D list representing the grid
+
+    Parameters:
+        None
+        
+    Returns:
+        None
+    """    
+    for y in range(0, 6):
+        for x in range(0, 6):
+            if x == 5: #include escape character \n
+                if grid[y][x] == BLOCKER_ID:
+                    print("#") 
+                elif grid[y][x] == EMPTY_ID:
+                    print("~") 
+                else:
+                    print(grid[y][x]) 
+            else:
+                if grid[y][x] == BLOCKER_ID:
+                    print("#", end=" ") 
+                elif grid[y][x] == EMPTY_ID:
+                    print("~", end=" ") 
+                else:
+                    print(grid[y][x], end=" ") 
+    print("")          
     
-    5: o o x o
+def getEmptySquareCoordinates(grid: list[list[int, int]]) -> tuple[int]:
+    """
+    Searches the grid representation for an element with value of EMPTY_ID, if not found returns invalid coordinates
+
+    Parameters:
+        None
+        
+    Returns:
+        TUPLE<INT>
+    """   
+    for y in range(0, len(grid)):
+        for x in range(0, len(grid[0])):
+            if grid[y][x] == EMPTY_ID:
+                return (x, y)
+    return (-1, -1)
+
+def getCanonicalPieceConfigurations() -> dict[int, list[int]]:
+    """
+    Builds the look up table of the configurations of each piece whose origin is the first square of the piece in row-major order.
+    The solver always places a piece by the first empty square, so any other configuration covers an occupied square.
+    Configurations covering the same squares as an earlier configuration are dropped.
+
+    Parameters:
+        None
+        
+    Returns:
+        DICT<INT, LIST<INT>> configurations
+    """
+    configurations = {}
+    for pieceID in ALL_PIECE_IDS:
+        configurations[pieceID] = []
+        seenSquares = set()
+        for config, offsets in enumerate(PIECE_CONFIGURATION_OFFSETS[pieceID]):
+            if min(offsets, key=lambda offset: (offset[1], offset[0])) != (0, 0):
+                continue
+            squares = frozenset(offsets)
+            if squares in seenSquares:
+                continue
+            seenSquares.add(squares)
+            configurations[pieceID].append(config)
+    return configurations
+
+"""
+Look up table for the configurations of each piece tried by the solver at the first empty square.
+dict[int, list[int]]
+PIECE_ID: CONFIG
+"""
+CANONICAL_PIECE_CONFIGURATIONS = getCanonicalPieceConfigurations()
+
+def getBitboardPlacements(configurations: dict[int, list[int]]) -> dict[int, list[list[tuple[int, int]]]]:
+    """
+    Builds the look up table of every placement of the given configurations of every piece on the bitboard.
+    Placements are grouped by the index of the square the origin of the piece is placed on.
+    Only placements lying fully within the grid are included.
+
+    Parameters:
+        DICT<INT, LIST<INT>> configurations
+        
+    Returns:
+        DICT<INT, LIST<LIST<TUPLE<INT config, INT mask>>>> placements
+    """
+    placements = {}
+    for pieceID in ALL_PIECE_IDS:
+        placements[pieceID] = [[] for _ in range(0, GRID_SIZE * GRID_SIZE)]
+        for config in configurations[pieceID]:
+            offsets = PIECE_CONFIGURATION_OFFSETS[pieceID][config]
+            for y in range(0, GRID_SIZE):
+                for x in range(0, GRID_SIZE):
+                    mask = 0
+                    for xOffset, yOffset in offsets:
+                        if x + xOffset < 0 or x + xOffset >= GRID_SIZE or y + yOffset < 0 or y + yOffset >= GRID_SIZE:
+                            break
+                        mask |= 1 << ((y + yOffset) * GRID_SIZE + x + xOffset)
+                    else:
+                        placements[pieceID][y * GRID_SIZE + x].append((config, mask))
+    return placements
+
+""" 
+Look up tables for the placement masks of each piece, indexed by the square of the origin of the piece.
+BITBOARD_PLACEMENTS holds every configuration, CANONICAL_BITBOARD_PLACEMENTS only those in CANONICAL_PIECE_CONFIGURATIONS.
+dict[int, list[list[tuple[int, int]]]]
+PIECE_ID: [SQUARE_INDEX][(CONFIG, MASK)]
+"""
+BITBOARD_PLACEMENTS = getBitboardPlacements(PIECE_CONFIGURATIONS)
+CANONICAL_BITBOARD_PLACEMENTS = getBitboardPlacements(CANONICAL_PIECE_CONFIGURATIONS)
+
+def getPlacementIndex() -> tuple[list[tuple[int, int, int, int]], list[tuple[int]], list[tuple[int]], list[tuple[int]]]:
+    """
+    Builds the look up tables relating every distinct placement on the grid to the squares it covers.
+    PLACEMENT_CONFLICTS holds every placement sharing a square or a piece with a placement, including the placement itself.
+
+    Parameters:
+        None
+        
+    Returns:
+        TUPLE<ALL_PLACEMENTS, PLACEMENT_SQUARES, SQUARE_PLACEMENTS, PLACEMENT_CONFLICTS>
+    """
+    allPlacements = []
+    for pieceID in ALL_PIECE_IDS:
+        for squareIndex in range(0, GRID_SIZE * GRID_SIZE):
+            for config, mask in CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]:
+                allPlacements.append((pieceID, config, squareIndex, mask))
+
+    placementSquares = [tuple(square for square in range(0, GRID_SIZE * GRID_SIZE) if mask >> square & 1) for _, _, _, mask in allPlacements]
+    squarePlacements = [[] for _ in range(0, GRID_SIZE * GRID_SIZE)]
+    for placementIndex, squares in enumerate(placementSquares):
+        for square in squares:
+            squarePlacements[square].append(placementIndex)
+
+    placementConflicts = []
+    for pieceID, _, _, mask in allPlacements:
+        placementConflicts.append(tuple(i for i, placement in enumerate(allPlacements) if placement[0] == pieceID or placement[3] & mask))
+    return allPlacements, placementSquares, [tuple(placements) for placements in squarePlacements], placementConflicts
+
+"""
+Look up tables for the most constrained square branching strategy.
+ALL_PLACEMENTS: list[tuple[int, int, int, int]] -> (PIECE_ID, CONFIG, SQUARE_INDEX, MASK)
+PLACEMENT_SQUARES: PLACEMENT_INDEX -> SQUARE_INDICES
+SQUARE_PLACEMENTS: SQUARE_INDEX -> PLACEMENT_INDICES covering the square
+PLACEMENT_CONFLICTS: PLACEMENT_INDEX -> PLACEMENT_INDICES ruled out once the placement is made
+"""
+ALL_PLACEMENTS, PLACEMENT_SQUARES, SQUARE_PLACEMENTS, PLACEMENT_CONFLICTS = getPlacementIndex()
+
+"""
+ALL_PLACEMENTS as NumPy arrays for the batch legality functions, None when NumPy is not installed.
+NUMPY_PLACEMENT_MASKS: PLACEMENT_INDEX -> MASK
+NUMPY_PLACEMENT_PIECE_IDS: PLACEMENT_INDEX -> PIECE_ID
+NUMPY_PLACEMENT_SQUARES: PLACEMENT_INDEX -> SQUARE_INDEX of the origin
+"""
+NUMPY_PLACEMENT_MASKS = NUMPY_PLACEMENT_PIECE_IDS = NUMPY_PLACEMENT_SQUARES = None
+if numpy is not None:
+    NUMPY_PLACEMENT_MASKS = numpy.array([mask for pieceID, config, squareIndex, mask in ALL_PLACEMENTS], dtype=numpy.uint64)
+    NUMPY_PLACEMENT_PIECE_IDS = numpy.array([pieceID for pieceID, config, squareIndex, mask in ALL_PLACEMENTS], dtype=numpy.uint64)
+    NUMPY_PLACEMENT_SQUARES = numpy.array([squareIndex for pieceID, config, squareIndex, mask in ALL_PLACEMENTS], dtype=numpy.int64)
+
+def getGridMask(grid: list[list[int, int]]) -> int:
+    """
+    Returns the bitboard of a given grid, a bit is set for every square that is not empty.
+
+    Parameters:
+        LIST<LIST<INT, INT>> grid
+        
+    Returns:
+        INT mask
+    """
+    mask = 0
+    for y in range(0, GRID_SIZE):
+        for x in range(0, GRID_SIZE):
+            if grid[y][x] != EMPTY_ID:
+                mask |= 1 << (y * GRID_SIZE + x)
+    return mask
+
+def getPiecesMask(piecesID: list[int]) -> int:
+    """
+    Returns the mask of a given list of pieces.
+
+    Parameters:
+        LIST<INT> piecesID
+        
+    Returns:
+        INT piecesMask : bit pieceID is set for every piece in the list
     
-    6:  o
-        x
-        o
-        o
+    Examples:
+        getPiecesMask([SMALL_SQUARE_PIECE_ID, BIG_SQUARE_PIECE_ID]) -> 3
+    """
+    piecesMask = 0
+    for pieceID in piecesID:
+        piecesMask |= 1 << pieceID
+    return piecesMask
+
+def getPiecesID(piecesMask: int) -> list[int]:
+    """
+    Returns the sorted list of pieces in a given mask, the inverse of getPiecesMask().
+
+    Parameters:
+        INT piecesMask
+        
+    Returns:
+        LIST<INT> piecesID
+    """
+    return list(PIECE_MASK_ORDER[piecesMask])
+
+def checkNumpy() -> None:
+    """
+    Raises ImportError if NumPy, needed by the batch legality functions, is not installed.
+
+    Parameters:
+        None
+        
+    Returns:
+        None
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for batch legality, install it with: pip install numpy")
+
+def getLegalPlacementMatrix(boards, unusedPiecesMasks=None, placementMasks=None, placementPieceIDs=None):
+    """
+    Vectorised isMoveValid() of every placement against a batch of bitboards.
+    The scalar functions remain the way to check a single move, this is for evaluating thousands of boards at once.
+
+    Parameters:
+        NUMPY.NDARRAY<UINT64> boards : Shape (N,), bitboards as from getGridMask()
+        [OPTIONAL] NUMPY.NDARRAY<UINT64> unusedPiecesMasks : Shape (N,), placements of used pieces are illegal, every piece is unused by default
+        [OPTIONAL] NUMPY.NDARRAY<UINT64> placementMasks : Shape (P,), defaults to NUMPY_PLACEMENT_MASKS
+        [OPTIONAL] NUMPY.NDARRAY<UINT64> placementPieceIDs : Shape (P,), pieces of placementMasks, needed with both unusedPiecesMasks and placementMasks
+        
+    Returns:
+        NUMPY.NDARRAY<BOOL> legal : Shape (N, P), legal[n][p] is set when placement p fits on board n
     
-    7:  o
-        o
-        x
-        o     
+    Examples:
+        getLegalPlacementMatrix(getBlockerMasksFromSeedNumbers(range(0, 1000))).sum(axis=1) -> Number of legal placements of each seed
+    """
+    checkNumpy()
+    boards = numpy.asarray(boards, dtype=numpy.uint64)
+    if placementMasks is None:
+        placementMasks, placementPieceIDs = NUMPY_PLACEMENT_MASKS, NUMPY_PLACEMENT_PIECE_IDS
+    legal = (boards[:, None] & numpy.asarray(placementMasks, dtype=numpy.uint64)[None, :]) == 0
+    if unusedPiecesMasks is not None:
+        isPieceUnused = (numpy.asarray(unusedPiecesMasks, dtype=numpy.uint64)[:, None] >> numpy.asarray(placementPieceIDs, dtype=numpy.uint64)[None, :]) & numpy.uint64(1)
+        legal &= isPieceUnused.astype(bool)
+    return legal
+
+def getFirstEmptySquares(boards):
+    """
+    Vectorised index of the first empty square of a batch of bitboards.
+
+    Parameters:
+        NUMPY.NDARRAY<UINT64> boards : Shape (N,)
+        
+    Returns:
+        NUMPY.NDARRAY<INT64> squareIndices : Shape (N,), -1 for full boards
+    """
+    checkNumpy()
+    emptySquares = ~numpy.asarray(boards, dtype=numpy.uint64) & numpy.uint64(FULL_GRID_MASK)
+    lowestBits = emptySquares & (~emptySquares + numpy.uint64(1))
+    isFull = lowestBits == 0
+    squareIndices = numpy.log2(numpy.where(isFull, numpy.uint64(1), lowestBits).astype(numpy.float64)).astype(numpy.int64) #Exact for powers of two below 2**53
+    squareIndices[isFull] = -1
+    return squareIndices
+
+def expandFrontier(boards, unusedPiecesMasks):
     """
+    Expands a batch of search nodes by one level at once, the vectorised equivalent of one level of searchBitboard().
+    Each node branches on its first empty square, every unused piece fitting there gives a child.
+    Nodes are grouped by their first empty square, so only the placements with their origin there are checked.
+
+    Parameters:
+        NUMPY.NDARRAY<UINT64> boards : Shape (N,)
+        NUMPY.NDARRAY<UINT64> unusedPiecesMasks : Shape (N,)
+        
+    Returns:
+        TUPLE<NUMPY.NDARRAY<UINT64> boards, NUMPY.NDARRAY<UINT64> unusedPiecesMasks, NUMPY.NDARRAY<INT64> parents, NUMPY.NDARRAY<INT64> placementIndices>
+        Children in parent order, then ALL_PLACEMENTS order, parents and placementIndices index the input and ALL_PLACEMENTS
     
-    #Check shape within grid
-    match config:
-        case 0:
-            if x < 0 or x > 2 or y < 0 or y > 5:
-                return False
-        case 1:
-            if x < 0 or x > 5 or y < 0 or y > 2:
-                return False
-        case 2:
-            if x < 3 or x > 5 or y < 0 or y > 5:
-                return False
-        case 3:
-            if x < 0 or x > 5 or y < 3 or y > 5:
-                return False
-        case 4:
-            if x < 1 or x > 3 or y < 0 or y > 5:
-                return False
-        case 5:
-            if x < 2 or x > 4 or y < 0 or y > 5:
-                return False
-        case 6:
-            if x < 0 or x > 5 or y < 1 or y > 3:
-                return False
-        case 7:
-            if x < 0 or x > 5 or y < 2 or y > 4:
-                return False
+    Examples:
+        boards, unusedPiecesMasks = numpy.array(getBlockerMasksFromSeedNumbers(range(0, 10))), numpy.full(10, ALL_PIECES_MASK, numpy.uint64)
+        for _ in ALL_PIECE_IDS: boards, unusedPiecesMasks = expandFrontier(boards, unusedPiecesMasks)[:2]
+        len(boards) -> Number of solutions across the 10 seeds
+    """
+    checkNumpy()
+    boards = numpy.asarray(boards, dtype=numpy.uint64)
+    unusedPiecesMasks = numpy.asarray(unusedPiecesMasks, dtype=numpy.uint64)
+    firstEmptySquares = getFirstEmptySquares(boards)
+    allParents = []
+    allPlacementIndices = []
+    for squareIndex in numpy.unique(firstEmptySquares[firstEmptySquares >= 0]):
+        nodes = numpy.nonzero(firstEmptySquares == squareIndex)[0]
+        squarePlacements = numpy.nonzero(NUMPY_PLACEMENT_SQUARES == squareIndex)[0]
+        legal = getLegalPlacementMatrix(boards[nodes], unusedPiecesMasks[nodes], NUMPY_PLACEMENT_MASKS[squarePlacements], NUMPY_PLACEMENT_PIECE_IDS[squarePlacements])
+        nodeIndices, placementIndices = numpy.nonzero(legal)
+        allParents.append(nodes[nodeIndices])
+        allPlacementIndices.append(squarePlacements[placementIndices])
+    if not allParents:
+        allParents.append(numpy.zeros(0, dtype=numpy.int64))
+        allPlacementIndices.append(numpy.zeros(0, dtype=numpy.int64))
+    parents = numpy.concatenate(allParents)
+    placementIndices = numpy.concatenate(allPlacementIndices)
+    order = numpy.lexsort((placementIndices, parents))
+    parents = parents[order]
+    placementIndices = placementIndices[order]
+    childBoards = boards[parents] | NUMPY_PLACEMENT_MASKS[placementIndices]
+    childUnusedPiecesMasks = unusedPiecesMasks[parents] & ~(numpy.uint64(1) << NUMPY_PLACEMENT_PIECE_IDS[placementIndices])
+    return childBoards, childUnusedPiecesMasks, parents, placementIndices
+
+def getPieceSetTables() -> tuple[list[int], list[int], list[int]]:
+    """
+    Builds the look up tables describing every set of pieces, indexed by a mask with bit pieceID set for every piece in the set.
+    Bit n of a subset sum is set when some of the pieces in the set cover exactly n squares.
+
+    Parameters:
+        None
+        
+    Returns:
+        TUPLE<LIST<INT> areas, LIST<INT> smallestSizes, LIST<INT> subsetSums>
+    """
+    areas = [0] * (1 << len(ALL_PIECE_IDS))
+    smallestSizes = [0] * (1 << len(ALL_PIECE_IDS))
+    subsetSums = [1] * (1 << len(ALL_PIECE_IDS))
+    for piecesMask in range(1, 1 << len(ALL_PIECE_IDS)):
+        pieceID = (piecesMask & -piecesMask).bit_length() - 1
+        otherPiecesMask = piecesMask ^ (1 << pieceID)
+        size = len(PIECE_SHAPES[pieceID])
+        areas[piecesMask] = areas[otherPiecesMask] + size
+        smallestSizes[piecesMask] = size if otherPiecesMask == 0 else min(size, smallestSizes[otherPiecesMask])
+        subsetSums[piecesMask] = subsetSums[otherPiecesMask] | (subsetSums[otherPiecesMask] << size)
+    return areas, smallestSizes, subsetSums
+
+"""
+Look up tables for every set of pieces, indexed by the mask of the pieces in the set.
+PIECE_SET_AREAS: Number of squares the pieces cover
+PIECE_SET_SMALLEST_SIZES: Number of squares the smallest piece covers
+PIECE_SET_SUBSET_SUMS: Bit n is set when some of the pieces cover exactly n squares
+"""
+PIECE_SET_AREAS, PIECE_SET_SMALLEST_SIZES, PIECE_SET_SUBSET_SUMS = getPieceSetTables()
+
+def getEmptyRegions(board: int) -> list[int]:
+    """
+    Flood fills the empty squares of a bitboard, returning the mask of every connected region of empty squares.
+
+    Parameters:
+        INT board
+        
+    Returns:
+        LIST<INT> regions
+    """
+    regions = []
+    emptySquares = ~board & FULL_GRID_MASK
+    while emptySquares:
+        region = emptySquares & -emptySquares
+        while True:
+            grownRegion = (region | ((region << 1) & ~FIRST_COLUMN_MASK) | ((region >> 1) & ~LAST_COLUMN_MASK) | (region << GRID_SIZE) | (region >> GRID_SIZE)) & emptySquares
+            if grownRegion == region:
+                break
+            region = grownRegion
+        regions.append(region)
+        emptySquares ^= region
+    return regions
+
+class SolverStatistics:
+    """
+    Opt-in search statistics, filled in by GRID_ENGINE and BITBOARD_ENGINE when passed to findSolution().
+    A move check is one isMoveValid() call, or one placement mask tested by BITBOARD_ENGINE, and is also counted against its piece.
+    BITBOARD_ENGINE counts the masks of a piece when it starts trying the piece, so the masks left untried once a solution is found are included.
+    The time of each node, excluding its children, is added to the depth it was expanded at (number of pieces placed by the search).
+
+    Examples:
+        statistics = SolverStatistics()
+        findSolution(grid, pieceCoordinates, unusedPiecesID, BITBOARD_ENGINE, statistics=statistics)
+        statistics.nodes, statistics.backtracks, statistics.depthTimes
+    """
+
+    def __init__(self) -> None:
+        self.nodes = 0
+        self.moveChecks = 0
+        self.placements = 0
+        self.backtracks = 0
+        self.maxDepth = 0
+        self.depthNodes = [0] * (len(ALL_PIECE_IDS) + 1)
+        self.depthTimes = [0.0] * (len(ALL_PIECE_IDS) + 1)
+        self.pieceAttempts = [0] * len(ALL_PIECE_IDS)
+        self.regionChecks = 0
+        self.smallRegionPrunes = 0
+        self.regionSizePrunes = 0
+        self.interrupted = False
+        self.currentDepth = None #Depth of the node being timed
+        self.currentNodeStart = 0.0
+
+    def enterNode(self, depth: int) -> None:
+        """
+        Counts a node and charges the time since the previous node to the previous node's depth.
+
+        Parameters:
+            INT depth : Number of pieces placed
+            
+        Returns:
+            None
+        """
+        now = time.perf_counter()
+        if self.currentDepth is not None:
+            self.depthTimes[self.currentDepth] += now - self.currentNodeStart
+        self.currentDepth = depth
+        self.currentNodeStart = now
+        self.nodes += 1
+        self.depthNodes[depth] += 1
+        if depth > self.maxDepth:
+            self.maxDepth = depth
+
+    def checkMove(self, pieceID: int, count: int = 1) -> None:
+        """
+        Counts move checks of a given piece.
+
+        Parameters:
+            INT pieceID
+            [OPTIONAL] INT count
+            
+        Returns:
+            None
+        """
+        self.moveChecks += count
+        self.pieceAttempts[pieceID] += count
+
+    def finish(self) -> None:
+        """
+        Charges the time of the last node, call once the search has returned.
+
+        Parameters:
+            None
+            
+        Returns:
+            None
+        """
+        if self.currentDepth is not None:
+            self.depthTimes[self.currentDepth] += time.perf_counter() - self.currentNodeStart
+            self.currentDepth = None
+
+    def toDict(self) -> dict:
+        """
+        Returns the statistics as a JSON serialisable dictionary.
+
+        Parameters:
+            None
+            
+        Returns:
+            DICT statistics
+        """
+        return {
+            "nodes": self.nodes,
+            "moveChecks": self.moveChecks,
+            "placements": self.placements,
+            "backtracks": self.backtracks,
+            "maxDepth": self.maxDepth,
+            "depthNodes": list(self.depthNodes),
+            "depthTimes": list(self.depthTimes),
+            "pieceAttempts": list(self.pieceAttempts),
+            "regionChecks": self.regionChecks,
+            "smallRegionPrunes": self.smallRegionPrunes,
+            "regionSizePrunes": self.regionSizePrunes,
+            "interrupted": self.interrupted
+        }
+
+class SearchInterrupted(Exception):
+    """
+    Raised within a search when its SearchBudget runs out, findSolution() returns None instead of raising it.
+    """
+
+class SearchBudget:
+    """
+    Deadline and/or cancellation token for a search, checked every SEARCH_BUDGET_CHECK_INTERVAL nodes.
+
+    Examples:
+        cancelEvent = threading.Event()
+        findSolution(grid, pieceCoordinates, unusedPiecesID, BITBOARD_ENGINE, deadline=time.monotonic() + 0.5, cancelEvent=cancelEvent)
+        cancelEvent.set() from another thread stops the search
+    """
+
+    def __init__(self, deadline: float = None, cancelEvent: threading.Event = None) -> None:
+        """
+        Parameters:
+            [OPTIONAL] FLOAT deadline : time.monotonic() value
+            [OPTIONAL] threading.Event cancelEvent
+        """
+        self.deadline = deadline
+        self.cancelEvent = cancelEvent
+        self.nodesUntilCheck = 1 #Check on the first node so an expired budget never starts a search
+
+    def isExpired(self) -> bool:
+        """
+        Returns whether the deadline has passed or the search has been cancelled.
+
+        Parameters:
+            None
+            
+        Returns:
+            BOOL
+        """
+        return (self.deadline is not None and time.monotonic() >= self.deadline) or (self.cancelEvent is not None and self.cancelEvent.is_set())
+
+    def checkNode(self) -> None:
+        """
+        Counts a node, raising SearchInterrupted if the budget is checked and has run out.
+
+        Parameters:
+            None
+            
+        Returns:
+            None
+        """
+        self.nodesUntilCheck -= 1
+        if self.nodesUntilCheck == 0:
+            self.nodesUntilCheck = SEARCH_BUDGET_CHECK_INTERVAL
+            if self.isExpired():
+                raise SearchInterrupted()
+
+def isRegionPruned(board: int, unusedPiecesMask: int, statistics: SolverStatistics = None) -> bool:
+    """
+    Returns whether a board can be ruled out by the sizes of its empty regions alone.
+    A region cannot be filled when it is smaller than the smallest unused piece or when no set of unused pieces covers exactly its size.
+    Assumes every empty square has to be covered.
+
+    Parameters:
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        [OPTIONAL] SolverStatistics statistics : Region checks and prunes are counted
+        
+    Returns:
+        BOOL
+    """
+    if statistics is not None:
+        statistics.regionChecks += 1
+    smallestSize = PIECE_SET_SMALLEST_SIZES[unusedPiecesMask]
+    subsetSums = PIECE_SET_SUBSET_SUMS[unusedPiecesMask]
+    for region in getEmptyRegions(board):
+        size = region.bit_count()
+        if size < smallestSize:
+            if statistics is not None:
+                statistics.smallRegionPrunes += 1
+            return True
+        if not subsetSums >> size & 1:
+            if statistics is not None:
+                statistics.regionSizePrunes += 1
+            return True
+    return False
+
+def getDeadRegionMask(board: int, unusedPiecesMask: int) -> int:
+    """
+    Returns the empty squares of a bitboard in regions no set of unused pieces can fill, going by the size of each region alone.
+    Same test as isRegionPruned(), but every dead region is collected instead of stopping at the first.
+
+    Parameters:
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        
+    Returns:
+        INT deadRegionMask : 0 if every region could still be filled
     
-    #Check if destination occupied on grid
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID or grid[y][x+3] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID or grid[y+3][x] != EMPTY_ID:
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID or grid[y][x-3] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID or grid[y-3][x] != EMPTY_ID:
-                return False
-        case 4:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID:
-                return False
-        case 5:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID:
-                return False
-        case 6:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID:
-                return False
-        case 7:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID:
-                return False 
-                
+    Examples:
+        getDeadRegionMask(getGridMask(grid), getPiecesMask(unusedPiecesID)) -> Squares to warn the player about
+    """
+    subsetSums = PIECE_SET_SUBSET_SUMS[unusedPiecesMask]
+    deadRegionMask = 0
+    for region in getEmptyRegions(board):
+        if not subsetSums >> region.bit_count() & 1:
+            deadRegionMask |= region
+    return deadRegionMask
+
+def searchBitboard(board: int, unusedPiecesMask: int, placements: list[tuple[int, int, int]], pruneRegions: bool = False, statistics: SolverStatistics = None, budget: SearchBudget = None) -> bool:
+    """
+    Backtracking search over a bitboard, always filling the first empty square.
+    Placing a piece is a single OR on the board passed to the next level, so nothing has to be undone on backtrack.
+    The placements leading to a solution are appended to placements.
+
+    Parameters:
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        LIST<TUPLE<INT pieceID, INT config, INT squareIndex>> placements
+        [OPTIONAL] BOOL pruneRegions : Rule out boards with empty regions that cannot be filled, see isRegionPruned()
+        [OPTIONAL] SolverStatistics statistics
+        [OPTIONAL] SearchBudget budget : Raises SearchInterrupted once it runs out
+        
+    Returns:
+        BOOL
+    """
+    if statistics is not None:
+        statistics.enterNode(len(placements))
+    if budget is not None:
+        budget.checkNode()
+    if unusedPiecesMask == 0:
+        return True
+    if pruneRegions and isRegionPruned(board, unusedPiecesMask, statistics):
+        return False
+
+    emptySquares = ~board & FULL_GRID_MASK
+    if emptySquares == 0:
+        return False
+    squareIndex = (emptySquares & -emptySquares).bit_length() - 1
+
+    for pieceID in PIECE_MASK_ORDER[unusedPiecesMask]:
+        pieceBit = 1 << pieceID
+        candidates = CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]
+        if statistics is not None:
+            statistics.checkMove(pieceID, len(candidates))
+        for config, mask in candidates:
+            if board & mask == 0:
+                placements.append((pieceID, config, squareIndex))
+                if statistics is not None:
+                    statistics.placements += 1
+                if searchBitboard(board | mask, unusedPiecesMask ^ pieceBit, placements, pruneRegions, statistics, budget):
+                    return True
+                placements.pop()
+                if statistics is not None:
+                    statistics.backtracks += 1
+    return False
+
+def searchMostConstrained(board: int, unusedPiecesMask: int, isPlacementLegal: bytearray, squareCounts: list[int], placements: list[tuple[int, int, int]], pruneRegions: bool = False, statistics: SolverStatistics = None, budget: SearchBudget = None) -> bool:
+    """
+    Backtracking search over a bitboard, always filling the empty square with the fewest legal placements covering it.
+    isPlacementLegal and squareCounts form the square to placements index and are updated as pieces are placed and removed.
+    The placements leading to a solution are appended to placements.
+
+    Parameters:
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        BYTEARRAY isPlacementLegal : indexed by ALL_PLACEMENTS
+        LIST<INT> squareCounts : number of legal placements covering each square
+        LIST<TUPLE<INT pieceID, INT config, INT squareIndex>> placements
+        [OPTIONAL] BOOL pruneRegions : Rule out boards with empty regions that cannot be filled, see isRegionPruned()
+        [OPTIONAL] SolverStatistics statistics : Every legal placement at the chosen square counts as a move check
+        [OPTIONAL] SearchBudget budget : Raises SearchInterrupted once it runs out, isPlacementLegal and squareCounts are then left inconsistent
+        
+    Returns:
+        BOOL
+    """
+    if statistics is not None:
+        statistics.enterNode(len(placements))
+    if budget is not None:
+        budget.checkNode()
+    if unusedPiecesMask == 0:
+        return True
+    if pruneRegions and isRegionPruned(board, unusedPiecesMask, statistics):
+        return False
+
+    emptySquares = ~board & FULL_GRID_MASK
+    if emptySquares == 0:
+        return False
+    squareIndex = -1
+    fewestPlacements = len(ALL_PLACEMENTS)
+    while emptySquares:
+        square = (emptySquares & -emptySquares).bit_length() - 1
+        emptySquares &= emptySquares - 1
+        if squareCounts[square] < fewestPlacements:
+            squareIndex = square
+            fewestPlacements = squareCounts[square]
+            if fewestPlacements == 0:
+                return False
+
+    for placementIndex in [i for i in SQUARE_PLACEMENTS[squareIndex] if isPlacementLegal[i]]:
+        pieceID, config, originSquare, mask = ALL_PLACEMENTS[placementIndex]
+        if statistics is not None:
+            statistics.checkMove(pieceID)
+            statistics.placements += 1
+        ruledOut = []
+        for conflictIndex in PLACEMENT_CONFLICTS[placementIndex]:
+            if isPlacementLegal[conflictIndex]:
+                isPlacementLegal[conflictIndex] = 0
+                ruledOut.append(conflictIndex)
+                for square in PLACEMENT_SQUARES[conflictIndex]:
+                    squareCounts[square] -= 1
+
+        placements.append((pieceID, config, originSquare))
+        if searchMostConstrained(board | mask, unusedPiecesMask ^ (1 << pieceID), isPlacementLegal, squareCounts, placements, pruneRegions, statistics, budget):
+            return True
+        placements.pop()
+        if statistics is not None:
+            statistics.backtracks += 1
+
+        for conflictIndex in ruledOut:
+            isPlacementLegal[conflictIndex] = 1
+            for square in PLACEMENT_SQUARES[conflictIndex]:
+                squareCounts[square] += 1
+    return False
+
+def findSolutionBitboard(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int], branching: int = FIRST_EMPTY_SQUARE_BRANCHING, pruneRegions: bool = False, statistics: SolverStatistics = None, budget: SearchBudget = None) -> bool:
+    """
+    Bitboard engine for findSolution().
+    With FIRST_EMPTY_SQUARE_BRANCHING it explores pieces and configs in the same order as the grid engine, hence finds the same solution.
+    Region pruning is only applied when the unused pieces exactly fill the empty squares.
+    The grid, pieceCoordinates and unusedPiecesID are only updated once a solution is found.
+
+    Parameters:
+    LIST<LIST<INT, INT>> grid
+    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+    LIST<INT> unusedPiecesID
+    [OPTIONAL] INT branching : FIRST_EMPTY_SQUARE_BRANCHING or MOST_CONSTRAINED_SQUARE_BRANCHING
+    [OPTIONAL] BOOL pruneRegions
+    [OPTIONAL] SolverStatistics statistics
+    [OPTIONAL] SearchBudget budget : Raises SearchInterrupted once it runs out, before anything is updated
+        
+    Returns:
+        BOOL
+    """
+    unusedPiecesMask = getPiecesMask(unusedPiecesID)
+    board = getGridMask(grid)
+    pruneRegions = pruneRegions and PIECE_SET_AREAS[unusedPiecesMask] == (~board & FULL_GRID_MASK).bit_count()
+
+    placements = []
+    if branching == MOST_CONSTRAINED_SQUARE_BRANCHING:
+        isPlacementLegal = bytearray(len(ALL_PLACEMENTS))
+        squareCounts = [0] * (GRID_SIZE * GRID_SIZE)
+        for placementIndex, (pieceID, config, originSquare, mask) in enumerate(ALL_PLACEMENTS):
+            if unusedPiecesMask >> pieceID & 1 and board & mask == 0:
+                isPlacementLegal[placementIndex] = 1
+                for square in PLACEMENT_SQUARES[placementIndex]:
+                    squareCounts[square] += 1
+        isSolved = searchMostConstrained(board, unusedPiecesMask, isPlacementLegal, squareCounts, placements, pruneRegions, statistics, budget)
+    else:
+        isSolved = searchBitboard(board, unusedPiecesMask, placements, pruneRegions, statistics, budget)
+    if not isSolved:
+        return False
+
+    for pieceID, config, squareIndex in placements:
+        grid, pieceCoordinates = placePieceOnGrid(grid, pieceCoordinates, pieceID, squareIndex % GRID_SIZE, squareIndex // GRID_SIZE, config)
+        unusedPiecesID.remove(pieceID)
     return True
 
-def placeLongBarOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places a long bar onto a given grid at the given coordinates
+def iterBitboardSolutions(board: int, unusedPiecesMask: int, placements: list[tuple[int, int, int]]):
+    """
+    Generator version of searchBitboard(), yielding every way of filling the board instead of stopping at the first.
+    Every empty square must be covered, so nothing is yielded unless the unused pieces exactly fill the empty squares.
+
+    Parameters:
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        LIST<TUPLE<INT pieceID, INT config, INT squareIndex>> placements : Placements made so far, restored before returning
+        
+    Yields:
+        TUPLE<TUPLE<INT pieceID, INT config, INT squareIndex>> placements
+    """
+    emptySquares = ~board & FULL_GRID_MASK
+    if unusedPiecesMask == 0:
+        if emptySquares == 0:
+            yield tuple(placements)
+        return
+    if emptySquares == 0:
+        return
+    squareIndex = (emptySquares & -emptySquares).bit_length() - 1
+
+    for pieceID in PIECE_MASK_ORDER[unusedPiecesMask]:
+        pieceBit = 1 << pieceID
+        for config, mask in CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]:
+            if board & mask == 0:
+                placements.append((pieceID, config, squareIndex))
+                yield from iterBitboardSolutions(board | mask, unusedPiecesMask ^ pieceBit, placements)
+                placements.pop()
+
+def iterSolutions(grid: list[list[int, int]], unusedPiecesID: list[int] = ALL_PIECE_IDS):
+    """
+    Lazily yields every solution of a given grid, in the order the bitboard engine finds them.
+    Solutions are only generated as they are consumed, so the caller can stop early, count them or stream them elsewhere.
+    The grid and unusedPiecesID are not modified.
+
+    Parameters:
+        LIST<LIST<INT, INT>> grid
+        [OPTIONAL] LIST<INT> unusedPiecesID
+        
+    Yields:
+        TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution : Sorted by pieceID, same format as solveDancingLinks()
+    
+    Examples:
+        next(iterSolutions(grid)) -> First solution, the same one findSolution() places with BITBOARD_ENGINE
+        sum(1 for solution in iterSolutions(grid)) -> Number of solutions
+        list(itertools.islice(iterSolutions(grid), 10)) -> First 10 solutions
+    """
+    unusedPiecesMask = getPiecesMask(unusedPiecesID)
+    board = getGridMask(grid)
+    if PIECE_SET_AREAS[unusedPiecesMask] != (~board & FULL_GRID_MASK).bit_count():
+        return
+
+    for placements in iterBitboardSolutions(board, unusedPiecesMask, []):
+        yield tuple((pieceID, config, squareIndex % GRID_SIZE, squareIndex // GRID_SIZE) for pieceID, config, squareIndex in sorted(placements))
+
+class IterativeSolver:
+    """
+    Bitboard search with an explicit stack, expanding at most a given number of nodes per call to step().
+    Explores placements in the same order as searchBitboard(), so the first solution is the one findSolution() finds with BITBOARD_ENGINE.
+    The whole state can be saved with getState() and resumed with IterativeSolver.fromState(), i.e. to checkpoint long enumerations.
+
+    Examples:
+        solver = IterativeSolver(grid)
+        while solver.step(500) == ITERATIVE_SOLVER_SEARCHING:
+            Render a frame
+        if solver.status == ITERATIVE_SOLVER_SOLUTION:
+            solver.placeSolution(grid, pieceCoordinates, unusedPiecesID)
+    """
+
+    def __init__(self, grid: list[list[int, int]], unusedPiecesID: list[int] = ALL_PIECE_IDS) -> None:
+        """
+        Parameters:
+            LIST<LIST<INT, INT>> grid : Not modified
+            [OPTIONAL] LIST<INT> unusedPiecesID
+        """
+        self.reset(getGridMask(grid), getPiecesMask(unusedPiecesID))
+
+    def reset(self, board: int, unusedPiecesMask: int) -> None:
+        """
+        Starts a new search of a given board.
+
+        Parameters:
+            INT board
+            INT unusedPiecesMask : bit pieceID is set for every unused piece
+            
+        Returns:
+            None
+        """
+        self.board = board
+        self.unusedPiecesMask = unusedPiecesMask
+        self.placements = [] #(pieceID, config, squareIndex) of every piece placed by the search
+        self.boards = [board] #Board and unused pieces at every depth
+        self.unusedPiecesMasks = [unusedPiecesMask]
+        self.candidates = [None] #Placements to try at every depth, None until the node is expanded
+        self.cursors = [0] #Index of the next candidate to try at every depth
+        self.nodes = 0
+        self.solutionsFound = 0
+        self.status = ITERATIVE_SOLVER_SEARCHING
+
+    def getCandidates(self, depth: int) -> list[tuple[int, int, int, int]]:
+        """
+        Returns the placements that fit the first empty square of the board at a given depth, in searchBitboard() order.
+
+        Parameters:
+            INT depth
+            
+        Returns:
+            LIST<TUPLE<INT pieceID, INT config, INT squareIndex, INT mask>> candidates
+        """
+        board = self.boards[depth]
+        unusedPiecesMask = self.unusedPiecesMasks[depth]
+        emptySquares = ~board & FULL_GRID_MASK
+        if unusedPiecesMask == 0 or emptySquares == 0:
+            return []
+        squareIndex = (emptySquares & -emptySquares).bit_length() - 1
+
+        candidates = []
+        for pieceID in PIECE_MASK_ORDER[unusedPiecesMask]:
+            for config, mask in CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]:
+                if board & mask == 0:
+                    candidates.append((pieceID, config, squareIndex, mask))
+        return candidates
+
+    def step(self, maxNodes: int) -> int:
+        """
+        Expands at most maxNodes nodes, stopping early at the next solution or once the search is exhausted.
+
+        Parameters:
+            INT maxNodes
+            
+        Returns:
+            INT status : ITERATIVE_SOLVER_SEARCHING, ITERATIVE_SOLVER_SOLUTION or ITERATIVE_SOLVER_EXHAUSTED
+        """
+        if self.status == ITERATIVE_SOLVER_EXHAUSTED:
+            return self.status
+        self.status = ITERATIVE_SOLVER_SEARCHING
+        expandedNodes = 0
+        while True:
+            depth = len(self.placements)
+            if self.candidates[depth] is None: #Newly entered node
+                if expandedNodes == maxNodes:
+                    return self.status
+                expandedNodes += 1
+                self.nodes += 1
+                if self.unusedPiecesMasks[depth] == 0:
+                    self.candidates[depth] = []
+                    self.solutionsFound += 1
+                    self.status = ITERATIVE_SOLVER_SOLUTION
+                    return self.status
+                self.candidates[depth] = self.getCandidates(depth)
+
+            cursor = self.cursors[depth]
+            if cursor < len(self.candidates[depth]):
+                pieceID, config, squareIndex, mask = self.candidates[depth][cursor]
+                self.cursors[depth] = cursor + 1
+                self.placements.append((pieceID, config, squareIndex))
+                self.boards.append(self.boards[depth] | mask)
+                self.unusedPiecesMasks.append(self.unusedPiecesMasks[depth] ^ (1 << pieceID))
+                self.candidates.append(None)
+                self.cursors.append(0)
+            elif depth == 0:
+                self.status = ITERATIVE_SOLVER_EXHAUSTED
+                return self.status
+            else: #Backtrack
+                self.placements.pop()
+                self.boards.pop()
+                self.unusedPiecesMasks.pop()
+                self.candidates.pop()
+                self.cursors.pop()
+
+    def getSolution(self) -> tuple[tuple[int, int, int, int]]:
+        """
+        Returns the solution found by the last call to step().
+
+        Parameters:
+            None
+            
+        Returns:
+            TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution : Same format as iterSolutions(), empty if there is none
+        """
+        if self.status != ITERATIVE_SOLVER_SOLUTION:
+            return ()
+        return tuple((pieceID, config, squareIndex % GRID_SIZE, squareIndex // GRID_SIZE) for pieceID, config, squareIndex in sorted(self.placements))
+
+    def placeSolution(self, grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int]) -> bool:
+        """
+        Places the solution found by the last call to step(), updating the arguments as findSolution() would.
+
+        Parameters:
+            LIST<LIST<INT, INT>> grid
+            DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+            LIST<INT> unusedPiecesID
+            
+        Returns:
+            BOOL : False if there is no solution to place
+        """
+        if self.status != ITERATIVE_SOLVER_SOLUTION:
+            return False
+        for pieceID, config, x, y in self.getSolution():
+            grid, pieceCoordinates = placePieceOnGrid(grid, pieceCoordinates, pieceID, x, y, config)
+            unusedPiecesID.remove(pieceID)
+        return True
+
+    def getState(self) -> dict:
+        """
+        Returns the state of the search as a JSON serialisable dictionary, see fromState().
+
+        Parameters:
+            None
+            
+        Returns:
+            DICT state
+        """
+        return {
+            "board": self.board,
+            "unusedPiecesMask": self.unusedPiecesMask,
+            "placements": [list(placement) for placement in self.placements],
+            "cursors": list(self.cursors),
+            "isExpanded": [candidates is not None for candidates in self.candidates],
+            "nodes": self.nodes,
+            "solutionsFound": self.solutionsFound,
+            "status": self.status
+        }
+
+    @classmethod
+    def fromState(cls, state: dict):
+        """
+        Returns a solver resuming the search saved by getState().
+
+        Parameters:
+            DICT state
+            
+        Returns:
+            IterativeSolver solver
+        """
+        solver = cls.__new__(cls)
+        solver.reset(state["board"], state["unusedPiecesMask"])
+        for pieceID, config, squareIndex in state["placements"]:
+            masks = dict(CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex])
+            if config not in masks:
+                raise ValueError("Invalid placement in state: " + str((pieceID, config, squareIndex)))
+            solver.placements.append((pieceID, config, squareIndex))
+            solver.boards.append(solver.boards[-1] | masks[config])
+            solver.unusedPiecesMasks.append(solver.unusedPiecesMasks[-1] ^ (1 << pieceID))
+        solver.cursors = list(state["cursors"])
+        if len(solver.cursors) != len(solver.boards) or len(state["isExpanded"]) != len(solver.boards):
+            raise ValueError("Placements and cursors of the state do not match")
+        solver.candidates = [solver.getCandidates(depth) if isExpanded else None for depth, isExpanded in enumerate(state["isExpanded"])]
+        solver.nodes = state["nodes"]
+        solver.solutionsFound = state["solutionsFound"]
+        solver.status = state["status"]
+        return solver
+
+class LRUCache:
+    """
+    Dictionary holding at most maxSize items, evicting the least recently used item when full.
+    Counts the hits and misses of get() so the usefulness of the cache can be measured.
+    """
+
+    def __init__(self, maxSize: int) -> None:
+        """
+        Parameters:
+            INT maxSize : Greater than 0
+        """
+        self.maxSize = maxSize
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, key, default = None):
+        """
+        Returns the value stored under key and marks it as most recently used, or default if there is none.
+
+        Parameters:
+            HASHABLE key
+            [OPTIONAL] ANY default
+            
+        Returns:
+            ANY value
+        """
+        if key not in self.items:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.items.move_to_end(key)
+        return self.items[key]
+
+    def put(self, key, value) -> None:
+        """
+        Stores value under key as the most recently used item, evicting the least recently used item if the cache is full.
+
+        Parameters:
+            HASHABLE key
+            ANY value
+            
+        Returns:
+            None
+        """
+        self.items[key] = value
+        self.items.move_to_end(key)
+        if len(self.items) > self.maxSize:
+            self.items.popitem(last=False)
+
+    def getHitRate(self) -> float:
+        """
+        Returns the fraction of get() calls that found their key.
+
+        Parameters:
+            None
+            
+        Returns:
+            FLOAT hitRate : 0.0 before the first get()
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def getMemoryUsage(self) -> int:
+        """
+        Estimates the bytes held by the cache, its dictionary plus every key and value, shared objects such as small ints counted each time.
+
+        Parameters:
+            None
+            
+        Returns:
+            INT bytes
+        """
+        return sys.getsizeof(self.items) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in self.items.items())
+
+def countBitboardSolutions(board: int, unusedPiecesMask: int, cache: LRUCache) -> int:
+    """
+    Counts the ways of exactly filling the empty squares of a board with the unused pieces, always filling the first empty square.
+    Results are memoised on the board and unused pieces, as different placement orders often lead to the same state.
+    Assumes the unused pieces cover exactly as many squares as are empty.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        LRUCache cache : Keyed by board | unusedPiecesMask << 36
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        INT solutionsFound
     """
-    """       
-    0:  x o o o
-                
-    1:  x
-        o
-        o
-        o
+    if unusedPiecesMask == 0:
+        return 1
+    key = board | unusedPiecesMask << (GRID_SIZE * GRID_SIZE)
+    solutionsFound = cache.get(key)
+    if solutionsFound is not None:
+        return solutionsFound
+
+    emptySquares = ~board & FULL_GRID_MASK
+    squareIndex = (emptySquares & -emptySquares).bit_length() - 1
+    solutionsFound = 0
+    for pieceID in PIECE_MASK_ORDER[unusedPiecesMask]:
+        pieceBit = 1 << pieceID
+        for config, mask in CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]:
+            if board & mask == 0:
+                solutionsFound += countBitboardSolutions(board | mask, unusedPiecesMask ^ pieceBit, cache)
+    cache.put(key, solutionsFound)
+    return solutionsFound
+
+def countSolutions(grid: list[list[int, int]], unusedPiecesID: list[int] = ALL_PIECE_IDS, cache: LRUCache = None) -> int:
+    """
+    Counts every solution of a given grid without listing them.
+    Pass the same cache to several calls to share states between grids and to read its hits and misses afterwards.
+    The grid and unusedPiecesID are not modified.
+
+    Parameters:
+        LIST<LIST<INT, INT>> grid
+        [OPTIONAL] LIST<INT> unusedPiecesID
+        [OPTIONAL] LRUCache cache : Defaults to a new cache of DEFAULT_SOLUTION_COUNT_CACHE_SIZE states
         
-    2:  o o o x
-                
-    3:  o
-        o
-        o
-        x
-    
-    4: o x o o
-    
-    5: o o x o
-    
-    6: o
-        x
-        o
-        o
-    
-    7: o
-        o
-        x
-        o     
-    """
-    match config:
-        case 0:
-            grid[y][x] = LONG_BAR_PIECE_ID
-            grid[y][x+1] = LONG_BAR_PIECE_ID
-            grid[y][x+2] = LONG_BAR_PIECE_ID
-            grid[y][x+3] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x+1, y), (x+2, y), (x+3, y)]
-        case 1:
-            grid[y][x] = LONG_BAR_PIECE_ID
-            grid[y+1][x] = LONG_BAR_PIECE_ID
-            grid[y+2][x] = LONG_BAR_PIECE_ID
-            grid[y+3][x] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x, y+1), (x, y+2), (x, y+3)]
-        case 2:
-            grid[y][x] = LONG_BAR_PIECE_ID
-            grid[y][x-1] = LONG_BAR_PIECE_ID
-            grid[y][x-2] = LONG_BAR_PIECE_ID
-            grid[y][x-3] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x-1, y), (x-2, y), (x-3, y)]
-        case 3:
-            grid[y][x] = LONG_BAR_PIECE_ID
-            grid[y-1][x] = LONG_BAR_PIECE_ID
-            grid[y-2][x] = LONG_BAR_PIECE_ID
-            grid[y-3][x] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x, y-1), (x, y-2), (x, y-3)]
-        case 4:
-            grid[y][x] = LONG_BAR_PIECE_ID 
-            grid[y][x-1] = LONG_BAR_PIECE_ID
-            grid[y][x+1] = LONG_BAR_PIECE_ID 
-            grid[y][x+2] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x-1, y), (x+1, y), (x+2, y)]
-        case 5:
-            grid[y][x] = LONG_BAR_PIECE_ID 
-            grid[y][x+1] = LONG_BAR_PIECE_ID 
-            grid[y][x-1] = LONG_BAR_PIECE_ID 
-            grid[y][x-2] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x+1, y), (x-1, y), (x-2, y)]
-        case 6:
-            grid[y][x] = LONG_BAR_PIECE_ID
-            grid[y-1][x] = LONG_BAR_PIECE_ID 
-            grid[y+1][x] = LONG_BAR_PIECE_ID
-            grid[y+2][x] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x, y-1), (x, y+1), (x, y+2)]
-        case 7:
-            grid[y][x] = LONG_BAR_PIECE_ID 
-            grid[y+1][x] = LONG_BAR_PIECE_ID 
-            grid[y-1][x] = LONG_BAR_PIECE_ID 
-            grid[y-2][x] = LONG_BAR_PIECE_ID
-            pieceCoordinates[LONG_BAR_PIECE_ID] = [(x, y), (x, y+1), (x, y-1), (x, y-2)]
+    Returns:
+        INT solutionsFound
     
-    return grid, pieceCoordinates
-
-def isMoveValidL(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether an l can be placed onto a given grid at the given coordinates
+    Examples:
+        cache = LRUCache(DEFAULT_SOLUTION_COUNT_CACHE_SIZE)
+        countSolutions(initaliseBlockers(deepcopy(EMPTY_GRID), getDiceRolls("E2A2D3A5C6E4F1")), cache=cache) -> 221
+        cache.hits, cache.misses -> Number of states reused and searched
+    """
+    if cache is None:
+        cache = LRUCache(DEFAULT_SOLUTION_COUNT_CACHE_SIZE)
+    unusedPiecesMask = getPiecesMask(unusedPiecesID)
+    board = getGridMask(grid)
+    if PIECE_SET_AREAS[unusedPiecesMask] != (~board & FULL_GRID_MASK).bit_count():
+        return 0
+    return countBitboardSolutions(board, unusedPiecesMask, cache)
+
+def isBitboardCompletable(board: int, unusedPiecesMask: int, cache: LRUCache, pruneRegions: bool = False, budget: SearchBudget = None) -> bool:
+    """
+    Decides whether the unused pieces can be placed on a board, always filling the first empty square.
+    Both outcomes are memoised on the board and unused pieces for every state searched, so later queries reuse the subtrees of earlier ones.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
+        INT board
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        LRUCache cache : Keyed by board | unusedPiecesMask << 36, must not be shared with countBitboardSolutions()
+        [OPTIONAL] BOOL pruneRegions : Rule out boards with empty regions that cannot be filled, see isRegionPruned()
+        [OPTIONAL] SearchBudget budget : Raises SearchInterrupted once it runs out, only complete results are cached
+        
     Returns:
         BOOL
-    """ 
-    """ 
-    0:
-        x
-        o
-      o o
-        
-    1:
-        o
-        x
-      o o
-      
-    2:
-        o
-        o
-      o x
-     
-    3:
-        o
-        o
-      x o
-      
-    4:
-        x
-        o o o
-        
-    5:
-        o
-        x o o
-        
-    6:
-        o
-        o x o
+    """
+    if unusedPiecesMask == 0:
+        return True
+    key = board | unusedPiecesMask << (GRID_SIZE * GRID_SIZE)
+    isCompletableBoard = cache.get(key)
+    if isCompletableBoard is not None:
+        return isCompletableBoard
+    if budget is not None:
+        budget.checkNode()
+
+    isCompletableBoard = False
+    emptySquares = ~board & FULL_GRID_MASK
+    if emptySquares != 0 and not (pruneRegions and isRegionPruned(board, unusedPiecesMask)):
+        squareIndex = (emptySquares & -emptySquares).bit_length() - 1
+        for pieceID in PIECE_MASK_ORDER[unusedPiecesMask]:
+            pieceBit = 1 << pieceID
+            for config, mask in CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]:
+                if board & mask == 0 and isBitboardCompletable(board | mask, unusedPiecesMask ^ pieceBit, cache, pruneRegions, budget):
+                    isCompletableBoard = True
+                    break
+            if isCompletableBoard:
+                break
+    cache.put(key, isCompletableBoard)
+    return isCompletableBoard
+
+def isCompletable(board: int, unusedPiecesMask: int, cache: LRUCache = None, deadline: float = None, cancelEvent: threading.Event = None) -> bool:
+    """
+    Solvability oracle for partial boards, answering whether findSolution() would succeed without building the solution.
+    Keep one cache across calls, i.e. every hint of a game, so repeated and related queries are answered from earlier searches.
+    Region pruning is applied when the unused pieces exactly fill the empty squares.
+
+    Parameters:
+        INT board : i.e. getGridMask() or BoardSnapshot.board
+        INT unusedPiecesMask
+        [OPTIONAL] LRUCache cache : Defaults to a new cache of DEFAULT_COMPLETABLE_CACHE_SIZE states
+        [OPTIONAL] FLOAT deadline : time.monotonic() value
+        [OPTIONAL] threading.Event cancelEvent : Stops the search once set
         
-    7:
-        o
-        o o x
+    Returns:
+        BOOL : None if the deadline passed or the search was cancelled first
+    
+    Examples:
+        cache = LRUCache(DEFAULT_COMPLETABLE_CACHE_SIZE)
+        isCompletable(snapshot.board, snapshot.unusedPiecesMask, cache) -> True
+        cache.getHitRate(), cache.getMemoryUsage() -> Fraction of states reused, estimated bytes held
+    """
+    if cache is None:
+        cache = LRUCache(DEFAULT_COMPLETABLE_CACHE_SIZE)
+    budget = SearchBudget(deadline, cancelEvent) if deadline is not None or cancelEvent is not None else None
+    pruneRegions = PIECE_SET_AREAS[unusedPiecesMask] == (~board & FULL_GRID_MASK).bit_count()
+    try:
+        return isBitboardCompletable(board, unusedPiecesMask, cache, pruneRegions, budget)
+    except SearchInterrupted:
+        return None
+
+def getExactCoverRows(grid: list[list[int, int]], unusedPiecesID: list[int]) -> tuple[list[tuple[int, int, int]], list[list[int]], int, int]:
+    """
+    Builds the exact cover matrix of a given grid.
+    There is one column per unused piece followed by one column per empty square, and one row per placement of an unused piece.
+    Square columns are only primary (must be covered) when the unused pieces exactly fill the empty squares, otherwise they are
+    secondary (covered at most once).
+
+    Parameters:
+        LIST<LIST<INT, INT>> grid
+        LIST<INT> unusedPiecesID
         
-    8:
-        o x
-        o
-        o
+    Returns:
+        TUPLE<LIST<TUPLE<INT pieceID, INT config, INT squareIndex>> placements, LIST<LIST<INT>> rows, INT primaryColumns, INT columns>
+    """
+    board = getGridMask(grid)
+    emptySquares = [squareIndex for squareIndex in range(0, GRID_SIZE * GRID_SIZE) if not board >> squareIndex & 1]
+    squareColumns = {squareIndex: len(unusedPiecesID) + i for i, squareIndex in enumerate(emptySquares)}
+
+    placements = []
+    rows = []
+    for pieceColumn, pieceID in enumerate(unusedPiecesID):
+        for squareIndex in emptySquares:
+            for config, mask in CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex]:
+                if board & mask == 0:
+                    placements.append((pieceID, config, squareIndex))
+                    rows.append([pieceColumn] + [squareColumns[square] for square in range(0, GRID_SIZE * GRID_SIZE) if mask >> square & 1])
+
+    columns = len(unusedPiecesID) + len(emptySquares)
+    if sum(len(PIECE_SHAPES[pieceID]) for pieceID in unusedPiecesID) == len(emptySquares):
+        return placements, rows, columns, columns
+    return placements, rows, len(unusedPiecesID), columns
+
+def buildDancingLinks(rows: list[list[int]], primaryColumns: int, columns: int) -> tuple[list[int]]:
+    """
+    Builds the toroidal doubly linked lists used by Algorithm X.
+    Node 0 is the root, nodes [1, columns] are the column headers and every other node is a 1 in the exact cover matrix.
+    Secondary column headers are left out of the root's list so they are never chosen to branch on.
+
+    Parameters:
+        LIST<LIST<INT>> rows
+        INT primaryColumns
+        INT columns
         
-    9:
-        x o
-        o
-        o
+    Returns:
+        TUPLE<LIST<INT> left, LIST<INT> right, LIST<INT> up, LIST<INT> down, LIST<INT> column, LIST<INT> row, LIST<INT> size>
+    """
+    headers = columns + 1
+    left = [i - 1 for i in range(0, headers)]
+    right = [i + 1 for i in range(0, headers)]
+    left[0] = primaryColumns
+    right[primaryColumns] = 0
+    for header in range(primaryColumns + 1, headers):
+        left[header] = header
+        right[header] = header
+    up = list(range(0, headers))
+    down = list(range(0, headers))
+    column = list(range(0, headers))
+    row = [-1] * headers
+    size = [0] * headers
+
+    for rowIndex, rowColumns in enumerate(rows):
+        first = len(column)
+        for i, rowColumn in enumerate(rowColumns):
+            header = rowColumn + 1
+            node = first + i
+            left.append(node - 1 if i > 0 else first + len(rowColumns) - 1)
+            right.append(node + 1 if i < len(rowColumns) - 1 else first)
+            up.append(up[header])
+            down.append(header)
+            down[up[header]] = node
+            up[header] = node
+            column.append(header)
+            row.append(rowIndex)
+            size[header] += 1
+    return left, right, up, down, column, row, size
+
+def coverDancingLinksColumn(links: tuple[list[int]], header: int) -> None:
+    """
+    Removes a column header and every row with a 1 in that column from the links.
+
+    Parameters:
+        TUPLE<LIST<INT>> links
+        INT header
         
-    10:
-        o o
-        x
-        o
+    Returns:
+        None
+    """
+    left, right, up, down, column, row, size = links
+    right[left[header]] = right[header]
+    left[right[header]] = left[header]
+    i = down[header]
+    while i != header:
+        j = right[i]
+        while j != i:
+            down[up[j]] = down[j]
+            up[down[j]] = up[j]
+            size[column[j]] -= 1
+            j = right[j]
+        i = down[i]
+
+def uncoverDancingLinksColumn(links: tuple[list[int]], header: int) -> None:
+    """
+    Undoes coverDancingLinksColumn(), links must be uncovered in the reverse order they were covered.
+
+    Parameters:
+        TUPLE<LIST<INT>> links
+        INT header
         
-    11:
-        o o
-        o
-        x
+    Returns:
+        None
+    """
+    left, right, up, down, column, row, size = links
+    i = up[header]
+    while i != header:
+        j = left[i]
+        while j != i:
+            size[column[j]] += 1
+            down[up[j]] = j
+            up[down[j]] = j
+            j = left[j]
+        i = up[i]
+    right[left[header]] = header
+    left[right[header]] = header
+
+def searchDancingLinks(links: tuple[list[int]], partialSolution: list[int], mode: int, solutions: list[list[int]]) -> int:
+    """
+    Algorithm X, always branching on the primary column with the fewest rows left.
+
+    Parameters:
+        TUPLE<LIST<INT>> links
+        LIST<INT> partialSolution : row indices chosen so far
+        INT mode : DANCING_LINKS_FIRST_SOLUTION, DANCING_LINKS_COUNT_SOLUTIONS or DANCING_LINKS_ALL_SOLUTIONS
+        LIST<LIST<INT>> solutions : row indices of every stored solution
         
-    12:
-        x o o
-            o
-
-    13:
-        o x o
-            o
-
-    14:
-        o o x
-            o
-
-    15:
-        o o o
-            x
-
-    16:
-        x
-        o
-        o o
-
-    17:
-        o
-        x
-        o o
-
-    18:
-        o
-        o
-        x o
-
-    19:
-        o
-        o
-        o x
-
-    20:
-            o
-        x o o
-
-    21:
-            o
-        o x o
-
-    22:
-            o
-        o o x
-
-    23:
-            x
-        o o o
-
-    24:
-        x o
-          o
-          o
-
-    25:
-        o x
-          o
-          o
-
-    26:
-        o o
-          x
-          o
-
-    27:
-        o o
-          o
-          x
-
-    28:
-        o o o
-        x
-    
-    29:
-        x o o
-        o         
+    Returns:
+        INT solutionsFound
+    """
+    left, right, up, down, column, row, size = links
+    if right[0] == 0:
+        if mode != DANCING_LINKS_COUNT_SOLUTIONS:
+            solutions.append(list(partialSolution))
+        return 1
+
+    header = right[0]
+    i = right[header]
+    while i != 0:
+        if size[i] < size[header]:
+            header = i
+        i = right[i]
+    if size[header] == 0:
+        return 0
+
+    solutionsFound = 0
+    coverDancingLinksColumn(links, header)
+    i = down[header]
+    while i != header:
+        partialSolution.append(row[i])
+        j = right[i]
+        while j != i:
+            coverDancingLinksColumn(links, column[j])
+            j = right[j]
+
+        solutionsFound += searchDancingLinks(links, partialSolution, mode, solutions)
+
+        j = left[i]
+        while j != i:
+            uncoverDancingLinksColumn(links, column[j])
+            j = left[j]
+        partialSolution.pop()
+        if solutionsFound and mode == DANCING_LINKS_FIRST_SOLUTION:
+            break
+        i = down[i]
+    uncoverDancingLinksColumn(links, header)
+    return solutionsFound
+
+def solveDancingLinks(grid: list[list[int, int]], unusedPiecesID: list[int], mode: int = DANCING_LINKS_FIRST_SOLUTION) -> tuple[int, list[list[tuple[int, int, int, int]]]]:
+    """
+    Solves a given grid as an exact cover problem without modifying it.
+    Every solution is a list of (pieceID, config, x, y) placements.
 
-    30:
-        o x o
-        o
+    Parameters:
+        LIST<LIST<INT, INT>> grid
+        LIST<INT> unusedPiecesID
+        [OPTIONAL] INT mode : DANCING_LINKS_FIRST_SOLUTION, DANCING_LINKS_COUNT_SOLUTIONS or DANCING_LINKS_ALL_SOLUTIONS
+        
+    Returns:
+        TUPLE<INT solutionsFound, LIST<LIST<TUPLE<INT, INT, INT, INT>>> solutions> : solutions is empty when counting
     
-    31:
-        o o x
-        o
+    Examples:
+        solveDancingLinks(grid, unusedPiecesID, DANCING_LINKS_COUNT_SOLUTIONS) -> (count, [])
     """
-    match config:
-        case 0:
-            if x < 1 or x > 5 or y < 0 or y > 3:
-                return False
-        case 1:
-            if x < 1 or x > 5 or y < 1 or y > 4:
-                return False
-        case 2:
-            if x < 1 or x > 5 or y < 2 or y > 5:
-                return False
-        case 3:   
-            if x < 0 or x > 4 or y < 2 or y > 5:
-                return False 
-        case 4:
-            if x < 0 or x > 3 or y < 0 or y > 4:
-                return False
-        case 5:
-            if x < 0 or x > 3 or y < 1 or y > 5:
-                return False
-        case 6:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False
-        case 7:
-            if x < 2 or x > 5 or y < 1 or y > 5:
-                return False
-        case 8:
-            if x < 1 or x > 5 or y < 0 or y > 3:
-                return False
-        case 9:
-            if x < 0 or x > 4 or y < 0 or y > 3:
-                return False
-        case 10:
-            if x < 0 or x > 4 or y < 1 or y > 4:
-                return False
-        case 11:
-            if x < 0 or x > 4 or y < 2 or y > 5:
-                return False
-        case 12:
-            if x < 0 or x > 3 or y < 0 or y > 4:
-                return False
-        case 13:
-            if x < 1 or x > 4 or y < 0 or y > 4:
-                return False
-        case 14:
-            if x < 2 or x > 5 or y < 0 or y > 4:
-                return False
-        case 15:
-            if x < 2 or x > 5 or y < 1 or y > 5:
-                return False
-        case 16:
-            if x < 0 or x > 4 or y < 0 or y > 3:
-                return False
-        case 17:
-            if x < 0 or x > 4 or y < 1 or y > 4:
-                return False
-        case 18:
-            if x < 0 or x > 4 or y < 2 or y > 5:
-                return False
-        case 19:
-            if x < 1 or x > 5 or y < 2 or y > 5:
-                return False
-        case 20:
-            if x < 0 or x > 3 or y < 1 or y > 5:
-                return False
-        case 21:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False
-        case 22:
-            if x < 2 or x > 5 or y < 1 or y > 5:
-                return False
-        case 23:
-            if x < 2 or x > 5 or y < 0 or y > 4:
-                return False
-        case 24:
-            if x < 0 or x > 4 or y < 0 or y > 3:
-                return False
-        case 25:
-            if x < 1 or x > 5 or y < 0 or y > 3:
-                return False
-        case 26:
-            if x < 1 or x > 5 or y < 1 or y > 4:
-                return False
-        case 27:
-            if x < 1 or x > 5 or y < 2 or y > 5:
-                return False
-        case 28:
-            if x < 0 or x > 3 or y < 1 or y > 5:
-                return False
-        case 29:
-            if x < 0 or x > 3 or y < 0 or y > 4:
-                return False
-        case 30:
-            if x < 1 or x > 4 or y < 0 or y > 4:
-                return False
-        case 31:
-            if x < 2 or x > 5 or y < 0 or y > 4:
-                return False
+    placements, rows, primaryColumns, columns = getExactCoverRows(grid, unusedPiecesID)
+    links = buildDancingLinks(rows, primaryColumns, columns)
+    rowSolutions = []
+    solutionsFound = searchDancingLinks(links, [], mode, rowSolutions)
+
+    solutions = []
+    for rowSolution in rowSolutions:
+        solution = []
+        for rowIndex in sorted(rowSolution, key=lambda rowIndex: placements[rowIndex][0]):
+            pieceID, config, squareIndex = placements[rowIndex]
+            solution.append((pieceID, config, squareIndex % GRID_SIZE, squareIndex // GRID_SIZE))
+        solutions.append(solution)
+    return solutionsFound, solutions
+
+def findSolutionDancingLinks(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int]) -> bool:
+    """
+    Dancing links engine for findSolution().
+    The grid, pieceCoordinates and unusedPiecesID are only updated once a solution is found.
+
+    Parameters:
+    LIST<LIST<INT, INT>> grid
+    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+    LIST<INT> unusedPiecesID
         
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID or grid[y+2][x-1] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID or grid[y-2][x+1] != EMPTY_ID:
-                return False
-        case 4:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID or grid[y+1][x+2] != EMPTY_ID:
-                return False
-        case 5:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID:
-                return False
-        case 6:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 7:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID or grid[y-1][x-2] != EMPTY_ID:
-                return False
-        case 8:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID or grid[y+2][x-1] != EMPTY_ID:
-                return False
-        case 9:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID:
-                return False    
-        case 10:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False  
-        case 11:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID or grid[y-2][x+1] != EMPTY_ID:
-                return False  
-        case 12:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID or grid[y+1][x+2] != EMPTY_ID:
-                return False 
-        case 13:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False 
-        case 14:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID:
-                return False 
-        case 15:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y-1][x-2] != EMPTY_ID: 
-                return False  
-        case 16:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID or grid[y+2][x+1] != EMPTY_ID: 
-                return False  
-        case 17:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID: 
-                return False  
-        case 18:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID: 
-                return False  
-        case 19:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y-2][x-1] != EMPTY_ID:
-                return False     
-        case 20:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID or grid[y-1][x+2] != EMPTY_ID: 
-                return False  
-        case 21:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID: 
-                return False  
-        case 22:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID: 
-                return False  
-        case 23:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID or grid[y+1][x-2] != EMPTY_ID:
-                return False       
-        case 24:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID or grid[y+2][x+1] != EMPTY_ID:
-                return False       
-        case 25:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID: 
-                return False    
-        case 26:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID: 
-                return False    
-        case 27:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID or grid[y-2][x-1] != EMPTY_ID: 
-                return False                                   
-        case 28:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID or grid[y-1][x+2] != EMPTY_ID:
-                return False  
-        case 29:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID or grid[y+1][x] != EMPTY_ID: 
-                return False   
-        case 30:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID: 
-                return False 
-        case 31:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID or grid[y+1][x-2] != EMPTY_ID: 
-                return False 
-            
+    Returns:
+        BOOL
+    """
+    solutionsFound, solutions = solveDancingLinks(grid, unusedPiecesID, DANCING_LINKS_FIRST_SOLUTION)
+    if solutionsFound == 0:
+        return False
+
+    for pieceID, config, x, y in solutions[0]:
+        grid, pieceCoordinates = placePieceOnGrid(grid, pieceCoordinates, pieceID, x, y, config)
+        unusedPiecesID.remove(pieceID)
     return True
 
-def placeLOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places an l onto a given grid at the given coordinates
+def searchGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesMask: int, statistics: SolverStatistics = None, depth: int = 0, budget: SearchBudget = None) -> bool:
+    """
+    Backtracking search over the grid for GRID_ENGINE, always filling the first empty square.
+    The unused pieces are passed down as a mask, so nothing has to be removed from or restored to a list on backtrack.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+    LIST<LIST<INT, INT>> grid
+    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+    INT unusedPiecesMask : bit pieceID is set for every unused piece
+    [OPTIONAL] SolverStatistics statistics
+    [OPTIONAL] INT depth : Number of pieces placed by the search so far
+    [OPTIONAL] SearchBudget budget : Raises SearchInterrupted once it runs out, leaving the pieces it placed on the grid
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        BOOL
     """
-    """ 
-    0:
-        x
-        o
-      o o
-        
-    1:
-        o
-        x
-      o o
-      
-    2:
-        o
-        o
-      o x
-     
-    3:
-        o
-        o
-      x o
-      
-    4:
-        x
-        o o o
-        
-    5:
-        o
-        x o o
-        
-    6:
-        o
-        o x o
-        
-    7:
-        o
-        o o x
-        
-    8:
-        o x
-        o
-        o
-        
-    9:
-        x o
-        o
-        o
-        
-    10:
-        o o
-        x
-        o
-        
-    11:
-        o o
-        o
-        x
-        
-    12:
-        x o o
-            o
-
-    13:
-        o x o
-            o
-
-    14:
-        o o x
-            o
-
-    15:
-        o o o
-            x
-
-    16:
-        x
-        o
-        o o
-
-    17:
-        o
-        x
-        o o
-
-    18:
-        o
-        o
-        x o
-
-    19:
-        o
-        o
-        o x
-
-    20:
-            o
-        x o o
-
-    21:
-            o
-        o x o
-
-    22:
-            o
-        o o x
-
-    23:
-            x
-        o o o
-
-    24:
-        x o
-          o
-          o
-
-    25:
-        o x
-          o
-          o
-
-    26:
-        o o
-          x
-          o
-
-    27:
-        o o
-          o
-          x
-
-    28:
-        o o o
-        x
+    if statistics is not None:
+        statistics.enterNode(depth)
+    if budget is not None:
+        budget.checkNode()
+    if unusedPiecesMask == 0:
+        return True
     
-    29:
-        x o o
-        o         
+    emptySquare = getEmptySquareCoordinates(grid)
+    for pieceID in PIECE_MASK_ORDER[unusedPiecesMask]:
+        for config in CANONICAL_PIECE_CONFIGURATIONS[pieceID]:
+            if statistics is not None:
+                statistics.checkMove(pieceID)
+            if isMoveValid(grid, pieceID, emptySquare[0], emptySquare[1], config):
+                grid, pieceCoordinates = placePieceOnGrid(grid, pieceCoordinates, pieceID, emptySquare[0], emptySquare[1], config)
+                if statistics is not None:
+                    statistics.placements += 1
+                
+                if searchGrid(grid, pieceCoordinates, unusedPiecesMask ^ (1 << pieceID), statistics, depth + 1, budget):
+                    return True
+                
+                grid = removePieceFromGrid(grid, pieceCoordinates, pieceID)
+                pieceCoordinates[pieceID] = None
+                if statistics is not None:
+                    statistics.backtracks += 1
 
-    30:
-        o x o
-        o
-    
-    31:
-        o o x
-        o
-    """
-    match config:
-        case 0:
-            grid[y][x] = L_PIECE_ID 
-            grid[y+1][x] = L_PIECE_ID 
-            grid[y+2][x] = L_PIECE_ID
-            grid[y+2][x-1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x, y+2), (x-1, y+2)]
-        case 1:
-            grid[y][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y+1][x-1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x, y+1), (x-1, y+1)]
-        case 2:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y-2][x] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x, y-1), (x, y-2)]
-        case 3:
-            grid[y][x] = L_PIECE_ID
-            grid[y][x+1] = L_PIECE_ID
-            grid[y-1][x+1] = L_PIECE_ID
-            grid[y-2][x+1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x+1, y-1), (x+1, y-2)]
-        case 4:
-            grid[y][x] = L_PIECE_ID
-            grid[y+1][x] = L_PIECE_ID
-            grid[y+1][x+1] = L_PIECE_ID
-            grid[y+1][x+2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x+1, y+1), (x+2, y+1)]
-        case 5:
-            grid[y][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y][x+2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x+1, y), (x+2, y)]
-        case 6:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y-1][x-1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x-1, y), (x-1, y-1)]
-        case 7:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y][x-2] = L_PIECE_ID  
-            grid[y-1][x-2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x-2, y), (x-2, y-1)]
-        case 8:
-            grid[y][x] = L_PIECE_ID
-            grid[y][x-1] = L_PIECE_ID
-            grid[y-1][x-1] = L_PIECE_ID
-            grid[y-2][x-1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x-1, y-1), (x-1, y-2)]
-        case 9:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y+2][x] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x, y+1), (x, y+2)]
-        case 10:
-            grid[y][x] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y-1][x+1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x, y-1), (x+1, y-1)]
-        case 11:
-            grid[y][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID 
-            grid[y-2][x] = L_PIECE_ID  
-            grid[y-2][x+1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x, y-2), (x+1, y-2)]
-        case 12:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y][x+2] = L_PIECE_ID  
-            grid[y+1][x+2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x+2, y), (x+2, y+1)]
-        case 13:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y+1][x+1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x+1, y), (x+1, y+1)]
-        case 14:
-            grid[y][x] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y][x-2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x-1, y), (x-2, y)]
-        case 15:
-            grid[y][x] = L_PIECE_ID 
-            grid[y-1][x] != L_PIECE_ID 
-            grid[y-1][x-1] = L_PIECE_ID 
-            grid[y-1][x-2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x-1, y-1), (x-2, y-1)]
-        case 16:
-            grid[y][x] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y+2][x] = L_PIECE_ID  
-            grid[y+2][x+1] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x, y+2), (x+1, y+2)]
-        case 17:
-            grid[y][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y+1][x+1] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x, y+1), (x+1, y+1)]
-        case 18:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y-2][x] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x, y-1), (x, y-2)]
-        case 19:
-            grid[y][x] = L_PIECE_ID
-            grid[y][x-1] = L_PIECE_ID
-            grid[y-1][x-1] = L_PIECE_ID
-            grid[y-2][x-1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x-1, y-1), (x-1, y-2)]
-        case 20:
-            grid[y][x] = L_PIECE_ID 
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y][x+2] = L_PIECE_ID  
-            grid[y-1][x+2] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x+2, y), (x+2, y-1)]
-        case 21:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y-1][x+1] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x+1, y), (x+1, y-1)]
-        case 22:
-            grid[y][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID 
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y][x-2] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x-1, y), (x-2, y)]
-        case 23:
-            grid[y][x] = L_PIECE_ID
-            grid[y+1][x] = L_PIECE_ID
-            grid[y+1][x-1] = L_PIECE_ID
-            grid[y+1][x-2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x-1, y+1), (x-2, y+1)]
-        case 24:
-            grid[y][x] = L_PIECE_ID
-            grid[y][x+1] = L_PIECE_ID
-            grid[y+1][x+1] = L_PIECE_ID
-            grid[y+2][x+1] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x+1, y+1), (x+1, y+2)]
-        case 25:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y+2][x] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x, y+1), (x, y+2)]
-        case 26:
-            grid[y][x] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y-1][x-1] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y+1), (x, y-1), (x-1, y-1)]
-        case 27:
-            grid[y][x] = L_PIECE_ID  
-            grid[y-1][x] = L_PIECE_ID  
-            grid[y-2][x] = L_PIECE_ID  
-            grid[y-2][x-1] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x, y-2), (x-1, y-2)]
-        case 28:
-            grid[y][x] = L_PIECE_ID
-            grid[y-1][x] = L_PIECE_ID 
-            grid[y-1][x+1] = L_PIECE_ID 
-            grid[y-1][x+2] = L_PIECE_ID
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x, y-1), (x+1, y-1), (x+2, y-1)]
-        case 29:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y][x+2] = L_PIECE_ID  
-            grid[y+1][x] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x+2, y), (x, y+1)]
-        case 30:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x+1] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y+1][x-1] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x+1, y), (x-1, y), (x-1, y+1)]
-        case 31:
-            grid[y][x] = L_PIECE_ID  
-            grid[y][x-1] = L_PIECE_ID  
-            grid[y][x-2] = L_PIECE_ID  
-            grid[y+1][x-2] = L_PIECE_ID 
-            pieceCoordinates[L_PIECE_ID] = [(x, y), (x-1, y), (x-2, y), (x-2, y+1)]
-             
-    return grid, pieceCoordinates
+    return False
 
-def isMoveValidT(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether a t can be placed onto a given grid at the given coordinates
+def findSolution(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int], engine: int = GRID_ENGINE, branching: int = FIRST_EMPTY_SQUARE_BRANCHING, pruneRegions: bool = False, statistics: SolverStatistics = None, deadline: float = None, cancelEvent: threading.Event = None) -> bool:
+    """
+    Uses a backtracking algorithm to search for a single solution on a given grid configuration.
+    With a deadline or cancelEvent the search may stop early, returning None with grid, pieceCoordinates and unusedPiecesID unchanged.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
+    LIST<LIST<INT, INT>> grid
+    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+    LIST<INT> unusedPiecesID
+    [OPTIONAL] INT engine : GRID_ENGINE, BITBOARD_ENGINE or DANCING_LINKS_ENGINE
+    [OPTIONAL] INT branching : FIRST_EMPTY_SQUARE_BRANCHING or MOST_CONSTRAINED_SQUARE_BRANCHING, only used by BITBOARD_ENGINE
+    [OPTIONAL] BOOL pruneRegions : Prune boards with empty regions no unused pieces can fill, only used by BITBOARD_ENGINE
+    [OPTIONAL] SolverStatistics statistics : Filled in by GRID_ENGINE and BITBOARD_ENGINE, up to the interruption if the search stops early
+    [OPTIONAL] FLOAT deadline : time.monotonic() value, not used by DANCING_LINKS_ENGINE
+    [OPTIONAL] threading.Event cancelEvent : Stops the search once set, not used by DANCING_LINKS_ENGINE
+        
+    Returns:
+        BOOL : None if the deadline passed or the search was cancelled first
+    
+    Examples:
+        With the grid from getDiceRolls("A1A2C3E1A4E4F1") and statistics = SolverStatistics()
+        findSolution(grid, pieceCoordinates, unusedPiecesID, BITBOARD_ENGINE, pruneRegions=True, statistics=statistics)
+        statistics.nodes, statistics.regionChecks, statistics.smallRegionPrunes, statistics.regionSizePrunes -> 33, 32, 9, 5
+        findSolution(grid, pieceCoordinates, unusedPiecesID, BITBOARD_ENGINE, deadline=time.monotonic() + 0.1) -> True, False or None
+    """     
+    if engine == DANCING_LINKS_ENGINE:
+        return findSolutionDancingLinks(grid, pieceCoordinates, unusedPiecesID)
+
+    budget = None
+    if deadline is not None or cancelEvent is not None:
+        budget = SearchBudget(deadline, cancelEvent)
+        if engine == GRID_ENGINE: #Searched in place
+            gridSnapshot = deepcopy(grid)
+            pieceCoordinatesSnapshot = deepcopy(pieceCoordinates)
+
+    try:
+        if engine == BITBOARD_ENGINE:
+            return findSolutionBitboard(grid, pieceCoordinates, unusedPiecesID, branching, pruneRegions, statistics, budget)
+        isSolved = searchGrid(grid, pieceCoordinates, getPiecesMask(unusedPiecesID), statistics, 0, budget)
+        if isSolved:
+            unusedPiecesID.clear()
+        return isSolved
+    except SearchInterrupted:
+        if engine == GRID_ENGINE:
+            for y, row in enumerate(gridSnapshot):
+                grid[y][:] = row
+            pieceCoordinates.update(pieceCoordinatesSnapshot)
+        if statistics is not None:
+            statistics.interrupted = True
+        return None
+    finally:
+        if statistics is not None:
+            statistics.finish()
+
+def getPlacementMask(pieceID: int, config: int, x: int, y: int) -> int:
+    """
+    Returns the bitboard of the squares a given placement covers, the placement is assumed to lie within the grid.
+
+    Parameters:
+        INT pieceID : [0, 8]
         INT config
+        INT x : [0, 5]
+        INT y : [0, 5]
+        
     Returns:
-        BOOL
-    """ 
-    """ 
-    0: 
-          x
-        o o o
-    1: 
-          o
-        x o o    
-    2:
-          o
-        o x o    
-    3:
-          o
-        o o x
-    4:
-        x
-        o o
-        o
-    5:
-        o
-        x o
-        o    
-    6:
-        o
-        o o
-        x    
-    7:
-        o
-        o x
-        o    
-    8:
-        x o o
-          o
-    9:
-        o x o
-          o    
-    10:
-        o o x
-          o    
-    11:
-        o o o
-          x    
-    12:
-          x
-        o o
-          o
-    13:
-          o
-        x o
-          o    
-    14:
-          o
-        o x
-          o    
-    15:
-          o
-        o o
-          x    
-    """
-    match config:
-        case 0:
-            if x < 1 or x > 4 or y < 0 or y > 4:
-                return False
-        case 1:
-            if x < 0 or x > 3 or y < 1 or y > 5:
-                return False
-        case 2:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False
-        case 3:   
-            if x < 2 or x > 5 or y < 1 or y > 5:
-                return False
-        case 4:
-            if x < 0 or x > 4 or y < 0 or y > 3:
-                return False  
-        case 5:
-            if x < 0 or x > 4 or y < 1 or y > 4:
-                return False
-        case 6:
-            if x < 0 or x > 4 or y < 2 or y > 5:
-                return False
-        case 7:
-            if x < 1 or x > 5 or y < 1 or y > 4:
-                return False
-        case 8:
-            if x < 0 or x > 3 or y < 0 or y > 4:
-                return False
-        case 9:
-            if x < 1 or x > 4 or y < 0 or y > 4:
-                return False
-        case 10:
-            if x < 2 or x > 5 or y < 0 or y > 4:
-                return False
-        case 11:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False
-        case 12:
-            if x < 1 or x > 5 or y < 0 or y > 3:
-                return False
-        case 13:
-            if x < 0 or x > 4 or y < 1 or y > 4:
-                return False
-        case 14:
-            if x < 1 or x > 5 or y < 1 or y > 4:
-                return False
-        case 15:
-            if x < 1 or x > 5 or y < 2 or y > 5:
-                return False
+        INT mask
+    """
+    mask = 0
+    for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]:
+        mask |= 1 << ((y + yOffset) * GRID_SIZE + x + xOffset)
+    return mask
+
+class BoardSnapshot(NamedTuple):
+    """
+    Immutable and hashable state of a grid, pieceCoordinates and unusedPiecesID packed into ints and tuples.
+    Deriving a snapshot with a piece placed or removed builds a new tuple instead of copying nested lists and dicts.
+
+    Fields:
+        INT blockers : Bitboard of the blockers
+        INT board : Bitboard of every square that is not empty
+        INT unusedPiecesMask : bit pieceID is set for every unused piece
+        TUPLE<TUPLE<INT config, INT x, INT y>> placements : Indexed by pieceID, None for unused pieces
+
+    Examples:
+        snapshot = BoardSnapshot.fromGrid(grid, pieceCoordinates)
+        findSolutionSnapshot(snapshot.withoutPiece(L_PIECE_ID)) -> Solved BoardSnapshot, False or None
+    """
+    blockers: int
+    board: int
+    unusedPiecesMask: int
+    placements: tuple
+
+    @classmethod
+    def fromGrid(cls, grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]]):
+        """
+        Returns the snapshot of a given grid, neither argument is modified.
+
+        Parameters:
+            LIST<LIST<INT, INT>> grid
+            DICT<INT, TUPLE<INT, INT>> pieceCoordinates : Pieces placed with placePieceOnGrid()
             
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 4:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 5:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID:
-                return False
-        case 6:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False
-        case 7:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:
-                return False
-        case 8:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y][x+2] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 9:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID:
+        Returns:
+            BoardSnapshot snapshot
+        """
+        blockers = 0
+        for y in range(0, GRID_SIZE):
+            for x in range(0, GRID_SIZE):
+                if grid[y][x] == BLOCKER_ID:
+                    blockers |= 1 << (y * GRID_SIZE + x)
+        snapshot = cls(blockers, blockers, ALL_PIECES_MASK, (None,) * len(ALL_PIECE_IDS))
+        for pieceID in ALL_PIECE_IDS:
+            placement = getPiecePlacement(pieceID, pieceCoordinates[pieceID])
+            if placement is not None:
+                snapshot = snapshot.withPiece(pieceID, *placement)
+        return snapshot
+
+    def withPiece(self, pieceID: int, config: int, x: int, y: int):
+        """
+        Returns a copy of the snapshot with a given unused piece placed, the move is assumed to be valid.
+
+        Parameters:
+            INT pieceID : [0, 8]
+            INT config
+            INT x : [0, 5]
+            INT y : [0, 5]
+            
+        Returns:
+            BoardSnapshot snapshot
+        """
+        placements = self.placements[:pieceID] + ((config, x, y),) + self.placements[pieceID + 1:]
+        return BoardSnapshot(self.blockers, self.board | getPlacementMask(pieceID, config, x, y), self.unusedPiecesMask & ~(1 << pieceID), placements)
+
+    def withoutPiece(self, pieceID: int):
+        """
+        Returns a copy of the snapshot with a given placed piece removed.
+
+        Parameters:
+            INT pieceID : [0, 8]
+            
+        Returns:
+            BoardSnapshot snapshot
+        """
+        if self.placements[pieceID] is None:
+            return self
+        placements = self.placements[:pieceID] + (None,) + self.placements[pieceID + 1:]
+        return BoardSnapshot(self.blockers, self.board & ~getPlacementMask(pieceID, *self.placements[pieceID]), self.unusedPiecesMask | 1 << pieceID, placements)
+
+    def withMove(self, pieceID: int, config: int, x: int, y: int):
+        """
+        Returns a copy of the snapshot with a given piece placed, taking it off its old squares first if it is already placed.
+        The move is assumed to be valid once the piece is taken off.
+
+        Parameters:
+            INT pieceID : [0, 8]
+            INT config
+            INT x : [0, 5]
+            INT y : [0, 5]
+            
+        Returns:
+            BoardSnapshot snapshot
+        """
+        return self.withoutPiece(pieceID).withPiece(pieceID, config, x, y)
+
+    def withSolution(self, solution: tuple[tuple[int, int, int, int]]):
+        """
+        Returns a copy of the snapshot with every piece of a given solution placed.
+
+        Parameters:
+            TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution : Format of iterSolutions()
+            
+        Returns:
+            BoardSnapshot snapshot
+        """
+        snapshot = self
+        for pieceID, config, x, y in solution:
+            snapshot = snapshot.withPiece(pieceID, config, x, y)
+        return snapshot
+
+    def getPlacedPiecesID(self) -> list[int]:
+        """
+        Returns the sorted list of placed pieces.
+
+        Parameters:
+            None
+            
+        Returns:
+            LIST<INT> piecesID
+        """
+        return getPiecesID(ALL_PIECES_MASK & ~self.unusedPiecesMask)
+
+    def getPieceCoordinates(self) -> dict[int, tuple[int, int]]:
+        """
+        Returns the pieceCoordinates of the snapshot, as placePieceOnGrid() would have set them.
+
+        Parameters:
+            None
+            
+        Returns:
+            DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+        """
+        pieceCoordinates = {}
+        for pieceID, placement in enumerate(self.placements):
+            if placement is None:
+                pieceCoordinates[pieceID] = None
+            else:
+                config, x, y = placement
+                pieceCoordinates[pieceID] = [(x + xOffset, y + yOffset) for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]]
+        return pieceCoordinates
+
+    def getGrid(self) -> list[list[int, int]]:
+        """
+        Returns a new grid of the snapshot.
+
+        Parameters:
+            None
+            
+        Returns:
+            LIST<LIST<INT, INT>> grid
+        """
+        grid = [[BLOCKER_ID if self.blockers >> (y * GRID_SIZE + x) & 1 else EMPTY_ID for x in range(0, GRID_SIZE)] for y in range(0, GRID_SIZE)]
+        for pieceID, coordinates in self.getPieceCoordinates().items():
+            for x, y in coordinates or ():
+                grid[y][x] = pieceID
+        return grid
+
+def findSolutionSnapshot(snapshot: BoardSnapshot, pruneRegions: bool = False, statistics: SolverStatistics = None, deadline: float = None, cancelEvent: threading.Event = None) -> BoardSnapshot:
+    """
+    Bitboard search for a single solution of a given snapshot, the snapshot version of findSolution() with BITBOARD_ENGINE.
+
+    Parameters:
+        BoardSnapshot snapshot
+        [OPTIONAL] BOOL pruneRegions
+        [OPTIONAL] SolverStatistics statistics
+        [OPTIONAL] FLOAT deadline : time.monotonic() value
+        [OPTIONAL] threading.Event cancelEvent : Stops the search once set
+        
+    Returns:
+        BoardSnapshot solution : Snapshot with every piece placed, False if there is no solution, None if the deadline passed or the search was cancelled first
+    """
+    budget = SearchBudget(deadline, cancelEvent) if deadline is not None or cancelEvent is not None else None
+    pruneRegions = pruneRegions and PIECE_SET_AREAS[snapshot.unusedPiecesMask] == (~snapshot.board & FULL_GRID_MASK).bit_count()
+    placements = []
+    try:
+        if not searchBitboard(snapshot.board, snapshot.unusedPiecesMask, placements, pruneRegions, statistics, budget):
+            return False
+    except SearchInterrupted:
+        if statistics is not None:
+            statistics.interrupted = True
+        return None
+    finally:
+        if statistics is not None:
+            statistics.finish()
+    return snapshot.withSolution((pieceID, config, squareIndex % GRID_SIZE, squareIndex // GRID_SIZE) for pieceID, config, squareIndex in placements)
+
+class Board:
+    """
+    Mutable grid stored as a flat array of cells with a bitboard of the occupied squares, holding its own piece placements.
+    Uses __slots__ and arrays rather than nested lists and dicts, so thousands of boards can be held at once.
+    Converts to and from the grid, pieceCoordinates and unusedPiecesID used by the rest of the module.
+
+    Examples:
+        board = Board(getDiceRolls("A1A2C3E1A4E4F1"))
+        board.findSolution() -> True
+        grid, pieceCoordinates, unusedPiecesID = board.getGrid(), board.getPieceCoordinates(), board.getUnusedPiecesID()
+    """
+    __slots__ = ("cells", "mask", "unusedPiecesMask", "pieceConfigs", "pieceSquares")
+
+    def __init__(self, blockers: list[tuple[int, int]] = ()) -> None:
+        """
+        Parameters:
+            [OPTIONAL] LIST<TUPLE<INT, INT>> blockers : Format of getDiceRolls()
+        """
+        self.cells = array("b", [EMPTY_ID] * (GRID_SIZE * GRID_SIZE))
+        self.mask = 0
+        self.unusedPiecesMask = ALL_PIECES_MASK
+        self.pieceConfigs = array("b", [-1] * len(ALL_PIECE_IDS)) #-1 for unused pieces
+        self.pieceSquares = array("b", [-1] * len(ALL_PIECE_IDS)) #Square index of the origin of each placed piece
+        for x, y in blockers:
+            self.cells[y * GRID_SIZE + x] = BLOCKER_ID
+            self.mask |= 1 << (y * GRID_SIZE + x)
+
+    @classmethod
+    def fromGrid(cls, grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]]):
+        """
+        Returns the board of a given grid, neither argument is modified.
+
+        Parameters:
+            LIST<LIST<INT, INT>> grid
+            DICT<INT, TUPLE<INT, INT>> pieceCoordinates : Pieces placed with placePieceOnGrid()
+            
+        Returns:
+            Board board
+        """
+        board = cls([(x, y) for y in range(0, GRID_SIZE) for x in range(0, GRID_SIZE) if grid[y][x] == BLOCKER_ID])
+        for pieceID in ALL_PIECE_IDS:
+            placement = getPiecePlacement(pieceID, pieceCoordinates[pieceID])
+            if placement is not None:
+                config, x, y = placement
+                board.placePiece(pieceID, x, y, config)
+        return board
+
+    @classmethod
+    def fromSnapshot(cls, snapshot: BoardSnapshot):
+        """
+        Returns the board of a given snapshot.
+
+        Parameters:
+            BoardSnapshot snapshot
+            
+        Returns:
+            Board board
+        """
+        board = cls([(squareIndex % GRID_SIZE, squareIndex // GRID_SIZE) for squareIndex in range(0, GRID_SIZE * GRID_SIZE) if snapshot.blockers >> squareIndex & 1])
+        for pieceID, placement in enumerate(snapshot.placements):
+            if placement is not None:
+                config, x, y = placement
+                board.placePiece(pieceID, x, y, config)
+        return board
+
+    def copy(self):
+        """
+        Returns an independent copy of the board.
+
+        Parameters:
+            None
+            
+        Returns:
+            Board board
+        """
+        board = Board.__new__(Board)
+        board.cells = array("b", self.cells)
+        board.mask = self.mask
+        board.unusedPiecesMask = self.unusedPiecesMask
+        board.pieceConfigs = array("b", self.pieceConfigs)
+        board.pieceSquares = array("b", self.pieceSquares)
+        return board
+
+    def isMoveValid(self, pieceID: int, x: int, y: int, config: int) -> bool:
+        """
+        Returns whether a given piece and config can be placed at a given coordinate, the Board version of isMoveValid().
+
+        Parameters:
+            INT pieceID : [0, 8]
+            INT x : [0, 5]
+            INT y : [0, 5]
+            INT config
+            
+        Returns:
+            BOOL
+        """
+        for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]:
+            if x + xOffset < 0 or x + xOffset >= GRID_SIZE or y + yOffset < 0 or y + yOffset >= GRID_SIZE:
                 return False
-        case 10:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y][x-2] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:
+            if self.mask >> ((y + yOffset) * GRID_SIZE + x + xOffset) & 1:
                 return False
-        case 11:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False 
-        case 12:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+2][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:
-                return False              
-        case 13:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False   
-        case 14:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID:
-                return False 
-        case 15:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-2][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False 
-        
-    return True
+        return True
+
+    def placePiece(self, pieceID: int, x: int, y: int, config: int) -> None:
+        """
+        Places a given unused piece, the move is validated by the caller.
+
+        Parameters:
+            INT pieceID : [0, 8]
+            INT x : [0, 5]
+            INT y : [0, 5]
+            INT config
+            
+        Returns:
+            None
+        """
+        for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]:
+            self.cells[(y + yOffset) * GRID_SIZE + x + xOffset] = pieceID
+        self.mask |= getPlacementMask(pieceID, config, x, y)
+        self.unusedPiecesMask &= ~(1 << pieceID)
+        self.pieceConfigs[pieceID] = config
+        self.pieceSquares[pieceID] = y * GRID_SIZE + x
+
+    def removePiece(self, pieceID: int) -> None:
+        """
+        Removes a given piece, nothing happens if it is not placed.
+
+        Parameters:
+            INT pieceID : [0, 8]
+            
+        Returns:
+            None
+        """
+        config = self.pieceConfigs[pieceID]
+        if config == -1:
+            return
+        x, y = self.pieceSquares[pieceID] % GRID_SIZE, self.pieceSquares[pieceID] // GRID_SIZE
+        for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]:
+            self.cells[(y + yOffset) * GRID_SIZE + x + xOffset] = EMPTY_ID
+        self.mask &= ~getPlacementMask(pieceID, config, x, y)
+        self.unusedPiecesMask |= 1 << pieceID
+        self.pieceConfigs[pieceID] = -1
+        self.pieceSquares[pieceID] = -1
+
+    def getEmptySquareCoordinates(self) -> tuple[int]:
+        """
+        Returns the first empty square in row-major order, the Board version of getEmptySquareCoordinates().
+
+        Parameters:
+            None
+            
+        Returns:
+            TUPLE<INT> : (-1, -1) if the board is full
+        """
+        emptySquares = ~self.mask & FULL_GRID_MASK
+        if emptySquares == 0:
+            return (-1, -1)
+        squareIndex = (emptySquares & -emptySquares).bit_length() - 1
+        return (squareIndex % GRID_SIZE, squareIndex // GRID_SIZE)
+
+    def findSolution(self, pruneRegions: bool = False, statistics: SolverStatistics = None, deadline: float = None, cancelEvent: threading.Event = None) -> bool:
+        """
+        Places the pieces of the first solution found by the bitboard search, the board is only changed once a solution is found.
+
+        Parameters:
+            [OPTIONAL] BOOL pruneRegions
+            [OPTIONAL] SolverStatistics statistics
+            [OPTIONAL] FLOAT deadline : time.monotonic() value
+            [OPTIONAL] threading.Event cancelEvent : Stops the search once set
+            
+        Returns:
+            BOOL : None if the deadline passed or the search was cancelled first
+        """
+        solution = findSolutionSnapshot(self.getSnapshot(), pruneRegions, statistics, deadline, cancelEvent)
+        if not solution:
+            return solution
+        for pieceID in PIECE_MASK_ORDER[self.unusedPiecesMask]:
+            config, x, y = solution.placements[pieceID]
+            self.placePiece(pieceID, x, y, config)
+        return True
 
-def placeTOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places a t onto a given grid at the given coordinates
+    def getSnapshot(self) -> BoardSnapshot:
+        """
+        Returns the snapshot of the board.
+
+        Parameters:
+            None
+            
+        Returns:
+            BoardSnapshot snapshot
+        """
+        blockers = 0
+        for squareIndex, cell in enumerate(self.cells):
+            if cell == BLOCKER_ID:
+                blockers |= 1 << squareIndex
+        placements = tuple((config, square % GRID_SIZE, square // GRID_SIZE) if config != -1 else None for config, square in zip(self.pieceConfigs, self.pieceSquares))
+        return BoardSnapshot(blockers, self.mask, self.unusedPiecesMask, placements)
+
+    def getGrid(self) -> list[list[int, int]]:
+        """
+        Returns a new grid of the board.
+
+        Parameters:
+            None
+            
+        Returns:
+            LIST<LIST<INT, INT>> grid
+        """
+        return [list(self.cells[y * GRID_SIZE:(y + 1) * GRID_SIZE]) for y in range(0, GRID_SIZE)]
+
+    def getPieceCoordinates(self) -> dict[int, tuple[int, int]]:
+        """
+        Returns the pieceCoordinates of the board, as placePieceOnGrid() would have set them.
+
+        Parameters:
+            None
+            
+        Returns:
+            DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+        """
+        pieceCoordinates = {}
+        for pieceID in ALL_PIECE_IDS:
+            config = self.pieceConfigs[pieceID]
+            if config == -1:
+                pieceCoordinates[pieceID] = None
+            else:
+                x, y = self.pieceSquares[pieceID] % GRID_SIZE, self.pieceSquares[pieceID] // GRID_SIZE
+                pieceCoordinates[pieceID] = [(x + xOffset, y + yOffset) for xOffset, yOffset in PIECE_CONFIGURATION_OFFSETS[pieceID][config]]
+        return pieceCoordinates
+
+    def getUnusedPiecesID(self) -> list[int]:
+        """
+        Returns the sorted list of unused pieces.
+
+        Parameters:
+            None
+            
+        Returns:
+            LIST<INT> unusedPiecesID
+        """
+        return getPiecesID(self.unusedPiecesMask)
+
+def getMinimumRemovalSet(snapshot: BoardSnapshot, cache: LRUCache = None, deadline: float = None, cancelEvent: threading.Event = None) -> tuple[int]:
+    """
+    Finds the smallest set of placed pieces whose removal leaves a completable board, trying sets in increasing size.
+    Every check goes through isCompletable() with the same cache, so overlapping sets reuse the boards searched before.
+    Removing more pieces from a completable board keeps it completable, hence the first set found is a smallest one.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+        BoardSnapshot snapshot
+        [OPTIONAL] LRUCache cache : Solvability cache of isCompletable(), defaults to a new cache of DEFAULT_COMPLETABLE_CACHE_SIZE states
+        [OPTIONAL] FLOAT deadline : time.monotonic() value shared by every check
+        [OPTIONAL] threading.Event cancelEvent : Stops the search once set
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        TUPLE<INT> removedPiecesID : Sorted, empty if the board is already completable,
+                                     False if even the blockers alone cannot be completed, None if the deadline passed or the search was cancelled first
+    
+    Examples:
+        getMinimumRemovalSet(BoardSnapshot.fromGrid(grid, pieceCoordinates), cache, time.monotonic() + 1.0) -> (L_PIECE_ID, T_PIECE_ID)
     """
-    """ 
-    0: 
-          x
-        o o o
-    1: 
-          o
-        x o o    
-    2:
-          o
-        o x o    
-    3:
-          o
-        o o x
-    4:
-        x
-        o o
-        o
-    5:
-        o
-        x o
-        o    
-    6:
-        o
-        o o
-        x    
-    7:
-        o
-        o x
-        o    
-    8:
-        x o o
-          o
-    9:
-        o x o
-          o    
-    10:
-        o o x
-          o    
-    11:
-        o o o
-          x    
-    12:
-          x
-        o o
-          o
-    13:
-          o
-        x o
-          o    
-    14:
-          o
-        o x
-          o    
-    15:
-          o
-        o o
-          x    
-    """
-    match config:
-        case 0:
-            grid[y][x] = T_PIECE_ID  
-            grid[y+1][x-1] = T_PIECE_ID  
-            grid[y+1][x] = T_PIECE_ID  
-            grid[y+1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y+1), (x, y+1), (x+1, y+1)]
-        case 1:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x+1] = T_PIECE_ID  
-            grid[y][x+2] = T_PIECE_ID  
-            grid[y-1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x+1, y), (x+2, y), (x+1, y-1)]
-        case 2:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x-1] = T_PIECE_ID  
-            grid[y][x+1] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y), (x+1, y), (x, y-1)]
-        case 3:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x-1] = T_PIECE_ID  
-            grid[y][x-2] = T_PIECE_ID  
-            grid[y-1][x-1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y), (x-2, y), (x-1, y-1)]
-        case 4:
-            grid[y][x] = T_PIECE_ID  
-            grid[y+1][x] = T_PIECE_ID  
-            grid[y+2][x] = T_PIECE_ID  
-            grid[y+1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y+1), (x, y+2), (x+1, y+1)]
-        case 5:
-            grid[y][x] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID  
-            grid[y+1][x] = T_PIECE_ID  
-            grid[y][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y-1), (x, y+1), (x+1, y)]
-        case 6:
-            grid[y][x] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID  
-            grid[y-2][x] = T_PIECE_ID  
-            grid[y-1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y-1), (x, y-2), (x+1, y-1)]
-        case 7:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x-1] = T_PIECE_ID  
-            grid[y-1][x-1] = T_PIECE_ID  
-            grid[y+1][x-1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y), (x-1, y-1), (x-1, y+1)]
-        case 8:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x+1] = T_PIECE_ID  
-            grid[y][x+2] = T_PIECE_ID  
-            grid[y+1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x+1, y), (x+2, y), (x+1, y+1)]
-        case 9:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x-1] = T_PIECE_ID  
-            grid[y][x+1] = T_PIECE_ID  
-            grid[y+1][x] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y), (x+1, y), (x, y+1)]
-        case 10:
-            grid[y][x] = T_PIECE_ID  
-            grid[y][x-1] = T_PIECE_ID  
-            grid[y][x-2] = T_PIECE_ID  
-            grid[y+1][x-1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y), (x-2, y), (x-1, y+1)]
-        case 11:
-            grid[y][x] = T_PIECE_ID  
-            grid[y-1][x-1] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID  
-            grid[y-1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x-1, y-1), (x, y-1), (x+1, y-1)] 
-        case 12:
-            grid[y][x] = T_PIECE_ID  
-            grid[y+1][x] = T_PIECE_ID  
-            grid[y+2][x] = T_PIECE_ID  
-            grid[y+1][x-1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y+1), (x, y+2), (x-1, y+1)]               
-        case 13:
-            grid[y][x] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID  
-            grid[y-1][x-1] = T_PIECE_ID  
-            grid[y-1][x+1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y-1), (x-1, y-1), (x+1, y-1)] 
-        case 14:
-            grid[y][x] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID  
-            grid[y+1][x] = T_PIECE_ID  
-            grid[y][x-1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y-1), (x, y+1), (x-1, y)] 
-        case 15:
-            grid[y][x] = T_PIECE_ID  
-            grid[y-1][x] = T_PIECE_ID  
-            grid[y-2][x] = T_PIECE_ID  
-            grid[y-1][x-1] = T_PIECE_ID
-            pieceCoordinates[T_PIECE_ID] = [(x, y), (x, y-1), (x, y-2), (x-1, y-1)]   
-        
-    return grid, pieceCoordinates
+    if cache is None:
+        cache = LRUCache(DEFAULT_COMPLETABLE_CACHE_SIZE)
+    placedPiecesID = snapshot.getPlacedPiecesID()
+    for numberOfRemovals in range(0, len(placedPiecesID) + 1):
+        for removedPiecesID in combinations(placedPiecesID, numberOfRemovals):
+            candidate = snapshot
+            for pieceID in removedPiecesID:
+                candidate = candidate.withoutPiece(pieceID)
+            isCandidateCompletable = isCompletable(candidate.board, candidate.unusedPiecesMask, cache, deadline, cancelEvent)
+            if isCandidateCompletable is None:
+                return None
+            if isCandidateCompletable:
+                return removedPiecesID
+    return False
+
+class SolutionIndex:
+    """
+    Every solution of a grid, with a bitset of solution indices for every piece placement, bit i is set if solution i uses the placement.
+    The solutions matching the pieces placed so far are the AND of their bitsets, so a hint costs one big int AND per placed piece instead of a search.
+    Placements are keyed by the squares they cover, hence symmetric configurations of a piece match.
 
-def isMoveValidZ(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether a z can be placed onto a given grid at the given coordinates
+    Examples:
+        index = SolutionIndex.fromGrid(grid)
+        index.getNextMove(BoardSnapshot.fromGrid(grid, pieceCoordinates)) -> (T_PIECE_ID, 2, 3, 0)
+    """
 
-    Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
-    Returns:
-        BOOL
-    """ 
-    """  
-    0:
-         x
-       o o
-       o
-    1:
-         o
-       o x
-       o
-    2:
-         o
-       x o
-       o    
-    3:
-         o
-       o o
-       x    
-    4:
-       x
-       o o
-         o
-    5:
-       o
-       x o
-         o    
-    6:
-       o
-       o x
-         o    
-    7:
-       o
-       o o
-         x    
-    8:
-        x o
-          o o
-    9:
-        o x
-          o o    
-    10:
-        o o
-          x o    
-    11:
-        o o
-          o x    
-    12:
-         o x
-       o o
-    13:
-         x o
-       o o    
-    14:
-         o o
-       o x    
-    15:
-         o o
-       x o
-    """
-    match config:
-        case 0:
-            if x < 1 or x > 5 or y < 0 or y > 3:
-                return False
-        case 1:
-            if x < 1 or x > 5 or y < 1 or y > 4:
-                return False
-        case 2:
-            if x < 0 or x > 4 or y < 1 or y > 4:
-                return False
-        case 3:
-            if x < 0 or x > 4 or y < 2 or y > 5:
-                return False
-        case 4:
-            if x < 0 or x > 4 or y < 0 or y > 3:
-                return False
-        case 5:
-            if x < 0 or x > 4 or y < 1 or y > 4:
-                return False
-        case 6:
-            if x < 1 or x > 5 or y < 1 or y > 4:
-                return False
-        case 7:
-            if x < 1 or x > 5 or y < 2 or y > 5:
-                return False
-        case 8:
-            if x < 0 or x > 3 or y < 0 or y > 4:
-                return False
-        case 9:
-            if x < 1 or x > 4 or y < 0 or y > 4:
-                return False
-        case 10:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False
-        case 11:
-            if x < 2 or x > 5 or y < 1 or y > 5:
-                return False
-        case 12:
-            if x < 2 or x > 5 or y < 0 or y > 4:
-                return False
-        case 13:
-            if x < 1 or x > 4 or y < 0 or y > 4:
-                return False
-        case 14:
-            if x < 1 or x > 4 or y < 1 or y > 5:
-                return False
-        case 15:
-            if x < 0 or x > 3 or y < 1 or y > 5:
-                return False
-         
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID or grid[y+2][x-1] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID or grid[y-2][x+1] != EMPTY_ID:
-                return False
-        case 4:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID or grid[y+2][x+1] != EMPTY_ID:
-                return False
-        case 5:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 6:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 7:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y-2][x-1] != EMPTY_ID:
-                return False
-        case 8:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID or grid[y+1][x+2] != EMPTY_ID:
-                return False
-        case 9:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 10:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 11:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID or grid[y-1][x-2] != EMPTY_ID:
-                return False
-        case 12:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID or grid[y+1][x-2] != EMPTY_ID:
-                return False
-        case 13:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:
-                return False
-        case 14:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:
-                return False
-        case 15:  
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID or grid[y-1][x+2] != EMPTY_ID:
-                return False
+    def __init__(self, blockers: int) -> None:
+        """
+        Parameters:
+            INT blockers : Bitboard of the blockers of the grid, see getGridMask()
+        """
+        self.blockers = blockers
+        self.solutions = []
+        self.placementBitsets = [{} for pieceID in ALL_PIECE_IDS] #Placement mask to bitset of solution indices for every piece
+        self.isComplete = False #True once every solution has been added
+
+    def __len__(self) -> int:
+        return len(self.solutions)
+
+    @classmethod
+    def fromGrid(cls, grid: list[list[int, int]]):
+        """
+        Returns the complete index of a given grid of blockers, the grid is not modified.
+
+        Parameters:
+            LIST<LIST<INT, INT>> grid
             
-    return True
+        Returns:
+            SolutionIndex index
+        """
+        index = cls(getGridMask(grid))
+        for solution in iterSolutions(grid):
+            index.addSolution(solution)
+        index.isComplete = True
+        return index
+
+    def addSolution(self, solution: tuple[tuple[int, int, int, int]]) -> None:
+        """
+        Adds a given solution of the grid to the index.
+
+        Parameters:
+            TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution : Format of iterSolutions()
+            
+        Returns:
+            None
+        """
+        solutionBit = 1 << len(self.solutions)
+        self.solutions.append(solution)
+        for pieceID, config, x, y in solution:
+            mask = getPlacementMask(pieceID, config, x, y)
+            bitsets = self.placementBitsets[pieceID]
+            bitsets[mask] = bitsets.get(mask, 0) | solutionBit
+
+    def addSolutions(self, solver: IterativeSolver, maxNodes: int) -> int:
+        """
+        Steps a given solver of the same grid for at most maxNodes nodes, adding every solution it finds.
+        The index becomes complete once the solver is exhausted, the solver should only be stepped through this method.
+
+        Parameters:
+            IterativeSolver solver
+            INT maxNodes
+            
+        Returns:
+            INT status : ITERATIVE_SOLVER_SEARCHING or ITERATIVE_SOLVER_EXHAUSTED
+        """
+        finalNodes = solver.nodes + maxNodes
+        while solver.step(max(0, finalNodes - solver.nodes)) == ITERATIVE_SOLVER_SOLUTION:
+            self.addSolution(solver.getSolution())
+        self.isComplete = solver.status == ITERATIVE_SOLVER_EXHAUSTED
+        return solver.status
+
+    def getMatchingSolutions(self, snapshot: BoardSnapshot) -> int:
+        """
+        Returns the bitset of the indexed solutions that use every placement of a given snapshot.
+
+        Parameters:
+            BoardSnapshot snapshot : Snapshot of the same grid
+            
+        Returns:
+            INT solutionsBitset : 0 if no indexed solution matches
+        """
+        if snapshot.blockers != self.blockers:
+            return 0
+        solutionsBitset = (1 << len(self.solutions)) - 1
+        for pieceID, placement in enumerate(snapshot.placements):
+            if placement is not None:
+                solutionsBitset &= self.placementBitsets[pieceID].get(getPlacementMask(pieceID, *placement), 0)
+                if solutionsBitset == 0:
+                    break
+        return solutionsBitset
+
+    def getNextMove(self, snapshot: BoardSnapshot) -> tuple[int, int, int, int]:
+        """
+        Returns a placement of an unused piece that keeps a given snapshot solvable.
+        Counts every placement of every unused piece across all matching solutions and picks the most common one,
+        so the hint stays valid for as many ways of finishing as possible. Ties go to the piece searched first, see PIECE_MASK_ORDER.
+
+        Parameters:
+            BoardSnapshot snapshot : Snapshot of the same grid
+            
+        Returns:
+            TUPLE<INT pieceID, INT config, INT x, INT y> move : Empty if every piece is placed, None if no indexed solution matches
+        """
+        solutionsBitset = self.getMatchingSolutions(snapshot)
+        if solutionsBitset == 0:
+            return None
+
+        bestBitset = 0
+        bestCount = 0
+        bestPieceID = None
+        for pieceID in getPiecesID(snapshot.unusedPiecesMask):
+            for bitset in self.placementBitsets[pieceID].values():
+                matchingBitset = bitset & solutionsBitset
+                count = matchingBitset.bit_count()
+                if count > bestCount:
+                    bestBitset = matchingBitset
+                    bestCount = count
+                    bestPieceID = pieceID
+        if bestPieceID is None:
+            return ()
+        return next(move for move in self.solutions[(bestBitset & -bestBitset).bit_length() - 1] if move[0] == bestPieceID) #Config of the first solution using the placement
+
+def getSolutionDatabaseRecord(seedNumber: int) -> bytes:
+    """
+    Solves the grid of a given seed number and packs its solution database record.
 
-def placeZOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places a z onto a given grid at the given coordinates
+    Parameters:
+        INT seedNumber
+        
+    Returns:
+        BYTES record
+    """
+    grid = initaliseBlockers(deepcopy(EMPTY_GRID), getDiceRolls(getSeedFromNumber(seedNumber)))
+    solutionsFound = countSolutions(grid)
+
+    unusedPiecesMask = (1 << len(ALL_PIECE_IDS)) - 1
+    placements = []
+    statistics = SolverStatistics()
+    packedPlacements = [SOLUTION_DATABASE_NO_PLACEMENT] * len(ALL_PIECE_IDS)
+    if searchBitboard(getGridMask(grid), unusedPiecesMask, placements, statistics=statistics):
+        for pieceID, config, squareIndex in placements:
+            packedPlacements[pieceID] = config * GRID_SIZE * GRID_SIZE + squareIndex
+    return SOLUTION_DATABASE_RECORD.pack(*packedPlacements, solutionsFound, statistics.nodes, getAverageBranching(statistics.depthNodes))
+
+def buildSolutionDatabase(path: str = SOLUTION_DATABASE_PATH, numberOfSeeds: int = NUMBER_OF_SEEDS, processes: int = 1, verbose: bool = False) -> None:
+    """
+    Solves the seeds [0, numberOfSeeds) and writes their records to a solution database.
+    The database is written to a temporary file first so an existing database is only replaced once the build is complete.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+        [OPTIONAL] STRING path
+        [OPTIONAL] INT numberOfSeeds : Only less than NUMBER_OF_SEEDS for partial databases, i.e. testing
+        [OPTIONAL] INT processes : Number of worker processes
+        [OPTIONAL] BOOL verbose : Print progress every 1000 seeds
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        None
     """
-    """  
-    0:
-         x
-       o o
-       o
-    1:
-         o
-       o x
-       o
-    2:
-         o
-       x o
-       o    
-    3:
-         o
-       o o
-       x    
-    4:
-       x
-       o o
-         o
-    5:
-       o
-       x o
-         o    
-    6:
-       o
-       o x
-         o    
-    7:
-       o
-       o o
-         x    
-    8:
-        x o
-          o o
-    9:
-        o x
-          o o    
-    10:
-        o o
-          x o    
-    11:
-        o o
-          o x    
-    12:
-         o x
-       o o
-    13:
-         x o
-       o o    
-    14:
-         o o
-       o x    
-    15:
-         o o
-       x o
-    """
-    match config:
-        case 0:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y+1][x] = Z_PIECE_ID  
-            grid[y+1][x-1] = Z_PIECE_ID  
-            grid[y+2][x-1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y+1), (x-1, y+1), (x-1, y+2)]
-        case 1:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y-1][x] = Z_PIECE_ID  
-            grid[y][x-1] = Z_PIECE_ID  
-            grid[y+1][x-1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y-1), (x-1, y), (x-1, y+1)]
-        case 2:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y+1][x] = Z_PIECE_ID  
-            grid[y][x+1] = Z_PIECE_ID  
-            grid[y-1][x+1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y+1), (x+1, y), (x+1, y-1)]
-        case 3:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y-1][x] = Z_PIECE_ID  
-            grid[y-1][x+1] = Z_PIECE_ID  
-            grid[y-2][x+1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y-1), (x+1, y-1), (x+1, y-2)]
-        case 4:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y+1][x] = Z_PIECE_ID  
-            grid[y+1][x+1] = Z_PIECE_ID  
-            grid[y+2][x+1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y+1), (x+1, y+1), (x+1, y+2)]
-        case 5:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y-1][x] = Z_PIECE_ID  
-            grid[y][x+1] = Z_PIECE_ID  
-            grid[y+1][x+1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y-1), (x+1, y), (x+1, y+1)]
-        case 6:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y+1][x] = Z_PIECE_ID  
-            grid[y][x-1] = Z_PIECE_ID  
-            grid[y-1][x-1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y+1), (x-1, y), (x-1, y-1)]
-        case 7:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y-1][x] = Z_PIECE_ID  
-            grid[y-1][x-1] = Z_PIECE_ID  
-            grid[y-2][x-1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x, y-1), (x-1, y-1), (x-1, y-2)]
-        case 8:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x+1] = Z_PIECE_ID  
-            grid[y+1][x+1] = Z_PIECE_ID  
-            grid[y+1][x+2] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x+1, y), (x+1, y+1), (x+2, y+1)]
-        case 9:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x-1] = Z_PIECE_ID  
-            grid[y+1][x] = Z_PIECE_ID  
-            grid[y+1][x+1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x-1, y), (x, y+1), (x+1, y+1)]
-        case 10:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x+1] = Z_PIECE_ID  
-            grid[y-1][x] = Z_PIECE_ID  
-            grid[y-1][x-1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x+1, y), (x, y-1), (x-1, y-1)]
-        case 11:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x-1] = Z_PIECE_ID 
-            grid[y-1][x-1] = Z_PIECE_ID 
-            grid[y-1][x-2] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x-1, y), (x-1, y-1), (x-2, y-1)]
-        case 12:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x-1] = Z_PIECE_ID  
-            grid[y+1][x-1] = Z_PIECE_ID 
-            grid[y+1][x-2] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x-1, y), (x-1, y+1), (x-2, y+1)]
-        case 13:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x+1] = Z_PIECE_ID  
-            grid[y+1][x] = Z_PIECE_ID  
-            grid[y+1][x-1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x+1, y), (x, y+1), (x-1, y+1)]
-        case 14:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x-1] = Z_PIECE_ID  
-            grid[y-1][x] = Z_PIECE_ID  
-            grid[y-1][x+1] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x-1, y), (x, y-1), (x+1, y-1)]
-        case 15:
-            grid[y][x] = Z_PIECE_ID  
-            grid[y][x+1] = Z_PIECE_ID  
-            grid[y-1][x+1] = Z_PIECE_ID  
-            grid[y-1][x+2] = Z_PIECE_ID
-            pieceCoordinates[Z_PIECE_ID] = [(x, y), (x+1, y), (x+1, y-1), (x+2, y-1)]
-            
-    return grid, pieceCoordinates
+    temporaryPath = path + ".tmp"
+    with open(temporaryPath, "wb") as file:
+        file.write(SOLUTION_DATABASE_HEADER.pack(SOLUTION_DATABASE_MAGIC, SOLUTION_DATABASE_VERSION, SOLUTION_DATABASE_RECORD.size, numberOfSeeds))
+        if processes > 1:
+            with multiprocessing.Pool(processes) as pool:
+                records = pool.imap(getSolutionDatabaseRecord, range(0, numberOfSeeds), chunksize=64)
+                for seedNumber, record in enumerate(records):
+                    file.write(record)
+                    if verbose and (seedNumber + 1) % 1000 == 0:
+                        print(f"{seedNumber + 1}/{numberOfSeeds} seeds solved", file=sys.stderr)
+        else:
+            for seedNumber in range(0, numberOfSeeds):
+                file.write(getSolutionDatabaseRecord(seedNumber))
+                if verbose and (seedNumber + 1) % 1000 == 0:
+                    print(f"{seedNumber + 1}/{numberOfSeeds} seeds solved", file=sys.stderr)
+    os.replace(temporaryPath, path)
+
+class SolutionDatabase:
+    """
+    Read only view of a solution database, memory-mapped so a lookup only reads the record it needs.
+    Raises ValueError if the file is not a solution database of the current version.
 
-def isMoveValidArrow(grid: list[list[int, int]], x: int, y: int, config: int) -> bool:
-    """ 
-    Validates whether an arrow can be placed onto a given grid at the given coordinates
+    Examples:
+        with SolutionDatabase() as database:
+            solution, solutionsFound, nodes, averageBranching = database.getRecordFromSeed("A1A2C3E1A4E4F1")
+    """
+
+    def __init__(self, path: str = SOLUTION_DATABASE_PATH) -> None:
+        """
+        Parameters:
+            [OPTIONAL] STRING path
+        """
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: #Empty file
+            self.file.close()
+            raise ValueError(f"{path} is not a solution database")
+
+        if len(self.data) < SOLUTION_DATABASE_HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a solution database")
+        magic, version, recordSize, self.numberOfRecords = SOLUTION_DATABASE_HEADER.unpack_from(self.data, 0)
+        if magic != SOLUTION_DATABASE_MAGIC or version != SOLUTION_DATABASE_VERSION or recordSize != SOLUTION_DATABASE_RECORD.size or len(self.data) != SOLUTION_DATABASE_HEADER.size + self.numberOfRecords * recordSize:
+            self.close()
+            raise ValueError(f"{path} is not a version {SOLUTION_DATABASE_VERSION} solution database")
+
+    def __len__(self) -> int:
+        return self.numberOfRecords
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exceptionInfo) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.data.close()
+        self.file.close()
+
+    def getRecord(self, seedNumber: int) -> tuple[tuple[tuple[int, int, int, int]], int, int, float]:
+        """
+        Returns the record of a given seed number.
+        Raises IndexError if the database has no record for the seed number.
+
+        Parameters:
+            INT seedNumber
+            
+        Returns:
+            TUPLE<TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution, INT solutionsFound, INT nodes, FLOAT averageBranching>
+            solution is sorted by pieceID, same format as iterSolutions(), and empty when the seed has no solution
+        """
+        if not 0 <= seedNumber < self.numberOfRecords:
+            raise IndexError(f"No record for seed number {seedNumber}")
+
+        *packedPlacements, solutionsFound, nodes, averageBranching = SOLUTION_DATABASE_RECORD.unpack_from(self.data, SOLUTION_DATABASE_HEADER.size + seedNumber * SOLUTION_DATABASE_RECORD.size)
+        solution = []
+        for pieceID, packedPlacement in zip(ALL_PIECE_IDS, packedPlacements):
+            if packedPlacement == SOLUTION_DATABASE_NO_PLACEMENT:
+                return (), solutionsFound, nodes, averageBranching
+            config, squareIndex = divmod(packedPlacement, GRID_SIZE * GRID_SIZE)
+            solution.append((pieceID, config, squareIndex % GRID_SIZE, squareIndex // GRID_SIZE))
+        return tuple(solution), solutionsFound, nodes, averageBranching
+
+    def getRecordFromSeed(self, seed: str) -> tuple[tuple[tuple[int, int, int, int]], int, int, float]:
+        """
+        Returns the record of a given seed, see getRecord().
+
+        Parameters:
+            STRING seed : 14 characters in the format XYXY..XY where X->A..F and Y->[1, 6]
+            
+        Returns:
+            TUPLE<TUPLE<TUPLE<INT, INT, INT, INT>>, INT, INT> record : None if the seed is invalid
+        """
+        seedNumber = getSeedNumber(seed)
+        if seedNumber is None:
+            return None
+        return self.getRecord(seedNumber)
+
+    def getSolution(self, seed: str) -> tuple[tuple[int, int, int, int]]:
+        """
+        Returns the first solution of a given seed without raising exceptions.
+
+        Parameters:
+            STRING seed
+            
+        Returns:
+            TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution : Empty if the seed is invalid or not in the database
+        """
+        seedNumber = getSeedNumber(seed)
+        if seedNumber is None or seedNumber >= self.numberOfRecords:
+            return ()
+        return self.getRecord(seedNumber)[0]
+
+def isPartOfSolution(pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int], solution: tuple[tuple[int, int, int, int]]) -> bool:
+    """
+    Checks whether every placed piece covers the same squares as it does in a given solution, hence the grid can still be completed.
+    Symmetric pieces match in any configuration covering the same squares.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        INT x
-        INT y
-        INT config
+        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
+        LIST<INT> unusedPiecesID
+        TUPLE<TUPLE<INT pieceID, INT config, INT x, INT y>> solution : Format of iterSolutions()
+        
     Returns:
         BOOL
-    """ 
-    """  
-    0:
-        x 
-        o o
-    1:
-        o 
-        x o    
-    2:
-        o 
-        o x    
-    3:
-        o o
-        x     
-    4:
-        x o
-        o   
-    5:
-        o x
-        o    
-    6:
-        x o
-          o   
-    7:
-        o x
-          o    
-    8:
-        o o
-          x    
-    9:
-          o
-        x o    
-    10:
-          o
-        o x    
-    11:
-          x
-        o o    
-    """
-    match config:
-        case 0:
-            if x < 0 or x > 4 or y < 0 or y > 4:
-                return False
-        case 1:
-            if x < 0 or x > 4 or y < 1 or y > 5:
-                return False
-        case 2:
-            if x < 1 or x > 5 or y < 1 or y > 5:
-                return False 
-        case 3:
-            if x < 0 or x > 4 or y < 1 or y > 5:
-                return False
-        case 4:
-            if x < 0 or x > 4 or y < 0 or y > 4:
-                return False
-        case 5:
-            if x < 1 or x > 5 or y < 0 or y > 4:
-                return False 
-        case 6:
-            if x < 0 or x > 4 or y < 0 or y > 4:
-                return False
-        case 7:
-            if x < 1 or x > 5 or y < 0 or y > 4:
-                return False
-        case 8:
-            if x < 1 or x > 5 or y < 1 or y > 5:
-                return False 
-        case 9:
-            if x < 0 or x > 4 or y < 1 or y > 5:
-                return False
-        case 10:
-            if x < 1 or x > 5 or y < 1 or y > 5:
-                return False
-        case 11:
-            if x < 1 or x > 5 or y < 0 or y > 4:
-                return False 
-                                                
-    match config:
-        case 0:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 1:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID:    
-                return False
-        case 2:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 3:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID: 
-                return False
-        case 4:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID:
-                return False
-        case 5:
-            if grid[y][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID:    
-                return False
-        case 6:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y+1][x+1] != EMPTY_ID:
-                return False
-        case 7:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID: 
-                return False
-        case 8:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y-1][x-1] != EMPTY_ID:
-                return False
-        case 9:
-            if grid[y][x] != EMPTY_ID or grid[y][x+1] != EMPTY_ID or grid[y-1][x+1] != EMPTY_ID:  
-                return False  
-        case 10:
-            if grid[y][x] != EMPTY_ID or grid[y-1][x] != EMPTY_ID or grid[y][x-1] != EMPTY_ID:
-                return False
-        case 11:
-            if grid[y][x] != EMPTY_ID or grid[y+1][x] != EMPTY_ID or grid[y+1][x-1] != EMPTY_ID: 
-                return False
-                    
+    """
+    if not solution:
+        return False
+    for pieceID, config, x, y in solution:
+        if pieceID in unusedPiecesID:
+            continue
+        solutionCoordinates = {(x + offsetX, y + offsetY) for offsetX, offsetY in PIECE_CONFIGURATION_OFFSETS[pieceID][config]}
+        if pieceCoordinates[pieceID] is None or set(pieceCoordinates[pieceID]) != solutionCoordinates:
+            return False
     return True
 
-def placeArrowOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], x: int, y: int, config: int) -> tuple[list[list[int, int]], dict[int, tuple[int, int]]]:
-    """ 
-    Places an arrow onto a given grid at the given coordinates
+def openSolutionDatabase(path: str = SOLUTION_DATABASE_PATH) -> SolutionDatabase:
+    """
+    Opens the solution database if it has been built, without raising exceptions.
 
     Parameters:
-        LIST<LIST<INT, INT>> grid
-        DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-        INT x
-        INT y
-        INT config
+        [OPTIONAL] STRING path
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
+        SolutionDatabase database : None if there is no valid database at path
     """
-    """  
-    0:
-        x 
-        o o
-    1:
-        o 
-        x o    
-    2:
-        o 
-        o x    
-    3:
-        o o
-        x     
-    4:
-        x o
-        o   
-    5:
-        o x
-        o    
-    6:
-        x o
-          o   
-    7:
-        o x
-          o    
-    8:
-        o o
-          x    
-    9:
-          o
-        x o    
-    10:
-          o
-        o x    
-    11:
-          x
-        o o    
-    """
-    match config:
-        case 0:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y+1][x] = ARROW_PIECE_ID  
-            grid[y+1][x+1] = ARROW_PIECE_ID
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y+1), (x+1, y+1)]
-        case 1:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y-1][x] = ARROW_PIECE_ID  
-            grid[y][x+1] = ARROW_PIECE_ID    
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y-1), (x+1, y)]
-        case 2:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y][x-1] = ARROW_PIECE_ID  
-            grid[y-1][x-1] = ARROW_PIECE_ID
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x-1, y), (x-1, y-1)]
-        case 3:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y-1][x] = ARROW_PIECE_ID  
-            grid[y-1][x+1] = ARROW_PIECE_ID 
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y-1), (x+1, y-1)]
-        case 4:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y+1][x] = ARROW_PIECE_ID  
-            grid[y][x+1] = ARROW_PIECE_ID
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y+1), (x+1, y)]
-        case 5:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y][x-1] = ARROW_PIECE_ID  
-            grid[y+1][x-1] = ARROW_PIECE_ID    
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x-1, y), (x-1, y+1)]
-        case 6:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y][x+1] = ARROW_PIECE_ID  
-            grid[y+1][x+1] = ARROW_PIECE_ID
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x+1, y), (x+1, y+1)]
-        case 7:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y+1][x] = ARROW_PIECE_ID  
-            grid[y][x-1] = ARROW_PIECE_ID 
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y+1), (x-1, y)]
-        case 8:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y-1][x] = ARROW_PIECE_ID  
-            grid[y-1][x-1] = ARROW_PIECE_ID
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y-1), (x-1, y-1)]
-        case 9:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y][x+1] = ARROW_PIECE_ID  
-            grid[y-1][x+1] = ARROW_PIECE_ID  
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x+1, y), (x+1, y-1)]  
-        case 10:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y-1][x] = ARROW_PIECE_ID  
-            grid[y][x-1] = ARROW_PIECE_ID
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y-1), (x-1, y)]
-        case 11:
-            grid[y][x] = ARROW_PIECE_ID  
-            grid[y+1][x] = ARROW_PIECE_ID  
-            grid[y+1][x-1] = ARROW_PIECE_ID 
-            pieceCoordinates[ARROW_PIECE_ID] = [(x, y), (x, y+1), (x-1, y+1)]
-            
-    return grid, pieceCoordinates
+    try:
+        return SolutionDatabase(path)
+    except (OSError, ValueError):
+        return None
 
-def isMoveValid(grid: list[list[int, int]], pieceID: int, x: int, y: int, config: int) -> bool:
-    """ 
-    Returns whether a given pieceID with a given config is able to be placed at a given coordinate on a given grid.
-    
-    Parameters:
-    LIST<LIST<INT, INT>> grid
-    INT pieceID : [0, 8]
-    INT x : [0, 5]
-    INT y : [0, 5]
-    INT config
-    
-    Returns:
-        BOOL
+def getAverageBranching(depthNodes: list[int]) -> float:
     """
-    
-    """ 
-    Within the match statement, 'x' describes the origin square of a piece, while 'o' describes a non-origin part of the piece. 
-    For example a three by one line: x o o
-    """ 
-    match pieceID:
-        case 0: #Small Square
-            return isMoveValidSmallSquare(grid, x, y)
-        case 1: #Big Square
-            return isMoveValidBigSquare(grid, x, y, config)
-        case 2: #Short Bar
-            return isMoveValidShortBar(grid, x, y, config)
-        case 3: #Bar
-            return isMoveValidBar(grid, x, y, config)
-        case 4: #Long Bar
-            return isMoveValidLongBar(grid, x, y, config) 
-        case 5: #L
-            return isMoveValidL(grid, x, y, config)   
-        case 6: #T 
-            return isMoveValidT(grid, x, y, config)    
-        case 7: #Z
-            return isMoveValidZ(grid, x, y, config)
-        case 8: #Arrow
-            return isMoveValidArrow(grid, x, y, config)
+    Returns the average branching of a search from the nodes it expanded at each depth, see SolverStatistics.depthNodes.
+    Every node at depth d + 1 is a child of a node at depth d, so depthNodes[d + 1] / depthNodes[d] is the mean number of children at depth d.
+    The mean is taken over every depth the search reached, dead ends included, hence it reflects branching throughout the search rather than at the root.
 
-def placePieceOnGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], pieceID: int, x: int, y: int, config: int) -> list[list[list[int]], dict[int, tuple[int, int]]]: 
-    """ 
-    Updates the grid by setting the given piece onto the grid..
-    Parameters are validated within functions calling placePieceOnGrid()
-    
     Parameters:
-    LIST<LIST<INT, INT>> grid
-    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-    INT pieceID : [0, 8]
-    INT x : [0, 5]
-    INT y : [0, 5]
-    INT config
-    
+        LIST<INT> depthNodes
+        
     Returns:
-        TUPLE<LIST<LIST<INT, INT>> grid, DICT<INT, TUPLE<INT, INT>> pieceCoordinates>
-    """    
+        FLOAT averageBranching : 0.0 if no node had a child
+    
+    Examples:
+        getAverageBranching([1, 2, 4, 1]) -> (2 + 2 + 0.25) / 3
     """
-    Within the match statement, 'x' describes the origin square of a piece, while 'o' describes a non-origin part of the piece. 
-    For example a three by one line: x o o
-    """
-    match pieceID:
-        case 0: #Small Square
-            grid, pieceCoordinates = placeSmallSquareOnGrid(grid, pieceCoordinates, x, y)
-        case 1: #Big Square
-            grid, pieceCoordinates = placeBigSquareOnGrid(grid, pieceCoordinates, x, y, config)
-        case 2: #Short Bar
-            grid, pieceCoordinates = placeShortBarOnGrid(grid, pieceCoordinates, x, y, config)
-        case 3: #Bar
-            grid, pieceCoordinates = placeBarOnGrid(grid, pieceCoordinates, x, y, config)
-        case 4: #Long Bar
-            grid, pieceCoordinates = placeLongBarOnGrid(grid, pieceCoordinates, x, y, config)       
-        case 5: #L
-            grid, pieceCoordinates = placeLOnGrid(grid, pieceCoordinates, x, y, config)
-        case 6: #T 
-            grid, pieceCoordinates = placeTOnGrid(grid, pieceCoordinates, x, y, config)
-        case 7: #Z
-            grid, pieceCoordinates = placeZOnGrid(grid, pieceCoordinates, x, y, config)  
-        case 8: #Arrow 
-            grid, pieceCoordinates = placeArrowOnGrid(grid, pieceCoordinates, x, y, config)
+    ratios = [depthNodes[depth + 1] / depthNodes[depth] for depth in range(0, len(depthNodes) - 1) if depthNodes[depth] > 0]
+    if not ratios:
+        return 0.0
+    return sum(ratios) / len(ratios)
 
-    return grid, pieceCoordinates
+def getDifficultyScore(solutionsFound: int, nodes: int, averageBranching: float) -> float:
+    """
+    Rates how hard a grid is, higher is harder.
+    Hard grids take many search nodes to solve, branch widely at every depth of the search and have few solutions.
 
-def removePieceFromGrid(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], pieceID: int) -> list[list[int]]:
-    """ 
-    Updates the grid by removing the given piece from the grid.
-    piece is validated within function calling removePieceFromGrid().
-    
     Parameters:
-    LIST<LIST<INT, INT>> grid
-    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-    INT pieceID : [0, 8]
-    
+        INT solutionsFound
+        INT nodes : Search nodes of BITBOARD_ENGINE with FIRST_EMPTY_SQUARE_BRANCHING, as stored in the solution database
+        FLOAT averageBranching : Of the same search, see getAverageBranching()
+        
     Returns:
-        LIST<LIST<INT, INT>> grid
+        FLOAT score
     """
-    for coordinates in pieceCoordinates[pieceID]:
-        grid[coordinates[1]][coordinates[0]] = EMPTY_ID
-    return grid
-                   
-def printGrid(grid: list[list[int, int]]) -> None:
+    return DIFFICULTY_NODE_WEIGHT * math.log2(max(nodes, 1)) + DIFFICULTY_BRANCHING_WEIGHT * math.log2(1 + averageBranching) - DIFFICULTY_SOLUTION_WEIGHT * math.log2(max(solutionsFound, 1))
+
+def buildDifficultyIndex(path: str = DIFFICULTY_INDEX_PATH, databasePath: str = SOLUTION_DATABASE_PATH, numberOfBands: int = DEFAULT_DIFFICULTY_BANDS) -> None:
     """
-    Prints the terminal representation of the 2D list representing the grid
+    Rates every seed in the solution database and writes the difficulty index.
+    Nothing is solved, so the index can be rebuilt in seconds whenever getDifficultyScore() changes.
+    Raises ValueError if there is no valid solution database at databasePath.
 
     Parameters:
-        None
+        [OPTIONAL] STRING path
+        [OPTIONAL] STRING databasePath
+        [OPTIONAL] INT numberOfBands
         
     Returns:
         None
-    """    
-    for y in range(0, 6):
-        for x in range(0, 6):
-            if x == 5: #include escape character \n
-                if grid[y][x] == BLOCKER_ID:
-                    print("#") 
-                elif grid[y][x] == EMPTY_ID:
-                    print("~") 
-                else:
-                    print(grid[y][x]) 
-            else:
-                if grid[y][x] == BLOCKER_ID:
-                    print("#", end=" ") 
-                elif grid[y][x] == EMPTY_ID:
-                    print("~", end=" ") 
-                else:
-                    print(grid[y][x], end=" ") 
-    print("")          
-    
-def getEmptySquareCoordinates(grid: list[list[int, int]]) -> tuple[int]:
     """
-    Searches the grid representation for an element with value of EMPTY_ID, if not found returns invalid coordinates
+    with SolutionDatabase(databasePath) as database:
+        numberOfSeeds = len(database)
+        if not 0 < numberOfBands <= numberOfSeeds:
+            raise ValueError(f"Cannot split {numberOfSeeds} seeds into {numberOfBands} bands")
+        scores = array("f")
+        records = SOLUTION_DATABASE_RECORD.iter_unpack(memoryview(database.data)[SOLUTION_DATABASE_HEADER.size:])
+        for *packedPlacements, solutionsFound, nodes, averageBranching in records:
+            scores.append(getDifficultyScore(solutionsFound, nodes, averageBranching))
+        del records #Releases the memoryview so the database can be closed
+
+    sortedSeedNumbers = array("I", sorted(range(0, numberOfSeeds), key=scores.__getitem__))
+    bandStarts = array("I", [band * numberOfSeeds // numberOfBands for band in range(0, numberOfBands + 1)])
+    bands = array("B", bytes(numberOfSeeds))
+    for band in range(0, numberOfBands):
+        for seedNumber in sortedSeedNumbers[bandStarts[band]:bandStarts[band + 1]]:
+            bands[seedNumber] = band
+
+    temporaryPath = path + ".tmp"
+    with open(temporaryPath, "wb") as file:
+        file.write(DIFFICULTY_INDEX_HEADER.pack(DIFFICULTY_INDEX_MAGIC, DIFFICULTY_INDEX_VERSION, numberOfBands, numberOfSeeds))
+        for table in (bandStarts, sortedSeedNumbers, scores, bands):
+            if sys.byteorder == "big":
+                table.byteswap()
+            table.tofile(file)
+    os.replace(temporaryPath, path)
+
+class DifficultyIndex:
+    """
+    Read only view of a difficulty index, loaded into arrays so every look up is O(1).
+    Raises ValueError if the file is not a difficulty index of the current version.
+
+    Examples:
+        index = DifficultyIndex()
+        index.getRandomSeed(index.numberOfBands - 1) -> One of the hardest seeds
+    """
+
+    def __init__(self, path: str = DIFFICULTY_INDEX_PATH) -> None:
+        """
+        Parameters:
+            [OPTIONAL] STRING path
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < DIFFICULTY_INDEX_HEADER.size:
+            raise ValueError(f"{path} is not a difficulty index")
+        magic, version, self.numberOfBands, self.numberOfSeeds = DIFFICULTY_INDEX_HEADER.unpack_from(data, 0)
+        bandStartsEnd = DIFFICULTY_INDEX_HEADER.size + 4 * (self.numberOfBands + 1)
+        sortedSeedNumbersEnd = bandStartsEnd + 4 * self.numberOfSeeds
+        scoresEnd = sortedSeedNumbersEnd + 4 * self.numberOfSeeds
+        if magic != DIFFICULTY_INDEX_MAGIC or version != DIFFICULTY_INDEX_VERSION or len(data) != scoresEnd + self.numberOfSeeds:
+            raise ValueError(f"{path} is not a version {DIFFICULTY_INDEX_VERSION} difficulty index")
+
+        tables = []
+        for start, end, typecode in ((DIFFICULTY_INDEX_HEADER.size, bandStartsEnd, "I"), (bandStartsEnd, sortedSeedNumbersEnd, "I"), (sortedSeedNumbersEnd, scoresEnd, "f"), (scoresEnd, len(data), "B")):
+            table = array(typecode, data[start:end])
+            if sys.byteorder == "big":
+                table.byteswap()
+            tables.append(table)
+        self.bandStarts, self.sortedSeedNumbers, self.scores, self.bands = tables
+
+    def __len__(self) -> int:
+        return self.numberOfSeeds
+
+    def getBand(self, seedNumber: int) -> int:
+        """
+        Returns the difficulty band of a given seed number, raises IndexError if it is not in the index.
+
+        Parameters:
+            INT seedNumber
+            
+        Returns:
+            INT band : [0, numberOfBands)
+        """
+        return self.bands[seedNumber]
+
+    def getScore(self, seedNumber: int) -> float:
+        """
+        Returns the difficulty score of a given seed number, raises IndexError if it is not in the index.
+
+        Parameters:
+            INT seedNumber
+            
+        Returns:
+            FLOAT score
+        """
+        return self.scores[seedNumber]
+
+    def getSeedNumbersInBand(self, band: int) -> array:
+        """
+        Returns the seed numbers in a given band, easiest first, raises IndexError if there is no such band.
+
+        Parameters:
+            INT band
+            
+        Returns:
+            ARRAY<INT> seedNumbers
+        """
+        if not 0 <= band < self.numberOfBands:
+            raise IndexError(f"No difficulty band {band}")
+        return self.sortedSeedNumbers[self.bandStarts[band]:self.bandStarts[band + 1]]
+
+    def getRandomSeed(self, band: int) -> str:
+        """
+        Returns a random seed in a given band, raises IndexError if there is no such band.
+
+        Parameters:
+            INT band
+            
+        Returns:
+            STRING seed
+        """
+        if not 0 <= band < self.numberOfBands:
+            raise IndexError(f"No difficulty band {band}")
+        return getSeedFromNumber(self.sortedSeedNumbers[random.randrange(self.bandStarts[band], self.bandStarts[band + 1])])
+
+def openDifficultyIndex(path: str = DIFFICULTY_INDEX_PATH) -> DifficultyIndex:
+    """
+    Opens the difficulty index if it has been built, without raising exceptions.
 
     Parameters:
-        None
+        [OPTIONAL] STRING path
         
     Returns:
-        TUPLE<INT>
-    """   
-    for y in range(0, len(grid)):
-        for x in range(0, len(grid[0])):
-            if grid[y][x] == EMPTY_ID:
-                return (x, y)
-    return (-1, -1)
+        DifficultyIndex index : None if there is no valid index at path
+    """
+    try:
+        return DifficultyIndex(path)
+    except (OSError, ValueError):
+        return None
 
-def findSolution(grid: list[list[int, int]], pieceCoordinates: dict[int, tuple[int, int]], unusedPiecesID: list[int]) -> bool:
+def solveSeed(seed: str, engine: int = BITBOARD_ENGINE, branching: int = FIRST_EMPTY_SQUARE_BRANCHING, includeStatistics: bool = False) -> dict:
     """
-    Uses a backtracking algorithm to search for a single solution on a given grid configuration
+    Solves the grid of a given seed, returning a JSON serialisable result.
 
     Parameters:
-    LIST<LIST<INT, INT>> grid
-    DICT<INT, TUPLE<INT, INT>> pieceCoordinates
-    LIST<INT> unusedPiecesID
+        STRING seed
+        [OPTIONAL] INT engine
+        [OPTIONAL] INT branching
+        [OPTIONAL] BOOL includeStatistics : Add every SolverStatistics counter under "statistics"
         
     Returns:
-        BOOL
-    """     
-    if len(unusedPiecesID) == 0:
-        return True
-    
-    emptySquare = getEmptySquareCoordinates(grid)
-    for pieceID in unusedPiecesID:
-        for config in PIECE_CONFIGURATIONS[pieceID]:
-            if isMoveValid(grid, pieceID, emptySquare[0], emptySquare[1], config):
-                grid, pieceCoordinates = placePieceOnGrid(grid, pieceCoordinates, pieceID, emptySquare[0], emptySquare[1], config)
-                unusedPiecesID.remove(pieceID)
-                
-                if findSolution(grid, pieceCoordinates, unusedPiecesID):
-                    return True
-                
-                grid = removePieceFromGrid(grid, pieceCoordinates, pieceID)
-                pieceCoordinates[pieceID] = None
-                unusedPiecesID.insert(0, pieceID)
-                unusedPiecesID.sort()
+        DICT result : "seed", "solved", "placements" as [pieceID, config, x, y] sorted by pieceID, "nodes" (None for DANCING_LINKS_ENGINE)
+                      and "time" in seconds, or "seed", "solved" and "error" if the seed is invalid
+    """
+    seedNumber = getSeedNumber(seed)
+    if seedNumber is None:
+        return {"seed": seed, "solved": False, "error": "Invalid seed"}
+
+    grid = initaliseBlockers(deepcopy(EMPTY_GRID), getBlockersFromSeedNumber(seedNumber))
+    pieceCoordinates = deepcopy(DEFAULT_PIECE_COORDINATES)
+    unusedPiecesID = deepcopy(ALL_PIECE_IDS)
+    statistics = SolverStatistics() if engine != DANCING_LINKS_ENGINE else None
+    start = time.perf_counter()
+    solved = findSolution(grid, pieceCoordinates, unusedPiecesID, engine, branching, statistics=statistics)
+    wallTime = time.perf_counter() - start
+
+    placements = []
+    if solved:
+        for pieceID in ALL_PIECE_IDS:
+            config, x, y = getPiecePlacement(pieceID, pieceCoordinates[pieceID])
+            placements.append([pieceID, config, x, y])
+    result = {"seed": seed, "solved": solved, "placements": placements, "nodes": statistics.nodes if statistics is not None else None, "time": wallTime}
+    if includeStatistics and statistics is not None:
+        result["statistics"] = statistics.toDict()
+    return result
+
+def solveSeeds(seeds, processes: int = 1, chunkSize: int = 64, ordered: bool = True, engine: int = BITBOARD_ENGINE, branching: int = FIRST_EMPTY_SQUARE_BRANCHING, includeStatistics: bool = False):
+    """
+    Solves a batch of seeds with solveSeed(), spreading chunks of seeds across a pool of worker processes.
+    Seeds are read in batches of BATCH_CHUNKS_PER_PROCESS chunks per process, with at most two batches in flight,
+    and results are yielded as soon as they are available, so neither the input nor the results have to fit in memory.
+
+    Parameters:
+        ITERABLE<STRING> seeds
+        [OPTIONAL] INT processes : Solved in this process when 1
+        [OPTIONAL] INT chunkSize : Number of seeds sent to a worker at a time
+        [OPTIONAL] BOOL ordered : Yield results in input order, otherwise in completion order within each batch of processes * chunkSize * BATCH_CHUNKS_PER_PROCESS seeds
+        [OPTIONAL] INT engine
+        [OPTIONAL] INT branching
+        [OPTIONAL] BOOL includeStatistics
+        
+    Yields:
+        DICT result
+    """
+    solve = partial(solveSeed, engine=engine, branching=branching, includeStatistics=includeStatistics)
+    if processes <= 1:
+        yield from map(solve, seeds)
+        return
+
+    seeds = iter(seeds)
+    batchSize = processes * chunkSize * BATCH_CHUNKS_PER_PROCESS
+    with multiprocessing.Pool(processes) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        previousResults = None
+        while True:
+            batch = list(islice(seeds, batchSize))
+            results = imap(solve, batch, chunkSize) if batch else None #Queued before the previous batch is drained, so workers never wait
+            if previousResults is not None:
+                yield from previousResults
+            if results is None:
+                return
+            previousResults = results
+
+def main(arguments: list[str] = None) -> None:
+    """
+    Command line entry point.
 
-    return False
\ No newline at end of file
+    Parameters:
+        [OPTIONAL] LIST<STRING> arguments : Defaults to sys.argv
+        
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(prog="GeniusSquareSolver.py", description="Genius Square solver tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    buildParser = subparsers.add_parser("build-database", help="Solve every seed and write the solution database")
+    buildParser.add_argument("path", nargs="?", default=SOLUTION_DATABASE_PATH)
+    buildParser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    buildParser.add_argument("--seeds", type=int, default=NUMBER_OF_SEEDS, help="Only solve the first SEEDS seed numbers")
+
+    difficultyParser = subparsers.add_parser("build-difficulty-index", help="Rate every seed in the solution database and write the difficulty index")
+    difficultyParser.add_argument("path", nargs="?", default=DIFFICULTY_INDEX_PATH)
+    difficultyParser.add_argument("--database", default=SOLUTION_DATABASE_PATH)
+    difficultyParser.add_argument("--bands", type=int, default=DEFAULT_DIFFICULTY_BANDS)
+
+    batchParser = subparsers.add_parser("batch", help="Solve seeds read one per line, writing one JSON result per line")
+    batchParser.add_argument("input", nargs="?", default="-", help="File of seeds, - for stdin")
+    batchParser.add_argument("--all", action="store_true", help="Solve every seed instead of reading input")
+    batchParser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    batchParser.add_argument("--chunk-size", type=int, default=64)
+    batchParser.add_argument("--unordered", action="store_true", help="Write results in completion order within each batch of processes * chunk size * %d seeds" % BATCH_CHUNKS_PER_PROCESS)
+    batchParser.add_argument("--engine", choices=BATCH_ENGINES.keys(), default="bitboard")
+    batchParser.add_argument("--branching", choices=BATCH_BRANCHINGS.keys(), default="first-empty")
+    batchParser.add_argument("--statistics", action="store_true", help="Include every search statistic in the results")
+
+    parsedArguments = parser.parse_args(arguments)
+    if parsedArguments.command == "build-database":
+        buildSolutionDatabase(parsedArguments.path, parsedArguments.seeds, parsedArguments.processes, verbose=True)
+    elif parsedArguments.command == "build-difficulty-index":
+        buildDifficultyIndex(parsedArguments.path, parsedArguments.database, parsedArguments.bands)
+    elif parsedArguments.command == "batch":
+        if parsedArguments.all:
+            inputContext = nullcontext()
+        elif parsedArguments.input == "-":
+            inputContext = nullcontext(sys.stdin) #Left open
+        else:
+            inputContext = open(parsedArguments.input)
+
+        with inputContext as inputFile:
+            if inputFile is None:
+                seeds = map(getSeedFromNumber, range(0, NUMBER_OF_SEEDS))
+            else:
+                seeds = (line.strip().upper() for line in inputFile if line.strip())
+            results = solveSeeds(seeds, parsedArguments.processes, parsedArguments.chunk_size, not parsedArguments.unordered, BATCH_ENGINES[parsedArguments.engine], BATCH_BRANCHINGS[parsedArguments.branching], parsedArguments.statistics)
+            for result in results:
+                sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@
 Unit testing for the Genius Square Solver
 """
 
+import os
+import tempfile
+import threading
+import time
 import unittest
 import GeniusSquareSolver as ggs
 
@@ -139,6 +143,40 @@ class TestGeniusSquareSolver(unittest.TestCase):
         
         self.assertEqual(test, True)
         
+    def test_getPieceConfigurationOffsets(self):
+        #Standard Test Case: Every configuration covers its shape with the origin first and no two configurations are the same
+        for pieceID in ggs.ALL_PIECE_IDS:
+            configurations = set()
+            for offsets in ggs.PIECE_CONFIGURATION_OFFSETS[pieceID]:
+                self.assertEqual(len(offsets), len(ggs.PIECE_SHAPES[pieceID]))
+                self.assertEqual(offsets[0], (0, 0))
+                configurations.add(frozenset(offsets))
+            self.assertEqual(len(configurations), len(ggs.PIECE_CONFIGURATIONS[pieceID]))
+
+        #Standard Test Case
+        self.assertEqual(set(ggs.PIECE_CONFIGURATION_OFFSETS[ggs.L_PIECE_ID][8]), {(0, 0), (-1, 0), (-1, 1), (-1, 2)})
+        self.assertEqual(set(ggs.PIECE_CONFIGURATION_OFFSETS[ggs.T_PIECE_ID][13]), {(0, 0), (1, -1), (1, 0), (1, 1)})
+
+    def test_getCanonicalPieceConfigurations(self):
+        #Standard Test Case: One configuration per distinct orientation, placed by its first square in row-major order
+        expectedCounts = [1, 1, 2, 2, 2, 8, 4, 4, 4]
+        for pieceID in ggs.ALL_PIECE_IDS:
+            configurations = ggs.CANONICAL_PIECE_CONFIGURATIONS[pieceID]
+            self.assertEqual(len(configurations), expectedCounts[pieceID])
+            for config in configurations:
+                offsets = ggs.PIECE_CONFIGURATION_OFFSETS[pieceID][config]
+                self.assertEqual(min(offsets, key=lambda offset: (offset[1], offset[0])), (0, 0))
+
+    def test_isMoveValid(self):
+        #Standard Test Case
+        self.assertTrue(ggs.isMoveValid(helperGetSingleBlockerGrid(), ggs.L_PIECE_ID, 1, 0, 0))
+        #Erroneous Test Case: Occupied square
+        self.assertFalse(ggs.isMoveValid(helperGetSingleBlockerGrid(), ggs.BIG_SQUARE_PIECE_ID, 0, 0, 0))
+        #Boundary Test Case: Piece must not wrap around the edge of the grid
+        self.assertFalse(ggs.isMoveValid(helperGetEmptyGrid(), ggs.BAR_PIECE_ID, 0, 0, 3))
+        self.assertFalse(ggs.isMoveValid(helperGetEmptyGrid(), ggs.T_PIECE_ID, 5, 2, 13))
+        self.assertTrue(ggs.isMoveValid(helperGetEmptyGrid(), ggs.T_PIECE_ID, 4, 2, 13))
+        
     def test_getEmptySquareCoordinates(self):
         #Standard Test Case
         grid = [
@@ -177,6 +215,764 @@ class TestGeniusSquareSolver(unittest.TestCase):
                                         self.fail(f"Failed to solve {seed}")
                                     existingSolutions[seed] = solution
         self.assertTrue(True) 
+
+        #Standard Test Case: Grid engine leaves the unused pieces untouched unless it finds a solution
+        grid = [[X if (x + y) % 2 == 0 else O for x in range(0, 6)] for y in range(0, 6)]
+        unusedPiecesID = [ggs.Z_PIECE_ID, ggs.BIG_SQUARE_PIECE_ID]
+        self.assertFalse(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), unusedPiecesID))
+        self.assertEqual(unusedPiecesID, [ggs.Z_PIECE_ID, ggs.BIG_SQUARE_PIECE_ID])
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+        self.assertTrue(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), unusedPiecesID))
+        self.assertEqual(unusedPiecesID, [])
+
+    def test_getGridMask(self):
+        #Standard Test Case
+        grid = helperGetSingleBlockerGrid()
+        grid[5][5] = X
+        grid[0][1] = ggs.SMALL_SQUARE_PIECE_ID
+        self.assertEqual(ggs.getGridMask(grid), (1 << 35) | 0b11)
+        #Boundary Test Case
+        self.assertEqual(ggs.getGridMask(helperGetEmptyGrid()), 0)
+
+    def test_getPiecesMask(self):
+        #Standard Test Case: Round trips through the mask, listed in ascending order
+        piecesID = [ggs.Z_PIECE_ID, ggs.SMALL_SQUARE_PIECE_ID, ggs.BAR_PIECE_ID]
+        piecesMask = ggs.getPiecesMask(piecesID)
+        self.assertEqual(piecesMask, (1 << ggs.Z_PIECE_ID) | (1 << ggs.SMALL_SQUARE_PIECE_ID) | (1 << ggs.BAR_PIECE_ID))
+        self.assertEqual(ggs.getPiecesID(piecesMask), sorted(piecesID))
+        self.assertEqual(ggs.PIECE_MASK_ORDER[piecesMask], tuple(sorted(piecesID)))
+        #Boundary Test Case: No pieces and every piece
+        self.assertEqual(ggs.getPiecesMask([]), 0)
+        self.assertEqual(ggs.getPiecesID(0), [])
+        self.assertEqual(ggs.getPiecesMask(ggs.ALL_PIECE_IDS), ggs.ALL_PIECES_MASK)
+        self.assertEqual(ggs.getPiecesID(ggs.ALL_PIECES_MASK), ggs.ALL_PIECE_IDS)
+
+    @unittest.skipIf(ggs.numpy is None, "NumPy is not installed")
+    def test_getLegalPlacementMatrix(self):
+        seedNumbers = [0, 1234, ggs.NUMBER_OF_SEEDS - 1]
+        boards = ggs.numpy.array(ggs.getBlockerMasksFromSeedNumbers(seedNumbers), dtype=ggs.numpy.uint64)
+        #Standard Test Case: Matches the scalar checks
+        legal = ggs.getLegalPlacementMatrix(boards)
+        self.assertEqual(legal.shape, (len(seedNumbers), len(ggs.ALL_PLACEMENTS)))
+        for n, seedNumber in enumerate(seedNumbers):
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getBlockersFromSeedNumber(seedNumber))
+            for placementIndex, (pieceID, config, squareIndex, mask) in enumerate(ggs.ALL_PLACEMENTS):
+                self.assertEqual(legal[n][placementIndex], ggs.isMoveValid(grid, pieceID, squareIndex % 6, squareIndex // 6, config))
+            self.assertEqual(ggs.getFirstEmptySquares(boards)[n], ggs.getEmptySquareCoordinates(grid)[1] * 6 + ggs.getEmptySquareCoordinates(grid)[0])
+        #Standard Test Case: Used pieces are never legal
+        legal = ggs.getLegalPlacementMatrix(boards, ggs.numpy.full(len(seedNumbers), 1 << ggs.L_PIECE_ID, dtype=ggs.numpy.uint64))
+        self.assertFalse(legal[:, ggs.NUMPY_PLACEMENT_PIECE_IDS != ggs.L_PIECE_ID].any())
+        #Boundary Test Case: Full board
+        self.assertEqual(list(ggs.getFirstEmptySquares([ggs.FULL_GRID_MASK, 0])), [-1, 0])
+
+    @unittest.skipIf(ggs.numpy is None, "NumPy is not installed")
+    def test_expandFrontier(self):
+        #Standard Test Case: Expanding every piece leaves one board per solution
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        boards = ggs.numpy.array([ggs.getGridMask(grid)], dtype=ggs.numpy.uint64)
+        unusedPiecesMasks = ggs.numpy.array([ggs.ALL_PIECES_MASK], dtype=ggs.numpy.uint64)
+        boards, unusedPiecesMasks, parents, placementIndices = ggs.expandFrontier(boards, unusedPiecesMasks)
+        self.assertEqual(list(parents), [0] * len(parents))
+        self.assertEqual(len(boards), len(ggs.IterativeSolver(grid).getCandidates(0)))
+        for _ in ggs.ALL_PIECE_IDS[1:]:
+            boards, unusedPiecesMasks = ggs.expandFrontier(boards, unusedPiecesMasks)[:2]
+        self.assertEqual(len(boards), ggs.countSolutions(grid))
+        self.assertTrue((boards == ggs.FULL_GRID_MASK).all())
+        self.assertTrue((unusedPiecesMasks == 0).all())
+        #Boundary Test Case: Empty frontier
+        self.assertEqual(len(ggs.expandFrontier([], [])[0]), 0)
+
+    @unittest.skipIf(ggs.numpy is not None, "NumPy is installed")
+    def test_checkNumpy(self):
+        #Erroneous Test Case: Batch functions need NumPy
+        self.assertRaises(ImportError, ggs.getLegalPlacementMatrix, [0])
+
+    def test_findSolutionBitboard(self):
+        #Standard Test Case: Bitboard engine finds the same solution as the grid engine
+        for seed in ["A1A2C3E1A4E4F1", "B1F1D2F2C3A4E6", "F3B3C3B6C6D5F1"]:
+            results = []
+            for engine in [ggs.GRID_ENGINE, ggs.BITBOARD_ENGINE]:
+                grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls(seed))
+                pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+                unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+                solution = ggs.findSolution(grid, pieceCoordinates, unusedPiecesID, engine)
+                results.append((solution, grid, pieceCoordinates, unusedPiecesID))
+            self.assertTrue(results[1][0])
+            self.assertEqual(results[0], results[1])
+
+        #Erroneous Test Case: Grid left untouched when there is no solution
+        grid = helperGetEmptyGrid()
+        grid[0] = [X, X, X, X, X, X]
+        grid[1] = [X, X, X, X, X, X]
+        expectedGrid = ggs.deepcopy(grid)
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+        self.assertFalse(ggs.findSolution(grid, pieceCoordinates, unusedPiecesID, ggs.BITBOARD_ENGINE))
+        self.assertEqual(grid, expectedGrid)
+        self.assertEqual(unusedPiecesID, ggs.ALL_PIECE_IDS)
+
+    def test_findSolutionMostConstrained(self):
+        #Standard Test Case: Most constrained square branching fills the grid, including a seed that is slow to solve in row-major order
+        for seed in ["A1A2C3E1A4E4F1", "E2A2E3F2F6F4F1"]:
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls(seed))
+            pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+            unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+            self.assertTrue(ggs.findSolution(grid, pieceCoordinates, unusedPiecesID, ggs.BITBOARD_ENGINE, ggs.MOST_CONSTRAINED_SQUARE_BRANCHING))
+            self.assertEqual(ggs.getEmptySquareCoordinates(grid), (-1, -1))
+            self.assertEqual(unusedPiecesID, [])
+            for pieceID in ggs.ALL_PIECE_IDS:
+                self.assertEqual(len(pieceCoordinates[pieceID]), len(ggs.PIECE_SHAPES[pieceID]))
+
+        #Erroneous Test Case: Grid left untouched when there is no solution, two squares are cut off but there is one small square
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), [(1, 0), (0, 1), (4, 5), (5, 4), (2, 2), (3, 3), (2, 3)])
+        expectedGrid = ggs.deepcopy(grid)
+        unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+        self.assertFalse(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), unusedPiecesID, ggs.BITBOARD_ENGINE, ggs.MOST_CONSTRAINED_SQUARE_BRANCHING))
+        self.assertEqual(grid, expectedGrid)
+        self.assertEqual(unusedPiecesID, ggs.ALL_PIECE_IDS)
+
+    def test_getEmptyRegions(self):
+        #Standard Test Case: Empty grid is a single region
+        self.assertEqual(ggs.getEmptyRegions(0), [ggs.FULL_GRID_MASK])
+
+        #Standard Test Case: Regions do not wrap around the edges of the grid
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), [(1, 0), (0, 1), (4, 5), (5, 4), (2, 2), (3, 3), (2, 3)])
+        regions = ggs.getEmptyRegions(ggs.getGridMask(grid))
+        self.assertEqual([region.bit_count() for region in regions], [1, 27, 1])
+        self.assertEqual(regions[0], 1)
+        self.assertEqual(regions[2], 1 << 35)
+
+        #Boundary Test Case: Full grid has no regions
+        self.assertEqual(ggs.getEmptyRegions(ggs.FULL_GRID_MASK), [])
+
+    def test_getDeadRegionMask(self):
+        #Standard Test Case: Isolated corners are only alive while the small square is unused, the large region needs more pieces
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), [(1, 0), (0, 1), (4, 5), (5, 4), (2, 2), (3, 3), (2, 3)])
+        board = ggs.getGridMask(grid)
+        corners = 1 | 1 << 35
+        self.assertEqual(ggs.getDeadRegionMask(board, ggs.ALL_PIECES_MASK), 0)
+        self.assertEqual(ggs.getDeadRegionMask(board, 1 << ggs.SMALL_SQUARE_PIECE_ID), ~board & ggs.FULL_GRID_MASK & ~corners)
+        self.assertEqual(ggs.getDeadRegionMask(board, ggs.ALL_PIECES_MASK ^ (1 << ggs.SMALL_SQUARE_PIECE_ID)), ~board & ggs.FULL_GRID_MASK)
+
+        #Standard Test Case: Agrees with isRegionPruned() on every single T piece placement
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        board = ggs.getGridMask(grid)
+        unusedPiecesMask = ggs.ALL_PIECES_MASK ^ (1 << ggs.T_PIECE_ID)
+        for squareIndex in range(0, 36):
+            for config, mask in ggs.CANONICAL_BITBOARD_PLACEMENTS[ggs.T_PIECE_ID][squareIndex]:
+                if board & mask == 0:
+                    deadRegionMask = ggs.getDeadRegionMask(board | mask, unusedPiecesMask)
+                    self.assertEqual(deadRegionMask != 0, ggs.isRegionPruned(board | mask, unusedPiecesMask))
+                    self.assertEqual(deadRegionMask & (board | mask), 0)
+
+        #Standard Test Case: Hovering a placed piece elsewhere moves it, its old squares are not counted twice
+        placed = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES).withPiece(ggs.SMALL_SQUARE_PIECE_ID, 0, 5, 5)
+        self.assertEqual(ggs.getDeadRegionMask(placed.board, placed.unusedPiecesMask), 0)
+        moved = placed.withMove(ggs.SMALL_SQUARE_PIECE_ID, 0, 4, 5)
+        self.assertEqual(moved, ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES).withPiece(ggs.SMALL_SQUARE_PIECE_ID, 0, 4, 5))
+        self.assertEqual(ggs.getDeadRegionMask(moved.board, moved.unusedPiecesMask), 0)
+        self.assertEqual(ggs.getDeadRegionMask(placed.board | 1 << 34, placed.unusedPiecesMask).bit_count(), 27) #Counted twice
+
+        #Boundary Test Case: Full grid has no regions, nothing can fill a region once every piece is placed
+        self.assertEqual(ggs.getDeadRegionMask(ggs.FULL_GRID_MASK, 0), 0)
+        self.assertEqual(ggs.getDeadRegionMask(ggs.FULL_GRID_MASK ^ 1, 0), 1)
+
+    def test_findSolutionPruneRegions(self):
+        #Standard Test Case: Pruning finds the same solution while expanding fewer nodes
+        for branching in [ggs.FIRST_EMPTY_SQUARE_BRANCHING, ggs.MOST_CONSTRAINED_SQUARE_BRANCHING]:
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2E3F2A4F4F1"))
+            expectedGrid = ggs.deepcopy(grid)
+            statistics = ggs.SolverStatistics()
+            self.assertTrue(ggs.findSolution(expectedGrid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE, branching, statistics=statistics))
+            prunedStatistics = ggs.SolverStatistics()
+            self.assertTrue(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE, branching, True, prunedStatistics))
+            self.assertEqual(grid, expectedGrid)
+            self.assertLessEqual(prunedStatistics.nodes, statistics.nodes)
+            self.assertEqual(prunedStatistics.regionChecks, prunedStatistics.nodes - 1)
+            self.assertEqual(statistics.regionChecks, 0)
+
+        #Erroneous Test Case: Two isolated squares are pruned as soon as the small square fills one of them
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), [(1, 0), (0, 1), (4, 5), (5, 4), (2, 2), (3, 3), (2, 3)])
+        statistics = ggs.SolverStatistics()
+        self.assertFalse(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE, pruneRegions=True, statistics=statistics))
+        self.assertEqual((statistics.nodes, statistics.regionChecks, statistics.smallRegionPrunes, statistics.regionSizePrunes), (2, 2, 0, 1))
+
+    def test_SolverStatistics(self):
+        #Standard Test Case: Grid and bitboard engines expand the same nodes
+        allStatistics = []
+        for engine in [ggs.GRID_ENGINE, ggs.BITBOARD_ENGINE]:
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+            statistics = ggs.SolverStatistics()
+            self.assertTrue(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), engine, statistics=statistics))
+            self.assertEqual(statistics.nodes, 53)
+            self.assertEqual(statistics.placements, statistics.nodes - 1)
+            self.assertEqual(statistics.backtracks, statistics.placements - len(ggs.ALL_PIECE_IDS))
+            self.assertEqual(statistics.maxDepth, len(ggs.ALL_PIECE_IDS))
+            self.assertEqual(sum(statistics.depthNodes), statistics.nodes)
+            self.assertEqual(statistics.depthNodes[0], 1)
+            self.assertEqual(sum(statistics.pieceAttempts), statistics.moveChecks)
+            self.assertGreater(sum(statistics.depthTimes), 0)
+            self.assertIsNone(statistics.currentDepth)
+            allStatistics.append(statistics.toDict())
+        for key in ["nodes", "placements", "backtracks", "maxDepth", "depthNodes"]:
+            self.assertEqual(allStatistics[0][key], allStatistics[1][key])
+        self.assertGreater(allStatistics[0]["moveChecks"], allStatistics[1]["moveChecks"]) #Bitboard placements are always within the grid
+
+        #Standard Test Case: Most constrained branching only tries legal placements
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        statistics = ggs.SolverStatistics()
+        self.assertTrue(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE, ggs.MOST_CONSTRAINED_SQUARE_BRANCHING, statistics=statistics))
+        self.assertEqual(statistics.moveChecks, statistics.placements)
+        self.assertEqual(statistics.placements, statistics.nodes - 1)
+
+    def test_findSolutionDeadline(self):
+        for engine in [ggs.GRID_ENGINE, ggs.BITBOARD_ENGINE]:
+            #Standard Test Case: Solved within the deadline
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+            self.assertTrue(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), engine, deadline=time.monotonic() + 60))
+
+            #Boundary Test Case: Deadline already passed, or cancelled before starting
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+            self.assertIsNone(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), engine, deadline=time.monotonic()))
+            cancelEvent = threading.Event()
+            cancelEvent.set()
+            self.assertIsNone(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), engine, cancelEvent=cancelEvent))
+
+            #Erroneous Test Case: Interrupted mid search on an unsolvable grid, nothing is left half placed
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), [(x, y) for y in range(0, 2) for x in range(0, 6)])
+            expectedGrid = ggs.deepcopy(grid)
+            pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+            unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+            statistics = ggs.SolverStatistics()
+            self.assertIsNone(ggs.findSolution(grid, pieceCoordinates, unusedPiecesID, engine, statistics=statistics, deadline=time.monotonic() + 0.05))
+            self.assertEqual(grid, expectedGrid)
+            self.assertEqual(pieceCoordinates, ggs.DEFAULT_PIECE_COORDINATES)
+            self.assertEqual(unusedPiecesID, ggs.ALL_PIECE_IDS)
+            self.assertTrue(statistics.interrupted)
+            self.assertGreater(statistics.nodes, ggs.SEARCH_BUDGET_CHECK_INTERVAL)
+
+        #Standard Test Case: Cancelled from another thread
+        cancelEvent = threading.Event()
+        timer = threading.Timer(0.05, cancelEvent.set)
+        timer.start()
+        self.assertIsNone(ggs.findSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE, ggs.MOST_CONSTRAINED_SQUARE_BRANCHING, cancelEvent=cancelEvent))
+        timer.join()
+
+    def test_iterSolutions(self):
+        #Standard Test Case: Yields the same solutions as dancing links, first one matching findSolution
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("E2A2D3A5C6E4F1"))
+        expectedGrid = ggs.deepcopy(grid)
+        solutions = list(ggs.iterSolutions(grid))
+        self.assertEqual(grid, expectedGrid)
+        solutionsFound, allSolutions = ggs.solveDancingLinks(grid, ggs.ALL_PIECE_IDS, ggs.DANCING_LINKS_ALL_SOLUTIONS)
+        self.assertEqual(len(solutions), solutionsFound)
+        self.assertEqual(set(solutions), set(tuple(solution) for solution in allSolutions))
+
+        solutionGrid = ggs.deepcopy(grid)
+        self.assertTrue(ggs.findSolution(solutionGrid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE))
+        firstSolutionGrid = ggs.deepcopy(grid)
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        for pieceID, config, x, y in solutions[0]:
+            firstSolutionGrid, pieceCoordinates = ggs.placePieceOnGrid(firstSolutionGrid, pieceCoordinates, pieceID, x, y, config)
+        self.assertEqual(firstSolutionGrid, solutionGrid)
+
+        #Standard Test Case: Remaining pieces of a partially solved grid
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        for pieceID, config, x, y in solutions[0][:-2]:
+            grid, pieceCoordinates = ggs.placePieceOnGrid(grid, pieceCoordinates, pieceID, x, y, config)
+        self.assertIn(solutions[0][-2:], list(ggs.iterSolutions(grid, [ggs.Z_PIECE_ID, ggs.ARROW_PIECE_ID])))
+
+        #Erroneous Test Case: Nothing is yielded when the pieces cannot fill the grid
+        self.assertEqual(list(ggs.iterSolutions(helperGetEmptyGrid())), [])
+        self.assertEqual(list(ggs.iterSolutions(helperGetSingleBlockerGrid(), [ggs.SMALL_SQUARE_PIECE_ID])), [])
+
+    def test_IterativeSolver(self):
+        #Standard Test Case: First solution and node count match the bitboard engine
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("E2A2D3A5C6E4F1"))
+        solutionGrid = ggs.deepcopy(grid)
+        statistics = ggs.SolverStatistics()
+        self.assertTrue(ggs.findSolution(solutionGrid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE, statistics=statistics))
+        solver = ggs.IterativeSolver(grid)
+        while solver.step(10) == ggs.ITERATIVE_SOLVER_SEARCHING:
+            self.assertEqual(solver.getSolution(), ())
+        self.assertEqual(solver.status, ggs.ITERATIVE_SOLVER_SOLUTION)
+        self.assertEqual(solver.nodes, statistics.nodes)
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+        self.assertTrue(solver.placeSolution(grid, pieceCoordinates, unusedPiecesID))
+        self.assertEqual(grid, solutionGrid)
+        self.assertEqual(unusedPiecesID, [])
+
+        #Standard Test Case: Enumerates the same solutions as iterSolutions, resuming from JSON checkpoints
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("E2A2D3A5C6E4F1"))
+        solver = ggs.IterativeSolver(grid)
+        solutions = []
+        while solver.step(997) != ggs.ITERATIVE_SOLVER_EXHAUSTED:
+            if solver.status == ggs.ITERATIVE_SOLVER_SOLUTION:
+                solutions.append(solver.getSolution())
+            solver = ggs.IterativeSolver.fromState(ggs.json.loads(ggs.json.dumps(solver.getState())))
+        self.assertEqual(solutions, list(ggs.iterSolutions(grid)))
+        self.assertEqual(solver.solutionsFound, len(solutions))
+        self.assertEqual(solver.step(10), ggs.ITERATIVE_SOLVER_EXHAUSTED)
+
+        #Boundary Test Case: Zero node budget makes no progress
+        solver = ggs.IterativeSolver(grid)
+        self.assertEqual(solver.step(0), ggs.ITERATIVE_SOLVER_SEARCHING)
+        self.assertEqual(solver.nodes, 0)
+
+        #Erroneous Test Case: Unsolvable grid is exhausted without a solution
+        grid = [[X if (x + y) % 2 == 0 else O for x in range(0, 6)] for y in range(0, 6)]
+        solver = ggs.IterativeSolver(grid, [ggs.BIG_SQUARE_PIECE_ID])
+        self.assertEqual(solver.step(100), ggs.ITERATIVE_SOLVER_EXHAUSTED)
+        self.assertFalse(solver.placeSolution(grid, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), [ggs.BIG_SQUARE_PIECE_ID]))
+
+        #Erroneous Test Case: State with an invalid placement
+        state = ggs.IterativeSolver(helperGetEmptyGrid()).getState()
+        state["placements"] = [[ggs.SMALL_SQUARE_PIECE_ID, 99, 0]]
+        state["cursors"] = [1, 0]
+        state["isExpanded"] = [True, False]
+        self.assertRaises(ValueError, ggs.IterativeSolver.fromState, state)
+
+    def test_LRUCache(self):
+        #Standard Test Case: Least recently used item is evicted, hits and misses are counted
+        cache = ggs.LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("b"), None)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+        #Boundary Test Case: Stored values equal to the default are still hits
+        cache.put("d", 0)
+        self.assertEqual(cache.get("d", 0), 0)
+        self.assertEqual(cache.get("e", 0), 0)
+        self.assertEqual((cache.hits, cache.misses), (4, 2))
+
+    def test_countSolutions(self):
+        #Standard Test Case: Agrees with dancing links and reuses states
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("E2A2D3A5C6E4F1"))
+        expectedGrid = ggs.deepcopy(grid)
+        cache = ggs.LRUCache(ggs.DEFAULT_SOLUTION_COUNT_CACHE_SIZE)
+        self.assertEqual(ggs.countSolutions(grid, cache=cache), 221)
+        self.assertEqual(grid, expectedGrid)
+        self.assertGreater(cache.hits, 0)
+        self.assertEqual(cache.misses, len(cache))
+
+        #Boundary Test Case: A cache holding a single state gives the same count
+        self.assertEqual(ggs.countSolutions(grid, ggs.ALL_PIECE_IDS, ggs.LRUCache(1)), 221)
+
+        #Erroneous Test Case: No solutions when the pieces cannot fill the grid
+        self.assertEqual(ggs.countSolutions(helperGetEmptyGrid()), 0)
+        self.assertEqual(ggs.countSolutions(helperGetSingleBlockerGrid(), [ggs.SMALL_SQUARE_PIECE_ID]), 0)
+
+    def test_isCompletable(self):
+        #Standard Test Case: Agrees with findSolution on every single piece placement, answering repeats from the cache
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        snapshot = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES)
+        cache = ggs.LRUCache(ggs.DEFAULT_COMPLETABLE_CACHE_SIZE)
+        self.assertTrue(ggs.isCompletable(snapshot.board, snapshot.unusedPiecesMask, cache))
+        for squareIndex in range(0, 36, 5):
+            for config, mask in ggs.CANONICAL_BITBOARD_PLACEMENTS[ggs.T_PIECE_ID][squareIndex]:
+                if snapshot.board & mask == 0:
+                    placed = snapshot.withPiece(ggs.T_PIECE_ID, config, squareIndex % 6, squareIndex // 6)
+                    self.assertEqual(ggs.isCompletable(placed.board, placed.unusedPiecesMask, cache), bool(ggs.findSolutionSnapshot(placed)))
+        misses = cache.misses
+        self.assertTrue(ggs.isCompletable(snapshot.board, snapshot.unusedPiecesMask, cache))
+        self.assertEqual(cache.misses, misses)
+        self.assertGreater(cache.getHitRate(), 0)
+        self.assertGreater(cache.getMemoryUsage(), len(cache))
+
+        #Boundary Test Case: Nothing left to place, and a cache holding a single state
+        self.assertTrue(ggs.isCompletable(ggs.FULL_GRID_MASK, 0))
+        self.assertTrue(ggs.isCompletable(snapshot.board, snapshot.unusedPiecesMask, ggs.LRUCache(1)))
+        self.assertEqual(ggs.LRUCache(1).getHitRate(), 0.0)
+
+        #Erroneous Test Case: Pieces cannot fill the grid, or the deadline already passed
+        self.assertFalse(ggs.isCompletable(ggs.getGridMask([[X if (x + y) % 2 == 0 else O for x in range(0, 6)] for y in range(0, 6)]), 1 << ggs.BIG_SQUARE_PIECE_ID))
+        self.assertIsNone(ggs.isCompletable(0, ggs.ALL_PIECES_MASK, deadline=0))
+
+    def test_getMinimumRemovalSet(self):
+        #Standard Test Case: A solved board needs nothing removed, a dead T piece placement is the only removal
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        snapshot = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES)
+        cache = ggs.LRUCache(ggs.DEFAULT_COMPLETABLE_CACHE_SIZE)
+        self.assertEqual(ggs.getMinimumRemovalSet(ggs.findSolutionSnapshot(snapshot), cache), ())
+        for squareIndex in range(0, 36):
+            for config, mask in ggs.CANONICAL_BITBOARD_PLACEMENTS[ggs.T_PIECE_ID][squareIndex]:
+                if snapshot.board & mask == 0:
+                    placed = snapshot.withPiece(ggs.T_PIECE_ID, config, squareIndex % 6, squareIndex // 6)
+                    if not ggs.isCompletable(placed.board, placed.unusedPiecesMask, cache):
+                        self.assertEqual(ggs.getMinimumRemovalSet(placed, cache), (ggs.T_PIECE_ID,))
+
+        #Boundary Test Case: Every piece greedily placed at the first free square, removing the set makes it completable
+        wrongSnapshot = snapshot
+        for pieceID in ggs.ALL_PIECE_IDS:
+            for squareIndex in range(0, 36):
+                placements = [config for config, mask in ggs.CANONICAL_BITBOARD_PLACEMENTS[pieceID][squareIndex] if wrongSnapshot.board & mask == 0]
+                if placements:
+                    wrongSnapshot = wrongSnapshot.withPiece(pieceID, placements[0], squareIndex % 6, squareIndex // 6)
+                    break
+        removedPiecesID = ggs.getMinimumRemovalSet(wrongSnapshot, cache)
+        self.assertGreater(len(removedPiecesID), 0)
+        fixedSnapshot = wrongSnapshot
+        for pieceID in removedPiecesID:
+            fixedSnapshot = fixedSnapshot.withoutPiece(pieceID)
+        self.assertTrue(ggs.isCompletable(fixedSnapshot.board, fixedSnapshot.unusedPiecesMask, cache))
+        for pieceID in removedPiecesID: #Minimal, putting back any one piece is not completable
+            restored = fixedSnapshot.withPiece(pieceID, *wrongSnapshot.placements[pieceID])
+            self.assertFalse(ggs.isCompletable(restored.board, restored.unusedPiecesMask, cache))
+
+        #Erroneous Test Case: The deadline already passed, or the blockers alone cannot be completed
+        self.assertIsNone(ggs.getMinimumRemovalSet(wrongSnapshot, deadline=0))
+        checkerboard = [[X if (x + y) % 2 == 0 else O for x in range(0, 6)] for y in range(0, 6)]
+        self.assertFalse(ggs.getMinimumRemovalSet(ggs.BoardSnapshot.fromGrid(checkerboard, ggs.DEFAULT_PIECE_COORDINATES)))
+
+    def test_SolutionIndex(self):
+        #Standard Test Case: Indexes every solution, following next moves always ends in an indexed solution
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        index = ggs.SolutionIndex.fromGrid(grid)
+        self.assertTrue(index.isComplete)
+        self.assertEqual(len(index), ggs.countSolutions(grid))
+        snapshot = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES)
+        self.assertEqual(index.getMatchingSolutions(snapshot), (1 << len(index)) - 1)
+        for numberOfMoves in range(0, 9):
+            move = index.getNextMove(snapshot)
+            self.assertEqual(snapshot.placements[move[0]], None)
+            snapshot = snapshot.withPiece(*move)
+            self.assertTrue(ggs.isCompletable(snapshot.board, snapshot.unusedPiecesMask))
+        self.assertEqual(index.getNextMove(snapshot), ())
+        self.assertIn(tuple(sorted((pieceID, *snapshot.placements[pieceID]) for pieceID in ggs.ALL_PIECE_IDS)), index.solutions)
+
+        #Standard Test Case: The next move is the placement used by the most solutions, counted over every solution
+        empty = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES)
+        for placed in [empty, empty.withPiece(*index.solutions[-1][ggs.L_PIECE_ID])]:
+            matching = [solution for solution in index.solutions if all(placed.placements[pieceID] is None or ggs.getPlacementMask(*solution[pieceID]) == ggs.getPlacementMask(pieceID, *placed.placements[pieceID]) for pieceID in ggs.ALL_PIECE_IDS)]
+            counts = {}
+            for solution in matching:
+                for move in solution:
+                    if placed.placements[move[0]] is None:
+                        key = (move[0], ggs.getPlacementMask(*move))
+                        counts[key] = counts.get(key, 0) + 1
+            move = index.getNextMove(placed)
+            self.assertEqual(counts[(move[0], ggs.getPlacementMask(*move))], max(counts.values()))
+
+        #Standard Test Case: Built a bounded number of nodes at a time by an IterativeSolver
+        steppedIndex = ggs.SolutionIndex(ggs.getGridMask(grid))
+        solver = ggs.IterativeSolver(grid)
+        while steppedIndex.addSolutions(solver, 100) == ggs.ITERATIVE_SOLVER_SEARCHING:
+            self.assertFalse(steppedIndex.isComplete)
+        self.assertTrue(steppedIndex.isComplete)
+        self.assertEqual(steppedIndex.solutions, index.solutions)
+
+        #Boundary Test Case: Symmetric configurations covering the same squares match
+        solution = index.solutions[0]
+        pieceID, config, x, y = next(move for move in solution if move[0] == ggs.SMALL_SQUARE_PIECE_ID)
+        empty = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES)
+        for otherConfig in range(0, len(ggs.PIECE_CONFIGURATION_OFFSETS[pieceID])):
+            self.assertEqual(index.getMatchingSolutions(empty.withPiece(pieceID, otherConfig, x, y)), index.getMatchingSolutions(empty.withPiece(pieceID, config, x, y)))
+
+        #Erroneous Test Case: Placements no solution uses, a different grid, a grid without solutions
+        for squareIndex in range(0, 36):
+            for config, mask in ggs.CANONICAL_BITBOARD_PLACEMENTS[ggs.T_PIECE_ID][squareIndex]:
+                if empty.board & mask == 0:
+                    placed = empty.withPiece(ggs.T_PIECE_ID, config, squareIndex % 6, squareIndex // 6)
+                    self.assertEqual(index.getNextMove(placed) is None, not ggs.isCompletable(placed.board, placed.unusedPiecesMask))
+        self.assertIsNone(index.getNextMove(ggs.BoardSnapshot.fromGrid(helperGetSingleBlockerGrid(), ggs.DEFAULT_PIECE_COORDINATES)))
+        checkerboard = [[X if (x + y) % 2 == 0 else O for x in range(0, 6)] for y in range(0, 6)]
+        self.assertEqual(len(ggs.SolutionIndex.fromGrid(checkerboard)), 0)
+        self.assertIsNone(ggs.SolutionIndex.fromGrid(checkerboard).getNextMove(ggs.BoardSnapshot.fromGrid(checkerboard, ggs.DEFAULT_PIECE_COORDINATES)))
+
+    def test_getSeedNumber(self):
+        #Standard Test Case: First and last seeds, round trip
+        self.assertEqual(ggs.NUMBER_OF_SEEDS, 62208)
+        self.assertEqual(ggs.getSeedNumber("A1A2C3E1A4E4F1"), 0)
+        self.assertEqual(ggs.getSeedNumber("F3B3D4A5F6E6A6"), ggs.NUMBER_OF_SEEDS - 1)
+        self.assertEqual(ggs.getSeedFromNumber(0), "A1A2C3E1A4E4F1")
+        self.assertEqual(ggs.getSeedFromNumber(ggs.NUMBER_OF_SEEDS - 1), "F3B3D4A5F6E6A6")
+        for seedNumber in range(0, ggs.NUMBER_OF_SEEDS, 997):
+            self.assertEqual(ggs.getSeedNumber(ggs.getSeedFromNumber(seedNumber)), seedNumber)
+
+        #Erroneous Test Case: Invalid seeds and out of range seed numbers
+        self.assertIsNone(ggs.getSeedNumber("A1C3C3E1A4E4F1")) #Die face from another die
+        self.assertIsNone(ggs.getSeedNumber("A1A2C3E1A4E4"))
+        self.assertIsNone(ggs.getSeedNumber(None))
+        self.assertIsNone(ggs.getSeedFromNumber(-1))
+        self.assertIsNone(ggs.getSeedFromNumber(ggs.NUMBER_OF_SEEDS))
+
+    def test_getBlockersFromSeedNumber(self):
+        #Standard Test Case: Same blockers as getDiceRolls(), round trip through blockers and mask
+        for seedNumber in range(0, ggs.NUMBER_OF_SEEDS, 997):
+            blockers = ggs.getBlockersFromSeedNumber(seedNumber)
+            self.assertEqual(blockers, ggs.getDiceRolls(ggs.getSeedFromNumber(seedNumber)))
+            self.assertEqual(ggs.getSeedNumberFromBlockers(blockers), seedNumber)
+            self.assertEqual(ggs.getBlockerMaskFromSeedNumber(seedNumber), ggs.getGridMask(ggs.initaliseBlockers(helperGetEmptyGrid(), blockers)))
+
+        #Erroneous Test Case: Blockers that are not a roll, out of range seed numbers
+        self.assertIsNone(ggs.getSeedNumberFromBlockers([(0, 0)] * 7))
+        self.assertIsNone(ggs.getSeedNumberFromBlockers([]))
+        self.assertIsNone(ggs.getBlockersFromSeedNumber(ggs.NUMBER_OF_SEEDS))
+        self.assertIsNone(ggs.getBlockerMaskFromSeedNumber(-1))
+
+    def test_getSeedNumbers(self):
+        #Standard Test Case: Bulk conversions agree with single conversions
+        seeds = [ggs.getSeedFromNumber(seedNumber) for seedNumber in range(0, ggs.NUMBER_OF_SEEDS, 101)]
+        seedNumbers = ggs.getSeedNumbers(seeds)
+        self.assertEqual(list(seedNumbers), list(range(0, ggs.NUMBER_OF_SEEDS, 101)))
+        self.assertEqual(ggs.getSeedsFromNumbers(seedNumbers), seeds)
+        self.assertEqual(list(ggs.getBlockerMasksFromSeedNumbers(seedNumbers)), [ggs.getBlockerMaskFromSeedNumber(seedNumber) for seedNumber in seedNumbers])
+
+        #Boundary Test Case: No seeds
+        self.assertEqual(list(ggs.getSeedNumbers([])), [])
+        self.assertEqual(ggs.getSeedsFromNumbers(ggs.getSeedNumbers([])), [])
+
+        #Erroneous Test Case: Invalid seeds are -1, out of range seed numbers raise
+        self.assertEqual(list(ggs.getSeedNumbers(["A1C3C3E1A4E4F1", "A1A2", "A1A2C3E1A4E4F1"])), [-1, -1, 0])
+        with self.assertRaises(IndexError):
+            ggs.getSeedsFromNumbers([0, -1])
+        with self.assertRaises(IndexError):
+            ggs.getBlockerMasksFromSeedNumbers([ggs.NUMBER_OF_SEEDS])
+
+    def test_getPiecePlacement(self):
+        #Standard Test Case: Every config of every piece round trips through placePieceOnGrid()
+        for pieceID in ggs.ALL_PIECE_IDS:
+            for config in ggs.PIECE_CONFIGURATIONS[pieceID]:
+                x, y = next((x, y) for y in range(0, 6) for x in range(0, 6) if ggs.isMoveValid(helperGetEmptyGrid(), pieceID, x, y, config))
+                grid, pieceCoordinates = ggs.placePieceOnGrid(helperGetEmptyGrid(), ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), pieceID, x, y, config)
+                self.assertEqual(ggs.getPiecePlacement(pieceID, pieceCoordinates[pieceID]), (config, x, y))
+
+        #Erroneous Test Case: Unplaced piece, coordinates of another piece
+        self.assertIsNone(ggs.getPiecePlacement(ggs.L_PIECE_ID, None))
+        self.assertIsNone(ggs.getPiecePlacement(ggs.L_PIECE_ID, [(0, 0), (1, 0), (2, 0), (3, 0)]))
+
+    def test_solveSeeds(self):
+        seeds = ["A1A2C3E1A4E4F1", "A1C3C3E1A4E4F1", "E2A2D3A5C6E4F1"]
+
+        #Standard Test Case: Results in input order, placements solve the grid
+        results = list(ggs.solveSeeds(seeds))
+        self.assertEqual([result["seed"] for result in results], seeds)
+        self.assertEqual([result["solved"] for result in results], [True, False, True])
+        self.assertIn("error", results[1])
+        for result in [results[0], results[2]]:
+            grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls(result["seed"]))
+            pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+            for pieceID, config, x, y in result["placements"]:
+                self.assertTrue(ggs.isMoveValid(grid, pieceID, x, y, config))
+                grid, pieceCoordinates = ggs.placePieceOnGrid(grid, pieceCoordinates, pieceID, x, y, config)
+            self.assertEqual(ggs.getEmptySquareCoordinates(grid), (-1, -1))
+            self.assertGreater(result["nodes"], 0)
+
+        #Standard Test Case: Worker processes give the same results, in input or completion order
+        def withoutTime(results):
+            return [{key: value for key, value in result.items() if key != "time"} for result in results]
+        self.assertEqual(withoutTime(ggs.solveSeeds(seeds, 2, 1)), withoutTime(results))
+        unorderedResults = withoutTime(ggs.solveSeeds(seeds, 2, 1, False))
+        self.assertEqual(sorted(unorderedResults, key=lambda result: result["seed"]), sorted(withoutTime(results), key=lambda result: result["seed"]))
+
+        #Boundary Test Case: Worker processes read the input a batch at a time, two batches at most ahead of the results
+        seedsRead = []
+        def readSeeds():
+            for seedNumber in range(0, 200):
+                seedsRead.append(seedNumber)
+                yield ggs.getSeedFromNumber(seedNumber)
+        lazyResults = ggs.solveSeeds(readSeeds(), 2, 1)
+        self.assertEqual(next(lazyResults)["seed"], ggs.getSeedFromNumber(0))
+        self.assertLessEqual(len(seedsRead), 2 * 2 * 1 * ggs.BATCH_CHUNKS_PER_PROCESS)
+        self.assertEqual([result["seed"] for result in lazyResults], [ggs.getSeedFromNumber(seedNumber) for seedNumber in range(1, 200)])
+
+    def test_SolutionDatabase(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "solutions.bin")
+            ggs.buildSolutionDatabase(path, 3)
+
+            #Standard Test Case: Records match the solvers
+            with ggs.SolutionDatabase(path) as database:
+                self.assertEqual(len(database), 3)
+                for seedNumber in range(0, 3):
+                    grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls(ggs.getSeedFromNumber(seedNumber)))
+                    solution, solutionsFound, nodes, averageBranching = database.getRecord(seedNumber)
+                    self.assertEqual(solution, next(ggs.iterSolutions(grid)))
+                    self.assertEqual(solutionsFound, ggs.countSolutions(grid))
+                    self.assertGreater(nodes, len(ggs.ALL_PIECE_IDS))
+                    statistics = ggs.SolverStatistics()
+                    ggs.searchBitboard(ggs.getGridMask(grid), ggs.ALL_PIECES_MASK, [], statistics=statistics)
+                    self.assertAlmostEqual(averageBranching, ggs.getAverageBranching(statistics.depthNodes), places=5)
+                self.assertEqual(database.getRecordFromSeed("A1A2C3E1A4E4F1"), database.getRecord(0))
+                self.assertEqual(database.getSolution("A1A2C3E1A4E4F1"), database.getRecord(0)[0])
+
+                #Erroneous Test Case: Seeds without a record
+                self.assertIsNone(database.getRecordFromSeed("A1C3C3E1A4E4F1"))
+                self.assertEqual(database.getSolution("F3B3D4A5F6E6A6"), ())
+                with self.assertRaises(IndexError):
+                    database.getRecord(3)
+
+            #Erroneous Test Case: Files that are not solution databases
+            with open(path, "r+b") as file:
+                file.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(ValueError):
+                ggs.SolutionDatabase(path)
+            self.assertIsNone(ggs.openSolutionDatabase(path))
+            self.assertIsNone(ggs.openSolutionDatabase(os.path.join(directory, "missing.bin")))
+
+    def test_DifficultyIndex(self):
+        with tempfile.TemporaryDirectory() as directory:
+            databasePath = os.path.join(directory, "solutions.bin")
+            path = os.path.join(directory, "difficulty.bin")
+            ggs.buildSolutionDatabase(databasePath, 4)
+            ggs.buildDifficultyIndex(path, databasePath, 2)
+
+            #Standard Test Case: Bands split the seeds evenly, easiest first
+            index = ggs.DifficultyIndex(path)
+            self.assertEqual((len(index), index.numberOfBands), (4, 2))
+            easySeedNumbers = list(index.getSeedNumbersInBand(0))
+            hardSeedNumbers = list(index.getSeedNumbersInBand(1))
+            self.assertEqual(sorted(easySeedNumbers + hardSeedNumbers), [0, 1, 2, 3])
+            self.assertLessEqual(max(index.getScore(seedNumber) for seedNumber in easySeedNumbers), min(index.getScore(seedNumber) for seedNumber in hardSeedNumbers))
+            for seedNumber in hardSeedNumbers:
+                self.assertEqual(index.getBand(seedNumber), 1)
+            self.assertIn(ggs.getSeedNumber(index.getRandomSeed(1)), hardSeedNumbers)
+
+            #Standard Test Case: Scores match the solution database
+            with ggs.SolutionDatabase(databasePath) as database:
+                solution, solutionsFound, nodes, averageBranching = database.getRecord(2)
+            score = ggs.getDifficultyScore(solutionsFound, nodes, averageBranching)
+            self.assertAlmostEqual(index.getScore(2), score, places=4)
+            #Boundary Test Case: Harder with more nodes or wider branching, easier with more solutions
+            self.assertGreater(ggs.getDifficultyScore(10, 200, 2.0), ggs.getDifficultyScore(10, 100, 2.0))
+            self.assertGreater(ggs.getDifficultyScore(10, 100, 3.0), ggs.getDifficultyScore(10, 100, 2.0))
+            self.assertLess(ggs.getDifficultyScore(20, 100, 2.0), ggs.getDifficultyScore(10, 100, 2.0))
+            self.assertAlmostEqual(ggs.getAverageBranching([1, 2, 4, 1]), (2 + 2 + 0.25) / 3)
+            self.assertEqual(ggs.getAverageBranching([1, 0, 0]), 0.0)
+            self.assertEqual(ggs.getAverageBranching([0, 0]), 0.0)
+
+            #Erroneous Test Case: No such band, too many bands or not a difficulty index
+            self.assertRaises(IndexError, index.getSeedNumbersInBand, 2)
+            self.assertRaises(IndexError, index.getRandomSeed, -1)
+            self.assertRaises(ValueError, ggs.buildDifficultyIndex, path, databasePath, 5)
+            self.assertRaises(ValueError, ggs.DifficultyIndex, databasePath)
+            self.assertIsNone(ggs.openDifficultyIndex(databasePath))
+            self.assertIsNone(ggs.openDifficultyIndex(os.path.join(directory, "missing.bin")))
+
+    def test_isPartOfSolution(self):
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        solution = next(ggs.iterSolutions(grid))
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+
+        #Boundary Test Case: Nothing placed
+        self.assertTrue(ggs.isPartOfSolution(pieceCoordinates, unusedPiecesID, solution))
+
+        #Standard Test Case: Placed pieces match the solution, symmetric pieces in any configuration
+        pieceID, config, x, y = solution[ggs.BIG_SQUARE_PIECE_ID]
+        grid, pieceCoordinates = ggs.placePieceOnGrid(grid, pieceCoordinates, pieceID, x, y, 0)
+        unusedPiecesID.remove(pieceID)
+        self.assertTrue(ggs.isPartOfSolution(pieceCoordinates, unusedPiecesID, solution))
+
+        #Erroneous Test Case: Placed piece elsewhere, or no known solution
+        grid = ggs.removePieceFromGrid(grid, pieceCoordinates, pieceID)
+        grid, pieceCoordinates = ggs.placePieceOnGrid(grid, pieceCoordinates, pieceID, (x + 2) % 5, y, 0)
+        self.assertFalse(ggs.isPartOfSolution(pieceCoordinates, unusedPiecesID, solution))
+        self.assertFalse(ggs.isPartOfSolution(ggs.DEFAULT_PIECE_COORDINATES, ggs.ALL_PIECE_IDS, ()))
+
+    def test_BoardSnapshot(self):
+        #Standard Test Case: Solved snapshot matches findSolution and round trips through the grid
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("A1A2C3E1A4E4F1"))
+        snapshot = ggs.BoardSnapshot.fromGrid(grid, ggs.DEFAULT_PIECE_COORDINATES)
+        self.assertEqual(snapshot.getGrid(), grid)
+        self.assertEqual(snapshot.unusedPiecesMask, ggs.ALL_PIECES_MASK)
+        solution = ggs.findSolutionSnapshot(snapshot)
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        self.assertTrue(ggs.findSolution(grid, pieceCoordinates, ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE))
+        self.assertEqual(solution.getGrid(), grid)
+        self.assertEqual(solution.getPieceCoordinates(), pieceCoordinates)
+        self.assertEqual(ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates), solution)
+        self.assertEqual(solution.board, ggs.FULL_GRID_MASK)
+        self.assertEqual(solution.getPlacedPiecesID(), ggs.ALL_PIECE_IDS)
+
+        #Standard Test Case: Derived snapshots leave the original unchanged and are hashable
+        removed = solution.withoutPiece(ggs.L_PIECE_ID)
+        self.assertEqual(solution.board, ggs.FULL_GRID_MASK)
+        self.assertEqual(removed.unusedPiecesMask, 1 << ggs.L_PIECE_ID)
+        self.assertIsNone(removed.getPieceCoordinates()[ggs.L_PIECE_ID])
+        self.assertEqual(removed.withPiece(ggs.L_PIECE_ID, *solution.placements[ggs.L_PIECE_ID]), solution)
+        self.assertEqual(len({solution, removed, removed.withPiece(ggs.L_PIECE_ID, *solution.placements[ggs.L_PIECE_ID])}), 2)
+        #Boundary Test Case: Removing an unused piece
+        self.assertIs(removed.withoutPiece(ggs.L_PIECE_ID), removed)
+
+        #Erroneous Test Case: No solution, or the deadline already passed
+        snapshot = ggs.BoardSnapshot.fromGrid([[X if (x + y) % 2 == 0 else O for x in range(0, 6)] for y in range(0, 6)], ggs.DEFAULT_PIECE_COORDINATES)
+        self.assertFalse(ggs.findSolutionSnapshot(snapshot))
+        self.assertIsNone(ggs.findSolutionSnapshot(ggs.BoardSnapshot.fromGrid(helperGetEmptyGrid(), ggs.DEFAULT_PIECE_COORDINATES), deadline=0))
+
+    def test_Board(self):
+        #Standard Test Case: Matches the grid functions and round trips through every form
+        blockers = ggs.getDiceRolls("A1A2C3E1A4E4F1")
+        board = ggs.Board(blockers)
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), blockers)
+        self.assertEqual(board.getGrid(), grid)
+        self.assertEqual(board.getEmptySquareCoordinates(), ggs.getEmptySquareCoordinates(grid))
+        for pieceID in ggs.ALL_PIECE_IDS:
+            for config in ggs.PIECE_CONFIGURATIONS[pieceID]:
+                self.assertEqual(board.isMoveValid(pieceID, 1, 3, config), ggs.isMoveValid(grid, pieceID, 1, 3, config))
+
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        self.assertTrue(board.findSolution())
+        self.assertTrue(ggs.findSolution(grid, pieceCoordinates, ggs.deepcopy(ggs.ALL_PIECE_IDS), ggs.BITBOARD_ENGINE))
+        self.assertEqual(board.getGrid(), grid)
+        self.assertEqual(board.getPieceCoordinates(), pieceCoordinates)
+        self.assertEqual(board.getUnusedPiecesID(), [])
+        self.assertEqual(board.getEmptySquareCoordinates(), (-1, -1))
+        self.assertEqual(ggs.Board.fromGrid(grid, pieceCoordinates).getSnapshot(), board.getSnapshot())
+        self.assertEqual(ggs.Board.fromSnapshot(board.getSnapshot()).getGrid(), grid)
+
+        #Standard Test Case: Removing a piece from a copy leaves the original unchanged
+        copy = board.copy()
+        copy.removePiece(ggs.L_PIECE_ID)
+        self.assertEqual(board.getGrid(), grid)
+        self.assertEqual(copy.getUnusedPiecesID(), [ggs.L_PIECE_ID])
+        config, x, y = ggs.getPiecePlacement(ggs.L_PIECE_ID, pieceCoordinates[ggs.L_PIECE_ID])
+        self.assertTrue(copy.isMoveValid(ggs.L_PIECE_ID, x, y, config))
+        #Boundary Test Case: Removing an unused piece
+        copy.removePiece(ggs.L_PIECE_ID)
+        self.assertEqual(copy.getUnusedPiecesID(), [ggs.L_PIECE_ID])
+
+        #Erroneous Test Case: Piece off the edge, or no solution
+        self.assertFalse(ggs.Board().isMoveValid(ggs.LONG_BAR_PIECE_ID, 4, 0, 0))
+        board = ggs.Board([(x, y) for y in range(0, 6) for x in range(0, 6) if (x + y) % 2 == 0])
+        board.unusedPiecesMask = 1 << ggs.BIG_SQUARE_PIECE_ID
+        self.assertFalse(board.findSolution())
+
+    def test_solveDancingLinks(self):
+        #Standard Test Case: Every mode agrees on the number of solutions
+        grid = ggs.initaliseBlockers(helperGetEmptyGrid(), ggs.getDiceRolls("E2A2D3A5C6E4F1"))
+        solutionsFound, solutions = ggs.solveDancingLinks(grid, ggs.ALL_PIECE_IDS, ggs.DANCING_LINKS_COUNT_SOLUTIONS)
+        self.assertEqual((solutionsFound, solutions), (221, []))
+
+        solutionsFound, allSolutions = ggs.solveDancingLinks(grid, ggs.ALL_PIECE_IDS, ggs.DANCING_LINKS_ALL_SOLUTIONS)
+        self.assertEqual(solutionsFound, 221)
+        self.assertEqual(len(set(tuple(solution) for solution in allSolutions)), 221)
+        for solution in allSolutions:
+            solutionGrid = ggs.deepcopy(grid)
+            pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+            for pieceID, config, x, y in solution:
+                self.assertTrue(ggs.isMoveValid(solutionGrid, pieceID, x, y, config))
+                solutionGrid, pieceCoordinates = ggs.placePieceOnGrid(solutionGrid, pieceCoordinates, pieceID, x, y, config)
+            self.assertEqual(ggs.getEmptySquareCoordinates(solutionGrid), (-1, -1))
+
+        solutionsFound, solutions = ggs.solveDancingLinks(grid, ggs.ALL_PIECE_IDS)
+        self.assertEqual(solutionsFound, 1)
+        self.assertIn(solutions[0], allSolutions)
+
+        #Standard Test Case: Dancing links engine fills the grid
+        pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+        unusedPiecesID = ggs.deepcopy(ggs.ALL_PIECE_IDS)
+        self.assertTrue(ggs.findSolution(grid, pieceCoordinates, unusedPiecesID, ggs.DANCING_LINKS_ENGINE))
+        self.assertEqual(ggs.getEmptySquareCoordinates(grid), (-1, -1))
+        self.assertEqual(unusedPiecesID, [])
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
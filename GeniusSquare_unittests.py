@@ -2,16 +2,68 @@
 Unit testing for the Genius Square GUI
 """
 
+import threading
+import time
 import unittest
+from unittest import mock
 import GeniusSquareSolver as ggs
 import GeniusSquare as gsGUI
 
+SEED = "A1A2C3E1A4E4F1"
+
+def helperGetBoard(x: int = None, y: int = None):
+    """
+    Returns the grid and pieceCoordinates of SEED, with the small square placed at x, y if given.
+    """
+    grid = ggs.initaliseBlockers(ggs.deepcopy(ggs.EMPTY_GRID), ggs.getDiceRolls(SEED))
+    pieceCoordinates = ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES)
+    if x is not None:
+        grid, pieceCoordinates = ggs.placePieceOnGrid(grid, pieceCoordinates, ggs.SMALL_SQUARE_PIECE_ID, x, y, 0)
+    return grid, pieceCoordinates
+
+def helperWaitFor(condition, timeout: float = 5.0) -> bool:
+    """
+    Polls a condition until it holds or the timeout passes, returns whether it held.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+class HelperGetHint:
+    """
+    Stand in for getHint() run by HintWorker, blocking until the gate opens or the request is cancelled.
+    Records the board of every call, and returns (1, board) so each result shows the board it was computed for.
+    """
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.boards = [] #Board of every call, in call order
+        self.lock = threading.Lock()
+
+    def __call__(self, grid, pieceCoordinates, unusedPiecesID, knownSolution = (), cache = None, solutionIndex = None, cancelEvent = None):
+        board = ggs.getGridMask(grid)
+        with self.lock:
+            self.boards.append(board)
+        while not self.gate.wait(0.001):
+            if cancelEvent is not None and cancelEvent.is_set():
+                return (2, None)
+        return (1, board)
+
+    def getCalls(self) -> int:
+        with self.lock:
+            return len(self.boards)
+
 class TestGeniusSquare(unittest.TestCase):
     def test_isSeedValid(self):
         #Standard Test Case
         self.assertEqual(gsGUI.isSeedValid("A1A2C3E1A4E4F1"), True)
         #Standard Test Case
         self.assertEqual(gsGUI.isSeedValid("A1A2"), False)
+        #Erroneous Test Case: Die face from another die
+        self.assertEqual(gsGUI.isSeedValid("A1C3C3E1A4E4F1"), False)
 
     def test_getValidDieFaces(self):
         #Standard Test Case
@@ -40,5 +92,141 @@ class TestGeniusSquare(unittest.TestCase):
     def test_convertSeedIntoString(self):
         self.assertEqual(gsGUI.convertSeedIntoString([(2, 5), (2, 1), (2, 2), (5, 1), (5, 2), (4, 3), (0, 5)]), "F3B3C3B6C6D5F1")
 
+    def test_getHint(self):
+        grid, pieceCoordinates = helperGetBoard()
+        #Standard Test Case: Next move from a solution index, or from a search without one
+        solutionIndex = ggs.SolutionIndex.fromGrid(grid)
+        hint = gsGUI.getHint(grid, pieceCoordinates, ggs.deepcopy(ggs.ALL_PIECE_IDS), solutionIndex=solutionIndex)
+        self.assertEqual(hint, (1, solutionIndex.getNextMove(ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates))))
+        hintType, move = gsGUI.getHint(grid, pieceCoordinates, ggs.deepcopy(ggs.ALL_PIECE_IDS))
+        self.assertEqual(hintType, 1)
+        moved = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates).withPiece(*move)
+        self.assertTrue(ggs.isCompletable(moved.board, moved.unusedPiecesMask))
+
+        #Standard Test Case: Pieces to remove once a placement leaves the board unsolvable
+        snapshot = ggs.BoardSnapshot.fromGrid(grid, pieceCoordinates)
+        deadSnapshot = next(placed for squareIndex in range(0, 36) for config, mask in ggs.CANONICAL_BITBOARD_PLACEMENTS[ggs.T_PIECE_ID][squareIndex]
+                            if snapshot.board & mask == 0
+                            for placed in [snapshot.withPiece(ggs.T_PIECE_ID, config, squareIndex % 6, squareIndex // 6)]
+                            if not ggs.isCompletable(placed.board, placed.unusedPiecesMask))
+        for index in [None, solutionIndex]:
+            self.assertEqual(gsGUI.getHint(deadSnapshot.getGrid(), deadSnapshot.getPieceCoordinates(), ggs.getPiecesID(deadSnapshot.unusedPiecesMask), solutionIndex=index), (0, (ggs.T_PIECE_ID,)))
+
+        #Erroneous Test Case: Cancelled before the search, or blockers no set of pieces can complete
+        cancelEvent = threading.Event()
+        cancelEvent.set()
+        self.assertEqual(gsGUI.getHint(grid, pieceCoordinates, ggs.deepcopy(ggs.ALL_PIECE_IDS), cancelEvent=cancelEvent), (2, None))
+        checkerboard = [[ggs.BLOCKER_ID if (x + y) % 2 == 0 else ggs.EMPTY_ID for x in range(0, 6)] for y in range(0, 6)]
+        self.assertEqual(gsGUI.getHint(checkerboard, ggs.deepcopy(ggs.DEFAULT_PIECE_COORDINATES), ggs.deepcopy(ggs.ALL_PIECE_IDS)), (-1, None))
+
+    def test_HintWorkerSuperseded(self):
+        getHint = HelperGetHint()
+        gridA, pieceCoordinatesA = helperGetBoard(2, 0)
+        gridB, pieceCoordinatesB = helperGetBoard(3, 0)
+        with mock.patch.object(gsGUI, "getHint", getHint):
+            worker = gsGUI.HintWorker()
+            #Standard Test Case: A newer request cancels the running one, only its hint is returned
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 1))
+            self.assertTrue(worker.isPending())
+            self.assertIsNone(worker.poll())
+            worker.request(gridB, pieceCoordinatesB)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 2))
+            getHint.gate.set()
+            self.assertTrue(helperWaitFor(lambda: not worker.isPending()))
+            self.assertEqual(worker.poll(), (1, ggs.getGridMask(gridB)))
+            self.assertIsNone(worker.poll())
+            #Boundary Test Case: The cancelled hint was not cached, the finished one was
+            self.assertEqual(getHint.boards, [ggs.getGridMask(gridA), ggs.getGridMask(gridB)])
+            self.assertEqual(len(worker.hints), 1)
+
+    def test_HintWorkerReturnToBoard(self):
+        getHint = HelperGetHint()
+        gridA, pieceCoordinatesA = helperGetBoard(2, 0)
+        gridB, pieceCoordinatesB = helperGetBoard(3, 0)
+        boardA = ggs.getGridMask(gridA)
+        with mock.patch.object(gsGUI, "getHint", getHint):
+            worker = gsGUI.HintWorker()
+            #Standard Test Case: Back on a board whose speculative run was cancelled, H queues a new run instead of reusing it
+            worker.request(gridA, pieceCoordinatesA, isSpeculative=True)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 1))
+            worker.request(gridB, pieceCoordinatesB, isSpeculative=True)
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertTrue(worker.isPending())
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 2))
+            getHint.gate.set()
+            self.assertTrue(helperWaitFor(lambda: not worker.isPending()))
+            self.assertEqual(worker.poll(), (1, boardA))
+            self.assertEqual(getHint.boards, [boardA, boardA]) #The superseded B request never ran
+
+            #Standard Test Case: Same again with only speculative requests, A still ends up cached
+            getHint.gate.clear()
+            worker.cancel()
+            worker.request(gridA, pieceCoordinatesA, isSpeculative=True)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 3))
+            worker.request(gridB, pieceCoordinatesB, isSpeculative=True)
+            worker.request(gridA, pieceCoordinatesA, isSpeculative=True)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 4))
+            getHint.gate.set()
+            self.assertTrue(helperWaitFor(lambda: len(worker.hints) == 1))
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertFalse(worker.isPending())
+            self.assertEqual(worker.poll(), (1, boardA))
+            self.assertEqual(getHint.getCalls(), 4)
+
+    def test_HintWorkerCancel(self):
+        getHint = HelperGetHint()
+        gridA, pieceCoordinatesA = helperGetBoard(2, 0)
+        with mock.patch.object(gsGUI, "getHint", getHint):
+            worker = gsGUI.HintWorker()
+            #Standard Test Case: Cancelling drops the running request, the same board in a new game is searched again
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 1))
+            worker.cancel()
+            self.assertFalse(worker.isPending())
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertTrue(worker.isPending())
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 2))
+            getHint.gate.set()
+            self.assertTrue(helperWaitFor(lambda: not worker.isPending()))
+            self.assertEqual(worker.poll(), (1, ggs.getGridMask(gridA)))
+
+            #Boundary Test Case: Cancelling clears the cached hints
+            worker.cancel()
+            self.assertEqual(len(worker.hints), 0)
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertTrue(helperWaitFor(lambda: not worker.isPending()))
+            self.assertEqual(getHint.getCalls(), 3)
+            self.assertEqual(worker.poll(), (1, ggs.getGridMask(gridA)))
+            self.assertIsNone(worker.poll())
+
+    def test_HintWorkerSpeculative(self):
+        getHint = HelperGetHint()
+        gridA, pieceCoordinatesA = helperGetBoard(2, 0)
+        gridB, pieceCoordinatesB = helperGetBoard(3, 0)
+        with mock.patch.object(gsGUI, "getHint", getHint):
+            worker = gsGUI.HintWorker()
+            #Standard Test Case: Speculative hints are cached but never returned, H on the same board is answered at once
+            worker.request(gridA, pieceCoordinatesA, isSpeculative=True)
+            self.assertFalse(worker.isPending())
+            getHint.gate.set()
+            self.assertTrue(helperWaitFor(lambda: len(worker.hints) == 1))
+            self.assertIsNone(worker.poll())
+            worker.request(gridA, pieceCoordinatesA)
+            self.assertFalse(worker.isPending())
+            self.assertEqual(worker.poll(), (1, ggs.getGridMask(gridA)))
+            self.assertEqual(getHint.getCalls(), 1)
+
+            #Standard Test Case: H during a speculative run on the same board waits for that run instead of restarting it
+            getHint.gate.clear()
+            worker.request(gridB, pieceCoordinatesB, isSpeculative=True)
+            self.assertTrue(helperWaitFor(lambda: getHint.getCalls() == 2))
+            worker.request(gridB, pieceCoordinatesB)
+            self.assertTrue(worker.isPending())
+            getHint.gate.set()
+            self.assertTrue(helperWaitFor(lambda: not worker.isPending()))
+            self.assertEqual(worker.poll(), (1, ggs.getGridMask(gridB)))
+            self.assertEqual(getHint.getCalls(), 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file